@@ -1,37 +1,209 @@
+import asyncio
 import time
-from typing import List
+from contextlib import AsyncExitStack, aclosing, nullcontext
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 
 from config.sessions import SessionConfig
-from core.trust_math import TrustMath
+from config.escalation import EscalationPolicy, SEQUENTIAL, SPECULATIVE
+from core.trust_math import TrustAccumulator
+from core.timing import StageTimer
+from core.concurrency import gather_or_cancel, cancel_and_wait
+from core.admission import AdmissionController
+from core.lanes import LaneScheduler, lane_for_redundancy
+from core.deadline import Deadline, DeadlineExceeded
+from core import metrics
 from agent.models import AgentResponse, FinalVerdict
 
 from artifact.builder import ArtifactBuilder
-from artifact.signing import ArtifactSigner
+from artifact.schema import sha256_hex
+from artifact.signing import get_signer
 from storage.db import Database
+from storage.cache import DecisionCache
+from storage.writer import DecisionWriter
 
-import os
 import uuid
 
 
+# Receives (event, data) as each stage of evaluate() completes
+ProgressCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
 class Firewall:
 
-    def __init__(self, router_client):
+    def __init__(
+        self,
+        router_client,
+        policy: Optional[EscalationPolicy] = None,
+        cache: Optional[DecisionCache] = None,
+        writer: Optional[DecisionWriter] = None,
+        db: Optional[Database] = None,
+        admission: Optional[AdmissionController] = None,
+        lanes: Optional[LaneScheduler] = None,
+        stream_completion: bool = False,
+    ):
         self.router = router_client
+        self.policy = policy or EscalationPolicy.from_env()
+        self.cache = cache
+        self.writer = writer
+        self.db = db
+        self.admission = admission
+        self.lanes = lanes
+        self.stream_completion = stream_completion
 
-    async def evaluate(self, objective: str) -> AgentResponse:
+    async def evaluate(
+        self,
+        objective: str,
+        on_event: Optional[ProgressCallback] = None,
+        priority: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AgentResponse:
+        """
+        Runs the full pipeline. With `on_event`, progress is reported
+        as delegate, completion, plan, one level per scored rung of the
+        ladder, and verdict. Cancelling evaluate() cancels every
+        upstream call still in flight.
+
+        With an AdmissionController, cache misses must win a slot
+        before calling Cortensor and may raise AdmissionRejected.
+
+        With a LaneScheduler, the validation ladder waits for a slot in
+        the `priority` lane, or in the lane of the delegate's
+        recommended redundancy when no priority is given.
+
+        With a `deadline`, every upstream call gets only the remaining
+        budget, ladder levels whose observed p90 latency no longer fits
+        are skipped, and running out of time yields MANUAL_REVIEW with
+        reason "deadline" (never cached) instead of an error.
+        """
+
+        started = time.perf_counter()
+
+        with metrics.EVALUATIONS_IN_FLIGHT.track_inprogress():
+            response = await self._evaluate(
+                objective, on_event, priority, deadline
+            )
+
+        metrics.record_evaluation(
+            verdict=self._verdict_event(response)["final_verdict"],
+            cache_hit=response.cache_hit,
+            depth=len(response.escalation_path),
+            seconds=time.perf_counter() - started,
+        )
+
+        return response
+
+    async def _evaluate(
+        self,
+        objective: str,
+        on_event: Optional[ProgressCallback],
+        priority: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> AgentResponse:
 
-        escalation_path: List[int] = []
         start_time = time.time()
+        timer = StageTimer()
+
+        async def emit(event: str, data: Dict[str, Any]):
+            if on_event is not None:
+                await on_event(event, data)
 
         # ==================================================
-        # 1️⃣ DELEGATE FIRST (MANDATORY)
+        # 0️⃣ DECISION CACHE
         # ==================================================
 
-        delegate_response = await self.router.delegate(
-            session_id=SessionConfig.DELEGATE,
-            objective="Evaluate risk and plan execution strategy.",
-            input_data=objective,
-        )
+        objective_hash = sha256_hex(objective)
+
+        if self.cache is not None:
+            with timer.stage("cache_lookup"):
+                cached = await self.cache.get(objective_hash)
+
+            if cached is not None:
+                response = self._cached_response(cached, start_time)
+                response.stage_timings = timer.breakdown()
+                await emit("verdict", self._verdict_event(response))
+                return response
+
+        def pipeline(admission=None):
+            return self._run_pipeline(
+                objective,
+                objective_hash,
+                start_time,
+                timer,
+                emit,
+                priority,
+                deadline,
+                admission,
+            )
+
+        if self.admission is None:
+            return await pipeline()
+
+        if self.lanes is not None:
+            # Lanes bound the ladders themselves. Admission then covers
+            # only delegate + completion, so no request sits in a lane
+            # queue holding an admission slot that a request for an
+            # idle lane could use.
+            return await pipeline(
+                self.admission.admit(
+                    timeout=deadline.remaining() if deadline else None
+                )
+            )
+
+        async with self.admission.admit(
+            timeout=deadline.remaining() if deadline else None
+        ) as ticket:
+            response = await pipeline()
+            ticket.observe(self._upstream_latency_s(response.stage_timings))
+
+        return response
+
+    async def _run_pipeline(
+        self,
+        objective: str,
+        objective_hash: str,
+        start_time: float,
+        timer: StageTimer,
+        emit: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        priority: Optional[str],
+        deadline: Optional[Deadline],
+        admission=None,
+    ) -> AgentResponse:
+        """
+        `admission`, if given, is an entered-on-demand admission slot
+        held for delegate + completion only.
+        """
+
+        escalation_path: List[int] = []
+
+        # ==================================================
+        # 1️⃣ DELEGATE + 2️⃣ COMPLETION (CONCURRENT)
+        # ==================================================
+        # The completion prompt is the raw objective, so it does not
+        # depend on the delegate result. Both calls run side by side;
+        # if either fails the other is cancelled.
+
+        delegate_session = self._pick_session("delegate", SessionConfig.DELEGATE_POOL)
+        completion_session = self._pick_session("completion", SessionConfig.COMPLETION_POOL)
+
+        try:
+            async with admission or nullcontext() as ticket:
+                delegate_response, completion_response = await self._within(
+                    deadline,
+                    self._first_stage(
+                        objective,
+                        timer,
+                        emit,
+                        deadline,
+                        delegate_session,
+                        completion_session,
+                    ),
+                )
+                if ticket is not None:
+                    ticket.observe(self._upstream_latency_s(timer.breakdown()))
+        except DeadlineExceeded:
+            response = self._deadline_response(start_time, timer, deadline)
+            await emit("verdict", self._verdict_event(response))
+            return response
 
         if not delegate_response:
             raise RuntimeError("Delegate returned empty response.")
@@ -46,15 +218,6 @@ class Firewall:
             .get("redundancy", 1)
         )
 
-        # ==================================================
-        # 2️⃣ COMPLETION
-        # ==================================================
-
-        completion_response = await self.router.completion(
-            session_id=SessionConfig.COMPLETION,
-            prompt=objective,
-        )
-
         completion_task_id = completion_response.get(
             "task_id", str(uuid.uuid4())
         )
@@ -82,89 +245,188 @@ class Firewall:
             threshold = 0.50
             escalation_plan = [1, 3, 5]
 
+        lane = priority or lane_for_redundancy(recommended_redundancy)
+
+        await emit(
+            "plan",
+            {
+                "recommended_redundancy": recommended_redundancy,
+                "threshold": threshold,
+                "escalation_plan": escalation_plan,
+                "lane": lane,
+            },
+        )
+
         final_confidence = 0.0
         decision_reason = ""
         final_verdict = FinalVerdict.FAIL
 
         validation_task_ids = []
         all_validator_runs = []
+        level_scores = []
+        pooled_evidence = TrustAccumulator()
+        early_stop = None
 
         # ------------------------------------------------------
         # Run Escalation Ladder
         # ------------------------------------------------------
 
-        for level in escalation_plan:
+        speculation = self._new_speculation_stats(recommended_redundancy)
+        accepted = False
 
-            escalation_path.append(level)
+        deadline_info = (
+            {
+                "budget_ms": round(deadline.budget * 1000, 2),
+                "skipped_levels": [],
+                "timed_out_level": None,
+            }
+            if deadline is not None else None
+        )
 
-            session_id = SessionConfig.get_validation_session(level)
+        ladder = self._ladder_responses(
+            escalation_plan,
+            objective,
+            completion_output,
+            recommended_redundancy,
+            speculation,
+            timer,
+            deadline,
+            deadline_info,
+        )
 
-            validation_response = await self.router.validate(
-                session_id=session_id,
-                objective=objective,
-                output=completion_output,
+        # Ladders are the expensive part, so they are what lanes schedule.
+        # A deadline also bounds the wait for a lane slot.
+        lane_slot = (
+            self.lanes.slot(
+                lane, timeout=deadline.remaining() if deadline else None
             )
+            if self.lanes is not None
+            else nullcontext({"lane": lane, "wait_ms": 0.0})
+        )
 
-            validation_task_ids.append(
-                validation_response.get(
-                    "task_id", str(uuid.uuid4())
+        async with AsyncExitStack() as stack:
+            try:
+                scheduling = await stack.enter_async_context(lane_slot)
+            except asyncio.TimeoutError:
+                response = self._deadline_response(
+                    start_time,
+                    timer,
+                    deadline,
+                    stage="lane_wait",
+                    output=completion_output,
                 )
-            )
+                await emit("verdict", self._verdict_event(response))
+                return response
 
-            validator_results = self._extract_validator_results(
-                validation_response
-            )
+            responses = await stack.enter_async_context(aclosing(ladder))
+
+            async for level, validation_response in responses:
+
+                escalation_path.append(level)
+
+                validation_task_ids.append(
+                    validation_response.get(
+                        "task_id", str(uuid.uuid4())
+                    )
+                )
+
+                validator_results = self._extract_validator_results(
+                    validation_response
+                )
+
+                all_validator_runs.extend(
+                    self._structure_validator_runs(level, validator_results)
+                )
+
+                level_evidence = TrustAccumulator()
+                level_evidence.extend(validator_results)
+
+                agreement = level_evidence.agreement
+                avg_conf = level_evidence.average_confidence
+                level_composite = level_evidence.composite
+
+                level_weight = self.policy.level_weight(level)
+                pooled_evidence.extend(validator_results, level_weight)
 
-            structured_runs = []
+                if self.policy.pool_evidence:
+                    composite = pooled_evidence.composite
+                else:
+                    composite = level_composite
 
-            for result in validator_results:
-                structured_runs.append(
+                level_scores.append(
                     {
                         "redundancy_level": level,
-                        "miner_address": result.get("miner", "unknown"),
-                        "valid": result.get(
-                            "binary_classification", {}
-                        ).get("valid", True),
-                        "confidence_score": result.get(
-                            "binary_classification", {}
-                        ).get("confidence_score", 0.0),
-                        "overall_score": result.get(
-                            "overall_assessment", {}
-                        ).get("overall_score", 0),
-                        "risk_level": result.get(
-                            "overall_assessment", {}
-                        ).get("risk_level", "unknown"),
-                        "data_hash": result.get(
-                            "data_hash", "unknown"
-                        ),
+                        "validators": len(validator_results),
+                        "level_weight": level_weight,
+                        "agreement": agreement,
+                        "avg_confidence": avg_conf,
+                        "level_composite": level_composite,
+                        "scored_composite": composite,
+                        "pooled": self.policy.pool_evidence,
                     }
                 )
 
-            all_validator_runs.extend(structured_runs)
+                final_confidence = composite
 
-            agreement = TrustMath.weighted_validator_agreement(
-                validator_results
-            )
+                await emit(
+                    "level",
+                    {
+                        **level_scores[-1],
+                        "threshold": threshold,
+                        "passed": composite >= threshold,
+                    },
+                )
 
-            avg_conf = TrustMath.average_validator_confidence(
-                validator_results
-            )
+                if composite >= threshold:
+                    decision_reason = (
+                        f"Confidence {composite} ≥ threshold {threshold}"
+                    )
+                    final_verdict = FinalVerdict.ACCEPT
+                    accepted = True
+                    break
 
-            composite = TrustMath.composite_confidence(
-                agreement,
-                avg_conf,
-            )
+                # Pooled scores carry over, so stop climbing once even
+                # perfect results from every remaining level cannot reach
+                # the bar. Levels are sized by what upstream has actually
+                # returned, not just by their redundancy.
+                if self.policy.pool_evidence and self.policy.early_stop:
+                    remaining = escalation_plan[
+                        escalation_plan.index(level) + 1:
+                    ]
+                    largest_batch = max(
+                        score["validators"] for score in level_scores
+                    )
+                    pending = [
+                        (
+                            max(pending_level, largest_batch),
+                            self.policy.level_weight(pending_level),
+                        )
+                        for pending_level in remaining
+                    ]
 
-            final_confidence = composite
+                    if remaining and pooled_evidence.decided(
+                        threshold, pending
+                    ) is False:
+                        early_stop = {
+                            "after_level": level,
+                            "skipped_levels": remaining,
+                            "upper_bound": pooled_evidence.bounds(pending)[1],
+                        }
+                        break
 
-            if composite >= threshold:
-                decision_reason = (
-                    f"Confidence {composite} ≥ threshold {threshold}"
-                )
-                final_verdict = FinalVerdict.ACCEPT
-                break
+        deadline_exceeded = not accepted and bool(
+            deadline_info
+            and (
+                deadline_info["skipped_levels"]
+                or deadline_info["timed_out_level"] is not None
+            )
+        )
 
-        else:
+        if deadline_exceeded:
+            final_verdict = FinalVerdict.MANUAL_REVIEW
+            decision_reason = "deadline"
+
+        elif not accepted:
             if recommended_redundancy == 5:
                 final_verdict = FinalVerdict.MANUAL_REVIEW
                 decision_reason = (
@@ -187,57 +449,92 @@ class Firewall:
         # 4️⃣ BUILD ARTIFACT
         # ==================================================
 
-        artifact_dict, artifact_hash = ArtifactBuilder.build(
-            session_id=SessionConfig.DELEGATE,
-            delegate_task_id=delegate_task_id,
-            completion_task_id=completion_task_id,
-            validation_task_ids=validation_task_ids,
-            objective=objective,
-            output=completion_output,
-            composite_confidence=final_confidence,
-            threshold=threshold,
-            escalation_path=escalation_path,
-            verdict=final_verdict.value,
-            validator_runs=all_validator_runs,
-        )
+        # The signed artifact carries every stage up to this point;
+        # build and signing times are added to the stored row below.
 
-        signer = ArtifactSigner(
-            os.getenv("SENTINEL_PRIVATE_KEY")
-        )
+        with timer.stage("artifact_build"):
+            artifact_dict, artifact_hash = ArtifactBuilder.build(
+                session_id=delegate_session,
+                delegate_task_id=delegate_task_id,
+                completion_task_id=completion_task_id,
+                validation_task_ids=validation_task_ids,
+                objective=objective,
+                output=completion_output,
+                composite_confidence=final_confidence,
+                threshold=threshold,
+                escalation_path=escalation_path,
+                verdict=final_verdict.value,
+                validator_runs=all_validator_runs,
+                level_scores=level_scores,
+                stage_timings=timer.breakdown(),
+                output_hash=completion_response.get("output_hash"),
+            )
 
-        signature = signer.sign(artifact_dict)
+        with timer.stage("signing"):
+            signature = get_signer().sign(artifact_dict)
 
         # ==================================================
         # 5️⃣ PERSIST TO DB
         # ==================================================
+        # With a DecisionWriter the record is queued and written in the
+        # background; otherwise it is written inline. Shielded so a
+        # caller that disconnects now still gets the paid-for decision
+        # recorded.
 
-        db = Database()
-        await db.connect()
+        record = {
+            "decision": {
+                "decision_id": artifact_dict["decision_id"],
+                "schema_version": artifact_dict["schema_version"],
+                "session_id": delegate_session,
+                "delegate_task_id": delegate_task_id,
+                "completion_task_id": completion_task_id,
+                "composite_confidence": final_confidence,
+                "threshold_applied": threshold,
+                "final_verdict": final_verdict.value,
+                "escalation_path": escalation_path,
+                "artifact_hash": artifact_hash,
+                "signature": signature,
+                "objective_hash": artifact_dict["objective_hash"],
+                "output_hash": artifact_dict["output_hash"],
+                "output_text": completion_output,
+                "decision_reason": decision_reason,
+                "stage_timings": timer.breakdown(),
+                "artifact_created_at": artifact_dict["created_at_utc"],
+            },
+            "validator_runs": all_validator_runs,
+        }
 
-        await db.insert_decision(
-            decision_id=artifact_dict["decision_id"],
-            schema_version=artifact_dict["schema_version"],
-            session_id=SessionConfig.DELEGATE,
-            delegate_task_id=delegate_task_id,
-            completion_task_id=completion_task_id,
-            composite_confidence=final_confidence,
-            threshold_applied=threshold,
-            final_verdict=final_verdict.value,
-            escalation_path=escalation_path,
-            artifact_hash=artifact_hash,
-            signature=signature,
-        )
-
-        await db.insert_validator_runs(
-            artifact_dict["decision_id"],
-            all_validator_runs,
-        )
+        # With write-behind this measures the enqueue, not the DB write
+        with timer.stage("persistence"):
+            if self.writer is not None:
+                await asyncio.shield(self.writer.submit(record))
+            else:
+                await asyncio.shield(self._persist(record))
 
-        await db.close()
+        # A deadline verdict reflects this caller's budget, not the objective
+        if self.cache is not None and not deadline_exceeded:
+            self.cache.put(
+                objective_hash,
+                {
+                    "output": completion_output,
+                    "final_verdict": final_verdict.value,
+                    "confidence": final_confidence,
+                    "total_attempts": len(escalation_path),
+                    "escalation_path": list(escalation_path),
+                    "decision_reason": decision_reason,
+                    "decision_id": artifact_dict["decision_id"],
+                    "artifact_hash": artifact_hash,
+                    "signature": signature,
+                    "timestamp": artifact_dict["created_at_utc"],
+                    "threshold": threshold,
+                    "validator_runs": all_validator_runs,
+                },
+            )
 
         total_latency = (time.time() - start_time) * 1000
+        stage_timings = timer.breakdown()
 
-        return AgentResponse(
+        response = AgentResponse(
             output=completion_output,
             final_verdict=final_verdict,
             confidence=final_confidence,
@@ -245,12 +542,491 @@ class Firewall:
             escalation_path=escalation_path,
             total_latency_ms=round(total_latency, 2),
             decision_reason=decision_reason,
+            decision_id=artifact_dict["decision_id"],
+            artifact_hash=artifact_hash,
+            signature=signature,
+            timestamp=artifact_dict["created_at_utc"],
+            threshold=threshold,
+            validator_runs=all_validator_runs,
+            stage_timings=stage_timings,
+            deadline_exceeded=deadline_exceeded,
+            evidence_bundle={
+                "stage_timings": stage_timings,
+                "delegate_completion_overlap_ms": timer.overlap_ms(
+                    "delegate", "completion"
+                ),
+                "speculation": speculation,
+                "level_scores": level_scores,
+                "early_stop": early_stop,
+                "scheduling": scheduling,
+                "deadline": deadline_info,
+            },
         )
 
+        await emit("verdict", self._verdict_event(response))
+
+        return response
+
     # ==================================================
     # Helpers
     # ==================================================
 
+    async def _persist(self, record: dict):
+
+        # Shared app pool when injected, otherwise a short-lived one
+        db = self.db or Database()
+        await db.connect()
+
+        try:
+            await db.insert_decision_with_runs(
+                record["decision"],
+                record["validator_runs"],
+            )
+        finally:
+            if db is not self.db:
+                await db.close()
+
+    def _cached_response(self, cached: dict, start_time: float) -> AgentResponse:
+
+        total_latency = (time.time() - start_time) * 1000
+
+        return AgentResponse(
+            output=cached["output"],
+            final_verdict=FinalVerdict(cached["final_verdict"]),
+            confidence=cached["confidence"],
+            total_attempts=cached["total_attempts"],
+            escalation_path=list(cached["escalation_path"]),
+            total_latency_ms=round(total_latency, 2),
+            decision_reason=cached["decision_reason"],
+            decision_id=cached["decision_id"],
+            artifact_hash=cached["artifact_hash"],
+            signature=cached["signature"],
+            timestamp=cached["timestamp"],
+            threshold=cached["threshold"],
+            validator_runs=cached.get("validator_runs"),
+            cache_hit=True,
+        )
+
+    async def _first_stage(
+        self,
+        objective: str,
+        timer: StageTimer,
+        emit: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        deadline: Optional[Deadline],
+        delegate_session: int,
+        completion_session: int,
+    ):
+
+        return await gather_or_cancel(
+            self._timed(
+                timer,
+                "delegate",
+                self.router.delegate(
+                    session_id=delegate_session,
+                    objective="Evaluate risk and plan execution strategy.",
+                    input_data=objective,
+                    **self._budget(deadline),
+                ),
+                on_done=lambda response: emit(
+                    "delegate",
+                    {
+                        "task_id": (response or {}).get("task_id"),
+                        "recommended_redundancy": (response or {})
+                        .get("cortensor_policy", {})
+                        .get("redundancy", 1),
+                    },
+                ),
+            ),
+            self._timed(
+                timer,
+                "completion",
+                self._completion_call(
+                    objective, completion_session, timer, emit, deadline
+                ),
+                on_done=lambda response: emit(
+                    "completion",
+                    {
+                        "task_id": (response or {}).get("task_id"),
+                        "output": self._extract_completion_output(
+                            response or {}
+                        ),
+                    },
+                ),
+            ),
+        )
+
+    def _completion_call(
+        self,
+        objective: str,
+        session_id: int,
+        timer: StageTimer,
+        emit: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        deadline: Optional[Deadline],
+    ):
+        """
+        Plain or streamed completion. Streamed chunks are forwarded as
+        "token" events as they arrive, and the first one is marked on
+        the timer as completion_first_token.
+        """
+
+        stream = getattr(self.router, "completion_stream", None)
+
+        if not self.stream_completion or stream is None:
+            return self.router.completion(
+                session_id=session_id,
+                prompt=objective,
+                **self._budget(deadline),
+            )
+
+        first_token = True
+
+        async def on_token(text: str):
+            nonlocal first_token
+            if first_token:
+                first_token = False
+                timer.mark("completion_first_token")
+            await emit("token", {"text": text})
+
+        return stream(
+            session_id=session_id,
+            prompt=objective,
+            on_token=on_token,
+            **self._budget(deadline),
+        )
+
+    async def _timed(
+        self,
+        timer: StageTimer,
+        stage: str,
+        awaitable,
+        on_done: Optional[Callable[[Any], Awaitable[None]]] = None,
+    ):
+
+        with timer.stage(stage):
+            result = await awaitable
+
+        if on_done is not None:
+            await on_done(result)
+
+        return result
+
+    @staticmethod
+    def _upstream_latency_s(stage_timings: Dict[str, Dict[str, Any]]) -> Optional[float]:
+        """Mean duration of the upstream calls that completed."""
+
+        durations = [
+            timing["duration_ms"]
+            for stage, timing in stage_timings.items()
+            if (stage in ("delegate", "completion") or stage.startswith("validate_"))
+            and not timing.get("failed")
+        ]
+
+        if not durations:
+            return None
+
+        return sum(durations) / len(durations) / 1000.0
+
+    @staticmethod
+    def _verdict_event(response: AgentResponse) -> Dict[str, Any]:
+
+        return {
+            "final_verdict": (
+                response.final_verdict.value
+                if isinstance(response.final_verdict, FinalVerdict)
+                else response.final_verdict
+            ),
+            "confidence": response.confidence,
+            "threshold": response.threshold,
+            "escalation_path": list(response.escalation_path),
+            "decision_reason": response.decision_reason,
+            "decision_id": response.decision_id,
+            "artifact_hash": response.artifact_hash,
+            "signature": response.signature,
+            "cache_hit": response.cache_hit,
+        }
+
+    async def _validate_level(
+        self,
+        level: int,
+        objective: str,
+        output: str,
+        timer: StageTimer,
+        deadline: Optional[Deadline] = None,
+        deadline_info: Optional[dict] = None,
+    ):
+        """
+        Returns the validation response, or None when the deadline
+        rules the level out (skipped up front or timed out).
+        """
+
+        session_id = self._pick_session(
+            "validate", SessionConfig.get_validation_sessions(level)
+        )
+
+        if deadline is not None and not deadline.fits(
+            self._latency_estimate("validate", session_id)
+        ):
+            deadline_info["skipped_levels"].append(level)
+            return None
+
+        try:
+            with timer.stage(f"validate_{level}"):
+                return await self._within(
+                    deadline,
+                    self.router.validate(
+                        session_id=session_id,
+                        objective=objective,
+                        output=output,
+                        **self._budget(deadline),
+                    ),
+                )
+        except DeadlineExceeded:
+            deadline_info["timed_out_level"] = level
+            return None
+
+    # ==================================================
+    # Deadlines
+    # ==================================================
+
+    @staticmethod
+    def _budget(deadline: Optional[Deadline]) -> Dict[str, float]:
+        """Upstream timeout kwargs carrying the remaining budget."""
+
+        if deadline is None:
+            return {}
+
+        return {"timeout": deadline.remaining()}
+
+    @staticmethod
+    async def _within(deadline: Optional[Deadline], awaitable):
+        """
+        Awaits within the deadline. A timeout, or any failure once the
+        deadline has passed, becomes DeadlineExceeded.
+        """
+
+        if deadline is None:
+            return await awaitable
+
+        try:
+            return await asyncio.wait_for(awaitable, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded()
+        except Exception:
+            if deadline.expired:
+                raise DeadlineExceeded()
+            raise
+
+    def _pick_session(self, method: str, pool: Sequence[int]) -> int:
+        """
+        Lets the router balance across a session pool; routers without
+        pick_session() always get the pool's first session.
+        """
+
+        pick = getattr(self.router, "pick_session", None)
+        if pick is None:
+            return pool[0]
+
+        return pick(method, pool)
+
+    def _latency_estimate(self, method: str, session_id: int) -> Optional[float]:
+        """Observed p90 latency of an upstream session, if known."""
+
+        tracker = getattr(self.router, "latency", None)
+        if tracker is None:
+            return None
+
+        return tracker.quantile((method, session_id), 0.9)
+
+    def _deadline_response(
+        self,
+        start_time: float,
+        timer: StageTimer,
+        deadline: Deadline,
+        stage: str = "delegate_completion",
+        output: str = "",
+    ) -> AgentResponse:
+        """
+        Deadline hit before any validation (during `stage`): nothing
+        to sign or store.
+        """
+
+        total_latency = (time.time() - start_time) * 1000
+        stage_timings = timer.breakdown()
+
+        return AgentResponse(
+            output=output,
+            final_verdict=FinalVerdict.MANUAL_REVIEW,
+            confidence=0.0,
+            total_attempts=0,
+            escalation_path=[],
+            total_latency_ms=round(total_latency, 2),
+            decision_reason="deadline",
+            stage_timings=stage_timings,
+            deadline_exceeded=True,
+            evidence_bundle={
+                "stage_timings": stage_timings,
+                "deadline": {
+                    "budget_ms": round(deadline.budget * 1000, 2),
+                    "stage": stage,
+                },
+            },
+        )
+
+    # ==================================================
+    # Escalation ladder
+    # ==================================================
+
+    def _new_speculation_stats(self, tier: int) -> dict:
+
+        speculative = self.policy.is_speculative(tier)
+
+        return {
+            "mode": SPECULATIVE if speculative else SEQUENTIAL,
+            "delay_ms": (
+                round(self.policy.delay_seconds(tier) * 1000, 2)
+                if speculative else None
+            ),
+            "launched": 0,
+            "used": 0,
+            "cancelled": 0,
+            "wasted_calls": 0,
+            "wasted_upstream_ms": 0.0,
+        }
+
+    async def _ladder_responses(
+        self,
+        plan: List[int],
+        objective: str,
+        output: str,
+        tier: int,
+        stats: dict,
+        timer: StageTimer,
+        deadline: Optional[Deadline] = None,
+        deadline_info: Optional[dict] = None,
+    ):
+        """
+        Yields (level, validation_response) in ladder order.
+
+        The consumer stops iterating once a level meets the threshold;
+        closing the generator cancels any speculative calls still out.
+        Levels ruled out by the deadline are not yielded, and the ladder
+        ends once the deadline has passed.
+        """
+
+        if not self.policy.is_speculative(tier):
+            for level in plan:
+                response = await self._validate_level(
+                    level, objective, output, timer, deadline, deadline_info
+                )
+                if response is None:
+                    if deadline.expired:
+                        return
+                    continue
+                stats["launched"] += 1
+                stats["used"] += 1
+                yield level, response
+            return
+
+        delay = self.policy.delay_seconds(tier)
+        lookahead = self.policy.speculative_lookahead
+        calls: List[dict] = []
+
+        def launch(index: int, after: float):
+            call = {"level": plan[index], "started": None, "finished": None}
+
+            async def run():
+                if after > 0:
+                    await asyncio.sleep(after)
+                call["started"] = time.perf_counter()
+                try:
+                    return await self._validate_level(
+                        plan[index],
+                        objective,
+                        output,
+                        timer,
+                        deadline,
+                        deadline_info,
+                    )
+                finally:
+                    call["finished"] = time.perf_counter()
+
+            call["task"] = asyncio.ensure_future(run())
+            calls.append(call)
+
+        try:
+            for index, level in enumerate(plan):
+
+                # Keep up to `lookahead` higher levels in flight, staggered
+                # by `delay` relative to the level being awaited now.
+                while len(calls) <= min(index + lookahead, len(plan) - 1):
+                    launch(len(calls), delay * (len(calls) - index))
+
+                response = await calls[index]["task"]
+                if response is None:
+                    if deadline.expired:
+                        return
+                    continue
+                calls[index]["used"] = True
+                yield level, response
+
+        finally:
+            # Also gathers calls that already failed unobserved, so their
+            # exceptions are retrieved rather than logged at shutdown
+            await cancel_and_wait([call["task"] for call in calls])
+
+            now = time.perf_counter()
+
+            for call in calls:
+                if call["started"] is None:
+                    continue
+
+                stats["launched"] += 1
+
+                if call.get("used"):
+                    stats["used"] += 1
+                    continue
+
+                if call["task"].cancelled():
+                    stats["cancelled"] += 1
+
+                stats["wasted_calls"] += 1
+                stats["wasted_upstream_ms"] += (
+                    ((call["finished"] or now) - call["started"]) * 1000
+                )
+
+            stats["wasted_upstream_ms"] = round(
+                stats["wasted_upstream_ms"], 2
+            )
+
+    def _structure_validator_runs(self, level: int, validator_results) -> List[dict]:
+
+        structured_runs = []
+
+        for result in validator_results:
+            structured_runs.append(
+                {
+                    "redundancy_level": level,
+                    "miner_address": result.get("miner", "unknown"),
+                    "valid": result.get(
+                        "binary_classification", {}
+                    ).get("valid", True),
+                    "confidence_score": result.get(
+                        "binary_classification", {}
+                    ).get("confidence_score", 0.0),
+                    "overall_score": result.get(
+                        "overall_assessment", {}
+                    ).get("overall_score", 0),
+                    "risk_level": result.get(
+                        "overall_assessment", {}
+                    ).get("risk_level", "unknown"),
+                    "data_hash": result.get(
+                        "data_hash", "unknown"
+                    ),
+                }
+            )
+
+        return structured_runs
+
     def _extract_completion_output(self, response: dict) -> str:
 
         if "output" in response:
@@ -79,4 +79,19 @@ class AgentResponse:
     decision_reason: str
     consensus_score: Optional[float] = None
     risk_level: Optional[str] = None
-    evidence_bundle: Optional[Dict[str, Any]] = field(default_factory=dict)
\ No newline at end of file
+    evidence_bundle: Optional[Dict[str, Any]] = field(default_factory=dict)
+
+    # Signed artifact reference
+    decision_id: Optional[str] = None
+    artifact_hash: Optional[str] = None
+    signature: Optional[str] = None
+    timestamp: Optional[str] = None
+    threshold: Optional[float] = None
+    validator_runs: Optional[List[Dict[str, Any]]] = None
+    cache_hit: bool = False
+
+    # Per-stage {start_ms, end_ms, duration_ms}, offsets from request start
+    stage_timings: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # True when the caller's deadline cut the evaluation short
+    deadline_exceeded: bool = False
\ No newline at end of file
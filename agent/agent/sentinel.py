@@ -3,7 +3,7 @@
 from typing import Any
 
 from config.sessions import SessionConfig
-from core.trust_math import TrustMath
+from core.trust_math import TrustAccumulator
 from strategy import ValidationStrategy
 from interpreter import Interpreter
 from models import (
@@ -78,12 +78,9 @@ class ReliabilitySentinelAgent:
                 for r in validation_result["results"]
             ]
 
-            agreement = TrustMath.weighted_validator_agreement(validator_results)
-            avg_conf = TrustMath.average_validator_confidence(validator_results)
-            composite_confidence = TrustMath.composite_confidence(
-                agreement,
-                avg_conf,
-            )
+            evidence = TrustAccumulator()
+            evidence.extend(validator_results)
+            composite_confidence = evidence.composite
 
             verdict = Interpreter.decide(
                 risk_level=risk_level,
@@ -18,6 +18,9 @@ class ArtifactBuilder:
         escalation_path: list,
         verdict: str,
         validator_runs: list,
+        level_scores: list = None,
+        stage_timings: dict = None,
+        output_hash: str = None,
     ):
 
         artifact = DecisionArtifactV1(
@@ -28,13 +31,15 @@ class ArtifactBuilder:
             completion_task_id=completion_task_id,
             validation_task_ids=validation_task_ids,
             objective_hash=sha256_hex(objective),
-            output_hash=sha256_hex(output),
+            output_hash=output_hash or sha256_hex(output),
             composite_confidence=composite_confidence,
             threshold_applied=threshold,
             escalation_path=escalation_path,
             final_verdict=verdict,
             created_at_utc=datetime.utcnow().isoformat(),
             validator_summary=validator_runs,
+            level_scores=level_scores or [],
+            stage_timings=stage_timings or {},
         )
 
         artifact_dict = artifact.__dict__.copy()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict
 from datetime import datetime
 import hashlib
@@ -28,6 +28,9 @@ class DecisionArtifactV1:
 
     validator_summary: List[Dict]
 
+    level_scores: List[Dict] = field(default_factory=list)
+    stage_timings: Dict[str, Dict] = field(default_factory=dict)
+
 
 def sha256_hex(data: str) -> str:
     return hashlib.sha256(data.encode()).hexdigest()
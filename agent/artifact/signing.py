@@ -1,8 +1,12 @@
 import os
 import json
+import time
+from functools import lru_cache
 from nacl.signing import SigningKey, VerifyKey
 from nacl.encoding import HexEncoder
 
+from core.metrics import SIGNING_SECONDS
+
 
 class ArtifactSigner:
     """
@@ -39,6 +43,8 @@ class ArtifactSigner:
         Deterministically serialize artifact and return hex signature.
         """
 
+        started = time.perf_counter()
+
         artifact_json = json.dumps(
             artifact,
             sort_keys=True,
@@ -49,6 +55,8 @@ class ArtifactSigner:
 
         signed = self.signing_key.sign(artifact_bytes)
 
+        SIGNING_SECONDS.observe(time.perf_counter() - started)
+
         return signed.signature.hex()
 
     # ==========================================================
@@ -97,4 +105,26 @@ class ArtifactSigner:
         """
         return self.verify_key.encode(
             encoder=HexEncoder
-        ).decode()
\ No newline at end of file
+        ).decode()
+
+
+@lru_cache(maxsize=4)
+def _signer_for(private_key: str) -> ArtifactSigner:
+    return ArtifactSigner(private_key)
+
+
+def get_signer(private_key: str | None = None) -> ArtifactSigner:
+    """
+    Process-wide signer per key, so the Ed25519 key is decoded once
+    instead of on every decision.
+    """
+
+    if private_key is None:
+        private_key = os.getenv("SENTINEL_PRIVATE_KEY")
+
+    if not private_key:
+        raise RuntimeError(
+            "SENTINEL_PRIVATE_KEY not set or passed to ArtifactSigner"
+        )
+
+    return _signer_for(private_key)
@@ -0,0 +1,129 @@
+# agent/config/escalation.py
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+
+SEQUENTIAL = "sequential"
+SPECULATIVE = "speculative"
+
+
+def _parse_levels(raw: str) -> Optional[FrozenSet[int]]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    return frozenset(int(level) for level in raw.split(",") if level.strip())
+
+
+def _parse_level_map(raw: str) -> Dict[int, float]:
+    """
+    Parses "5:0,3:1500" into {5: 0.0, 3: 1500.0}.
+    """
+
+    mapping: Dict[int, float] = {}
+
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        level, value = item.split(":", 1)
+        mapping[int(level)] = float(value)
+
+    return mapping
+
+
+@dataclass(frozen=True)
+class EscalationPolicy:
+    """
+    How Firewall walks the validation ladder.
+
+    sequential:
+        Each level starts only after the previous one fell short.
+
+    speculative:
+        Up to `speculative_lookahead` higher levels are fired while the
+        current one is in flight, each `speculative_delay_ms` after the
+        previous. Levels are still scored in ladder order and outstanding
+        calls are cancelled once a level meets the threshold, so verdicts
+        and escalation paths match sequential mode.
+
+    Speculation can be limited to some risk tiers (the delegate's
+    recommended redundancy) and given a per-tier delay.
+
+    pool_evidence:
+        Score each level over the union of every validator run so far
+        instead of the current level alone. `level_weights` scales the
+        contribution of each redundancy level (default 1.0).
+
+    early_stop (opt-in, needs pool_evidence):
+        End the ladder once the remaining levels can no longer lift the
+        pooled score over the threshold. Upstream decides how many
+        validators a level returns, so each remaining level is assumed
+        to return at most max(its redundancy, the largest batch seen so
+        far). A level that returns more can still change the verdict.
+    """
+
+    mode: str = SEQUENTIAL
+    speculative_delay_ms: float = 0.0
+    speculative_lookahead: int = 1
+    speculative_tiers: Optional[FrozenSet[int]] = None
+    speculative_tier_delays_ms: Dict[int, float] = field(default_factory=dict)
+
+    pool_evidence: bool = False
+    level_weights: Dict[int, float] = field(default_factory=dict)
+    early_stop: bool = False
+
+    def __post_init__(self):
+        if self.mode not in (SEQUENTIAL, SPECULATIVE):
+            raise ValueError(f"Unknown escalation mode: {self.mode}")
+
+        if self.speculative_lookahead < 1:
+            raise ValueError("speculative_lookahead must be at least 1.")
+
+        if any(weight < 0 for weight in self.level_weights.values()):
+            raise ValueError("level_weights must be non-negative.")
+
+    def is_speculative(self, tier: int) -> bool:
+        if self.mode != SPECULATIVE:
+            return False
+
+        if self.speculative_tiers is None:
+            return True
+
+        return tier in self.speculative_tiers
+
+    def delay_seconds(self, tier: int) -> float:
+        delay_ms = self.speculative_tier_delays_ms.get(
+            tier, self.speculative_delay_ms
+        )
+        return max(delay_ms, 0.0) / 1000.0
+
+    def level_weight(self, level: int) -> float:
+        return self.level_weights.get(level, 1.0)
+
+    @classmethod
+    def from_env(cls) -> "EscalationPolicy":
+        return cls(
+            mode=os.getenv("SENTINEL_ESCALATION_MODE", SEQUENTIAL).lower(),
+            speculative_delay_ms=float(
+                os.getenv("SENTINEL_SPECULATIVE_DELAY_MS", "0")
+            ),
+            speculative_lookahead=int(
+                os.getenv("SENTINEL_SPECULATIVE_LOOKAHEAD", "1")
+            ),
+            speculative_tiers=_parse_levels(
+                os.getenv("SENTINEL_SPECULATIVE_TIERS", "")
+            ),
+            speculative_tier_delays_ms=_parse_level_map(
+                os.getenv("SENTINEL_SPECULATIVE_TIER_DELAYS_MS", "")
+            ),
+            pool_evidence=(
+                os.getenv("SENTINEL_POOL_EVIDENCE", "False").lower() == "true"
+            ),
+            level_weights=_parse_level_map(
+                os.getenv("SENTINEL_LEVEL_WEIGHTS", "")
+            ),
+            early_stop=(
+                os.getenv("SENTINEL_EARLY_STOP", "False").lower() == "true"
+            ),
+        )
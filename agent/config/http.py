@@ -0,0 +1,49 @@
+# agent/config/http.py
+
+import os
+from dataclasses import dataclass
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    """
+    Connection pool and timeout settings for the Cortensor router client.
+
+    Read timeouts are per endpoint and sit slightly above the
+    420 s upstream execution budget so the router, not httpx,
+    decides when a task has timed out.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+    connect_timeout: float = 10.0
+    pool_timeout: float = 30.0
+
+    delegate_timeout: float = 450.0
+    completion_timeout: float = 450.0
+    validate_timeout: float = 450.0
+
+    @classmethod
+    def from_env(cls) -> "HttpSettings":
+        return cls(
+            max_connections=_env_int("ROUTER_MAX_CONNECTIONS", 100),
+            max_keepalive_connections=_env_int("ROUTER_MAX_KEEPALIVE", 20),
+            keepalive_expiry=_env_float("ROUTER_KEEPALIVE_EXPIRY", 30.0),
+            http2=os.getenv("ROUTER_HTTP2", "False").lower() == "true",
+            connect_timeout=_env_float("ROUTER_CONNECT_TIMEOUT", 10.0),
+            pool_timeout=_env_float("ROUTER_POOL_TIMEOUT", 30.0),
+            delegate_timeout=_env_float("ROUTER_DELEGATE_TIMEOUT", 450.0),
+            completion_timeout=_env_float("ROUTER_COMPLETION_TIMEOUT", 450.0),
+            validate_timeout=_env_float("ROUTER_VALIDATE_TIMEOUT", 450.0),
+        )
@@ -0,0 +1,83 @@
+# agent/config/resilience.py
+
+import os
+from dataclasses import dataclass
+from typing import FrozenSet
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+def _parse_methods(raw: str) -> FrozenSet[str]:
+    return frozenset(
+        method.strip().lower() for method in raw.split(",") if method.strip()
+    )
+
+
+@dataclass(frozen=True)
+class ResilienceSettings:
+    """
+    Hedging, retry and circuit breaker settings for RouterClient.
+
+    hedging:
+        Once a call has run longer than the `hedge_quantile` of recent
+        latency for its (method, session), a duplicate is sent and the
+        first answer wins. Nothing is hedged until the session has
+        enough samples, or for methods outside `hedge_methods`.
+
+    retries:
+        Timeouts, transport errors, 429 and 5xx are retried up to
+        `max_retries` times with full-jitter exponential backoff
+        (uniform in [0, min(backoff_max, backoff_base * 2^attempt)]),
+        as long as the caller's budget allows. Without a budget, read
+        timeouts and 504 are not retried; delegate is retried only on
+        connect errors, 429 and 503 (see RouterClient._retryable).
+
+    circuit breaker:
+        `failure_threshold` consecutive transient failures on a session
+        open its circuit: calls fail fast for `reset_timeout` seconds,
+        then one probe call decides whether it closes again.
+    """
+
+    hedge_enabled: bool = True
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.5
+    hedge_methods: FrozenSet[str] = frozenset({"validate", "completion"})
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    def __post_init__(self):
+        if not 0.0 < self.hedge_quantile < 1.0:
+            raise ValueError("hedge_quantile must be between 0 and 1.")
+
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative.")
+
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+
+    @classmethod
+    def from_env(cls) -> "ResilienceSettings":
+        return cls(
+            hedge_enabled=os.getenv("ROUTER_HEDGE_ENABLED", "True").lower() == "true",
+            hedge_quantile=_env_float("ROUTER_HEDGE_QUANTILE", 0.95),
+            hedge_min_delay=_env_float("ROUTER_HEDGE_MIN_DELAY", 0.5),
+            hedge_methods=_parse_methods(
+                os.getenv("ROUTER_HEDGE_METHODS", "validate,completion")
+            ),
+            max_retries=_env_int("ROUTER_MAX_RETRIES", 2),
+            backoff_base=_env_float("ROUTER_BACKOFF_BASE", 0.5),
+            backoff_max=_env_float("ROUTER_BACKOFF_MAX", 10.0),
+            failure_threshold=_env_int("ROUTER_BREAKER_THRESHOLD", 5),
+            reset_timeout=_env_float("ROUTER_BREAKER_RESET", 30.0),
+        )
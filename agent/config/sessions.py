@@ -1,20 +1,78 @@
 # agent/config/sessions.py
 
+import os
+from typing import Dict, Tuple
+
+
+def _parse_pool(raw: str, default: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Parses "78,80" (or "78|80") into (78, 80).
+    """
+
+    pool = tuple(
+        int(session.strip())
+        for session in raw.replace("|", ",").split(",")
+        if session.strip()
+    )
+    return pool or default
+
+
+def _parse_level_pools(
+    raw: str,
+    default: Dict[int, Tuple[int, ...]],
+) -> Dict[int, Tuple[int, ...]]:
+    """
+    Parses "1:78,3:67|81,5:79|82" over the defaults.
+    """
+
+    pools = dict(default)
+
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        level, sessions = item.split(":", 1)
+        pools[int(level)] = _parse_pool(sessions, pools.get(int(level), ()))
+
+    return pools
+
+
 class SessionConfig:
     """
     Single source of truth for all session IDs.
     Change here → applies everywhere.
+
+    Each role has a pool of sessions; RouterClient balances calls
+    across a pool by observed latency and load. The scalar attributes
+    are the first session of each pool.
+
+    SENTINEL_DELEGATE_SESSIONS="78,80"
+    SENTINEL_COMPLETION_SESSIONS="78,80"
+    SENTINEL_VALIDATION_SESSIONS="1:78,3:67|81,5:79|82"
     """
 
-    DELEGATE = 78
-    COMPLETION = 78
+    DELEGATE_POOL = _parse_pool(os.getenv("SENTINEL_DELEGATE_SESSIONS", ""), (78,))
+    COMPLETION_POOL = _parse_pool(os.getenv("SENTINEL_COMPLETION_SESSIONS", ""), (78,))
+
+    VALIDATION_POOLS = _parse_level_pools(
+        os.getenv("SENTINEL_VALIDATION_SESSIONS", ""),
+        {
+            1: (78,),  # optional
+            3: (67,),
+            5: (79,),
+        },
+    )
+
+    DELEGATE = DELEGATE_POOL[0]
+    COMPLETION = COMPLETION_POOL[0]
 
     VALIDATION = {
-        1: 78,  # optional
-        3: 67,
-        5: 79
+        level: pool[0] for level, pool in VALIDATION_POOLS.items()
     }
 
     @staticmethod
     def get_validation_session(redundancy: int) -> int:
-        return SessionConfig.VALIDATION.get(redundancy, 67)
\ No newline at end of file
+        return SessionConfig.VALIDATION.get(redundancy, 67)
+
+    @staticmethod
+    def get_validation_sessions(redundancy: int) -> Tuple[int, ...]:
+        return SessionConfig.VALIDATION_POOLS.get(redundancy, (67,))
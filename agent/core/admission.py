@@ -0,0 +1,266 @@
+# agent/core/admission.py
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Optional
+
+from core import metrics
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when an evaluation is not admitted.
+
+    status_code is 429 when the wait queue is full and 503 when the
+    request waited `queue_timeout` without getting a slot.
+    """
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """Handed to the admitted caller to report upstream latency."""
+
+    __slots__ = ("sample",)
+
+    def __init__(self):
+        self.sample: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        self.sample = seconds
+
+
+class AdmissionController:
+    """
+    Caps concurrent evaluations that reach Cortensor.
+
+    Up to `limit` callers run at once; up to `max_queue` more wait in
+    FIFO order for at most `queue_timeout` seconds. Everyone else is
+    rejected immediately, so overload turns into fast 429/503 responses
+    with Retry-After instead of piles of long upstream calls.
+
+    With lane scheduling on, Firewall holds a slot only for delegate +
+    completion; the LaneScheduler bounds the validation ladders.
+
+    adaptive:
+        The limit follows observed upstream latency (gradient style):
+        while recent latency stays near the long-run baseline the limit
+        creeps up by sqrt(limit); when recent latency grows, the limit
+        shrinks in proportion, never below `min_limit` or above
+        `max_limit`.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        max_queue: int = 64,
+        queue_timeout: float = 5.0,
+        adaptive: bool = False,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        latency_tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        default_retry_after: int = 5,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.adaptive = adaptive
+        self.min_limit = min_limit
+        self.max_limit = max_limit or max_in_flight * 4
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.default_retry_after = default_retry_after
+
+        self._limit = float(max_in_flight)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # EWMAs in seconds
+        self._service_time: Optional[float] = None
+        self._latency_short: Optional[float] = None
+        self._latency_long: Optional[float] = None
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        max_limit = os.getenv("SENTINEL_ADMISSION_MAX_LIMIT")
+        return cls(
+            max_in_flight=int(os.getenv("SENTINEL_ADMISSION_MAX_IN_FLIGHT", "32")),
+            max_queue=int(os.getenv("SENTINEL_ADMISSION_MAX_QUEUE", "64")),
+            queue_timeout=float(os.getenv("SENTINEL_ADMISSION_QUEUE_TIMEOUT", "5")),
+            adaptive=os.getenv("SENTINEL_ADMISSION_ADAPTIVE", "False").lower() == "true",
+            min_limit=int(os.getenv("SENTINEL_ADMISSION_MIN_LIMIT", "1")),
+            max_limit=int(max_limit) if max_limit else None,
+        )
+
+    @property
+    def limit(self) -> int:
+        return max(int(self._limit), 1)
+
+    # ==========================================================
+    # ADMISSION
+    # ==========================================================
+
+    @asynccontextmanager
+    async def admit(self, timeout: Optional[float] = None):
+        """
+        Holds one slot for the body of the `async with`.
+        Raises AdmissionRejected instead of entering when overloaded.
+        `timeout` shortens the queue wait (e.g. to a caller's deadline).
+        """
+
+        queue_timeout = self.queue_timeout
+        if timeout is not None:
+            queue_timeout = min(queue_timeout, timeout)
+
+        await self._acquire(queue_timeout)
+        started = time.perf_counter()
+        ticket = AdmissionTicket()
+
+        try:
+            yield ticket
+        finally:
+            self._release(time.perf_counter() - started, ticket.sample)
+
+    async def _acquire(self, queue_timeout: float):
+
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            metrics.ADMISSION_REJECTIONS.labels("queue_full").inc()
+            raise AdmissionRejected(
+                429, "Too many evaluations queued", self.retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=queue_timeout
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._remove_waiter(waiter)
+
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+            self.rejected_timeout += 1
+            metrics.ADMISSION_REJECTIONS.labels("queue_timeout").inc()
+            raise AdmissionRejected(
+                503, "Timed out waiting for evaluation capacity", self.retry_after()
+            )
+
+        metrics.ADMISSION_QUEUE_SECONDS.observe(time.perf_counter() - started)
+        self.admitted += 1
+
+    def _release(self, held: float, upstream_latency: Optional[float]):
+
+        self._service_time = self._ewma(self._service_time, held, 0.2)
+
+        if self.adaptive and upstream_latency is not None:
+            self._adapt(upstream_latency)
+
+        self._release_slot()
+
+    def _release_slot(self):
+
+        self.in_flight -= 1
+
+        # Hand freed slots straight to waiters, oldest first
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _remove_waiter(self, waiter: asyncio.Future):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    # ==========================================================
+    # ADAPTIVE LIMIT
+    # ==========================================================
+
+    @staticmethod
+    def _ewma(current: Optional[float], sample: float, alpha: float) -> float:
+        if current is None:
+            return sample
+        return current + alpha * (sample - current)
+
+    def _adapt(self, latency: float):
+
+        self._latency_short = self._ewma(self._latency_short, latency, 0.5)
+        self._latency_long = self._ewma(self._latency_long, latency, 0.05)
+
+        gradient = 1.0
+        if self._latency_short > 0:
+            gradient = self.latency_tolerance * self._latency_long / self._latency_short
+            gradient = min(1.0, max(0.5, gradient))
+
+        target = self._limit * gradient + math.sqrt(self._limit)
+        self._limit = (1 - self.smoothing) * self._limit + self.smoothing * target
+        self._limit = min(max(self._limit, self.min_limit), self.max_limit)
+
+    # ==========================================================
+    # STATS
+    # ==========================================================
+
+    def retry_after(self) -> int:
+        """
+        Seconds until a slot is likely free: the queue ahead divided
+        across the slots, at the average time a slot is held.
+        """
+        if self._service_time is None:
+            return self.default_retry_after
+
+        ahead = len(self._waiters) + 1
+        return max(1, math.ceil(self._service_time * ahead / self.limit))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "adaptive": self.adaptive,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "service_time_ms": (
+                round(self._service_time * 1000, 2)
+                if self._service_time is not None else None
+            ),
+        }
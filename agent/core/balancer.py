@@ -0,0 +1,162 @@
+# agent/core/balancer.py
+
+import math
+import random
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+
+class _SessionLoad:
+
+    def __init__(self):
+        self.outstanding = 0
+        self.picked = 0
+        self.errors = 0
+
+        # method -> (peak EWMA seconds, last update)
+        self.latency: Dict[str, Tuple[float, float]] = {}
+
+
+class SessionBalancer:
+    """
+    Peak-EWMA load balancing across a pool of equivalent sessions.
+
+    Each session's cost for a method is its peak-EWMA latency times
+    (outstanding calls + 1). The EWMA jumps straight up to any slower
+    sample and decays back over `decay` seconds, so a session that
+    turns slow is avoided at once and retried only as it recovers.
+    Failures count as an `error_penalty`-second sample.
+
+    Sessions with no samples yet cost the cheapest known latency in
+    the pool, so new sessions get traffic without being flooded.
+    Pools of three or more use power-of-two-choices to keep bursts of
+    concurrent picks from landing on one session.
+    """
+
+    def __init__(
+        self,
+        decay: float = 10.0,
+        error_penalty: float = 5.0,
+        default_latency: float = 1.0,
+    ):
+        self.decay = decay
+        self.error_penalty = error_penalty
+        self.default_latency = default_latency
+
+        self._sessions: Dict[int, _SessionLoad] = {}
+
+    def _load(self, session_id: int) -> _SessionLoad:
+        load = self._sessions.get(session_id)
+        if load is None:
+            load = self._sessions[session_id] = _SessionLoad()
+        return load
+
+    # ==========================================================
+    # PICK
+    # ==========================================================
+
+    def pick(
+        self,
+        method: str,
+        pool: Sequence[int],
+        exclude: Iterable[int] = (),
+    ) -> int:
+        """
+        Cheapest session in `pool`, skipping `exclude` (e.g. open
+        circuits) unless that would leave nothing to pick.
+        """
+
+        excluded = set(exclude)
+        candidates = [session for session in pool if session not in excluded]
+        if not candidates:
+            candidates = list(pool)
+
+        if len(candidates) == 1:
+            chosen = candidates[0]
+        else:
+            if len(candidates) > 2:
+                candidates = random.sample(candidates, 2)
+
+            fallback = self._fallback_latency(method, pool)
+            chosen = min(
+                candidates,
+                key=lambda session: (
+                    self.cost(method, session, fallback),
+                    random.random(),
+                ),
+            )
+
+        self._load(chosen).picked += 1
+        return chosen
+
+    def cost(self, method: str, session_id: int, fallback: Optional[float] = None) -> float:
+        load = self._load(session_id)
+        sample = load.latency.get(method)
+        latency = sample[0] if sample else (fallback or self.default_latency)
+        return latency * (load.outstanding + 1)
+
+    def _fallback_latency(self, method: str, pool: Sequence[int]) -> float:
+        known = [
+            self._sessions[session].latency[method][0]
+            for session in pool
+            if session in self._sessions and method in self._sessions[session].latency
+        ]
+        return min(known) if known else self.default_latency
+
+    # ==========================================================
+    # CALL TRACKING
+    # ==========================================================
+
+    def begin(self, session_id: int) -> None:
+        self._load(session_id).outstanding += 1
+
+    def end(
+        self,
+        method: str,
+        session_id: int,
+        seconds: Optional[float],
+        ok: bool = True,
+    ) -> None:
+        """
+        Ends a call started with begin(). `seconds` is None for calls
+        that were abandoned (cancelled) and say nothing about latency.
+        """
+
+        load = self._load(session_id)
+        load.outstanding = max(0, load.outstanding - 1)
+
+        if seconds is None:
+            return
+
+        if not ok:
+            load.errors += 1
+            seconds = max(seconds, self.error_penalty)
+
+        now = time.monotonic()
+        previous = load.latency.get(method)
+
+        if previous is None or seconds > previous[0]:
+            ewma = seconds
+        else:
+            weight = math.exp(-(now - previous[1]) / self.decay)
+            ewma = previous[0] * weight + seconds * (1 - weight)
+
+        load.latency[method] = (ewma, now)
+
+    # ==========================================================
+    # STATS
+    # ==========================================================
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            str(session_id): {
+                "outstanding": load.outstanding,
+                "picked": load.picked,
+                "errors": load.errors,
+                "latency_ms": {
+                    method: round(sample[0] * 1000, 2)
+                    for method, sample in load.latency.items()
+                },
+            }
+            for session_id, load in self._sessions.items()
+        }
@@ -0,0 +1,96 @@
+# agent/core/breaker.py
+
+import time
+from typing import Any, Dict, Optional
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a session whose circuit is open."""
+
+    def __init__(self, key: Any, retry_after: float):
+        super().__init__(
+            f"Circuit open for {key}; retry in {retry_after:.1f}s"
+        )
+        self.key = key
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream session.
+
+    closed:    calls pass; `failure_threshold` failures in a row open it.
+    open:      calls fail fast with CircuitOpen for `reset_timeout` s.
+    half_open: one probe call passes; success closes the circuit,
+               failure opens it again for another `reset_timeout`.
+    """
+
+    def __init__(self, key: Any, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> None:
+        """Raises CircuitOpen unless a call may go out now."""
+
+        if self.state == CLOSED:
+            return
+
+        if self.state == OPEN:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpen(self.key, self.reset_timeout - elapsed)
+            self.state = HALF_OPEN
+            self._probing = False
+
+        if self._probing:
+            self.rejected += 1
+            raise CircuitOpen(self.key, self.reset_timeout)
+
+        self._probing = True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened += 1
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Frees the probe slot when a call ends without a verdict (cancelled)."""
+        self._probing = False
+
+    def retry_after(self) -> Optional[float]:
+        if self.state != OPEN:
+            return None
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,45 @@
+# agent/core/concurrency.py
+
+import asyncio
+from typing import Any, Awaitable, List
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Runs awaitables concurrently and returns their results in order.
+
+    Unlike asyncio.gather, the first failure cancels every sibling
+    still in flight before the exception is re-raised, and cancelling
+    the caller cancels all children.
+    """
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+
+    try:
+        done, pending = await asyncio.wait(
+            tasks,
+            return_when=asyncio.FIRST_EXCEPTION,
+        )
+    except asyncio.CancelledError:
+        await cancel_and_wait(tasks)
+        raise
+
+    if pending:
+        await cancel_and_wait(pending)
+
+    for task in tasks:
+        if task in done and task.exception() is not None:
+            raise task.exception()
+
+    return [task.result() for task in tasks]
+
+
+async def cancel_and_wait(tasks) -> None:
+    """
+    Cancels tasks and waits until each has actually finished.
+    """
+
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
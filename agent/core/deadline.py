@@ -0,0 +1,45 @@
+# agent/core/deadline.py
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when work is abandoned because the deadline passed."""
+
+
+class Deadline:
+    """
+    End-to-end time budget for one evaluation.
+    """
+
+    __slots__ = ("budget", "_expires_at")
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self._expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def from_ms(cls, milliseconds: Optional[float]) -> Optional["Deadline"]:
+        if milliseconds is None:
+            return None
+        return cls(milliseconds / 1000.0)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(self._expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def fits(self, estimate: Optional[float]) -> bool:
+        """
+        Whether work expected to take `estimate` seconds can finish in
+        time. Unknown estimates are given the benefit of the doubt.
+        """
+        if self.expired:
+            return False
+        if estimate is None:
+            return True
+        return estimate <= self.remaining()
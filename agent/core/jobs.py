@@ -0,0 +1,292 @@
+# agent/core/jobs.py
+
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.deadline import Deadline
+from core.lru import LRUCache
+
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+FINISHED = (SUCCEEDED, FAILED)
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue cannot take another submission."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    job_id: str
+    objective: str
+    priority: Optional[str] = None
+    deadline: Optional[Deadline] = field(default=None, repr=False)
+    status: str = QUEUED
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+class JobManager:
+    """
+    Runs evaluations as background jobs on a bounded worker pool.
+
+    submit() enqueues and returns immediately; `workers` tasks drain a
+    queue of at most `capacity` jobs. Unfinished jobs are held in memory
+    until they finish, then move to an LRU bounded by `max_finished`
+    and expire after `result_ttl` seconds.
+
+    With a Database, every state change is also written to the jobs
+    table, so another worker process (or this one after a restart) can
+    still answer for the job. A persisted job that is neither finished
+    nor updated within `stale_after` seconds is reported as failed: the
+    process running it is gone.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[
+            [str, Optional[str], Optional[Deadline]], Awaitable[Dict[str, Any]]
+        ],
+        db=None,
+        workers: int = 4,
+        capacity: int = 100,
+        max_finished: int = 1000,
+        result_ttl: float = 3600.0,
+        stale_after: float = 3600.0,
+    ):
+        self.runner = runner
+        self.db = db
+        self.workers = workers
+        self.capacity = capacity
+        self.result_ttl = result_ttl
+        self.stale_after = stale_after
+
+        self._active: Dict[str, Job] = {}
+        self._finished = LRUCache(max_entries=max_finished)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+        self.persist_errors = 0
+
+    @classmethod
+    def from_env(
+        cls,
+        runner: Callable[
+            [str, Optional[str], Optional[Deadline]], Awaitable[Dict[str, Any]]
+        ],
+        db=None,
+    ) -> "JobManager":
+        return cls(
+            runner=runner,
+            db=db,
+            workers=int(os.getenv("SENTINEL_JOB_WORKERS", "4")),
+            capacity=int(os.getenv("SENTINEL_JOB_CAPACITY", "100")),
+            max_finished=int(os.getenv("SENTINEL_JOB_MAX_FINISHED", "1000")),
+            result_ttl=float(os.getenv("SENTINEL_JOB_RESULT_TTL", "3600")),
+            stale_after=float(os.getenv("SENTINEL_JOB_STALE_AFTER", "3600")),
+        )
+
+    # ==========================================================
+    # LIFECYCLE
+    # ==========================================================
+
+    async def start(self):
+        if self._queue is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.capacity)
+        self._workers = [
+            asyncio.ensure_future(self._work())
+            for _ in range(self.workers)
+        ]
+
+    async def close(self):
+        """
+        Stops the workers. Queued and running jobs are marked failed
+        so pollers are not left waiting on them.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+        for job in list(self._active.values()):
+            await self._finish(job, error="Job interrupted by shutdown")
+
+    # ==========================================================
+    # SUBMIT / LOOKUP
+    # ==========================================================
+
+    async def submit(
+        self,
+        objective: str,
+        priority: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Job:
+        """
+        Enqueues a job. A deadline keeps running while the job waits
+        in the queue.
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager is not started.")
+
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            objective=objective,
+            priority=priority,
+            deadline=deadline,
+        )
+
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise JobQueueFull(
+                f"Job queue is full ({self.capacity} pending)."
+            )
+
+        self._active[job.job_id] = job
+        self.submitted += 1
+        await self._save(job)
+
+        return job
+
+    def local(self, job_id: str) -> Optional[Job]:
+        """The job if this process owns it and still holds it in memory."""
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.local(job_id)
+        if job is not None:
+            return job.to_dict()
+
+        if self.db is None:
+            return None
+
+        row = await self.db.get_job(job_id)
+        if row is None:
+            return None
+
+        updated_at = row["updated_at"]
+        if (
+            row["status"] not in FINISHED
+            and (_now() - updated_at).total_seconds() > self.stale_after
+        ):
+            row["status"] = FAILED
+            row["error"] = "Job was interrupted before completion"
+
+        row["created_at"] = row["created_at"].isoformat()
+        row["updated_at"] = updated_at.isoformat()
+        return row
+
+    # ==========================================================
+    # WORKERS
+    # ==========================================================
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+
+            try:
+                job.status = RUNNING
+                job.updated_at = _now()
+                await self._save(job)
+
+                try:
+                    result = await self.runner(
+                        job.objective, job.priority, job.deadline
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    await self._finish(job, error=str(e) or type(e).__name__)
+                else:
+                    await self._finish(job, result=result)
+            finally:
+                self._queue.task_done()
+
+    async def _finish(
+        self,
+        job: Job,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ):
+        job.status = SUCCEEDED if error is None else FAILED
+        job.result = result
+        job.error = error
+        job.updated_at = _now()
+
+        if error is None:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+        self._active.pop(job.job_id, None)
+        self._finished.put(job.job_id, job, ttl=self.result_ttl)
+        job.done.set()
+
+        await self._save(job)
+
+    async def _save(self, job: Job):
+        if self.db is None:
+            return
+
+        try:
+            await self.db.save_job(
+                job_id=job.job_id,
+                status=job.status,
+                objective=job.objective,
+                result=job.result,
+                error=job.error,
+                created_at=job.created_at,
+                updated_at=job.updated_at,
+            )
+        except Exception as e:
+            # The in-memory copy stays authoritative for this process
+            self.persist_errors += 1
+            print(f"⚠️  Failed to persist job {job.job_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "capacity": self.capacity,
+            "active": len(self._active),
+            "finished_cached": len(self._finished),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "persist_errors": self.persist_errors,
+            "persistent": self.db is not None,
+        }
@@ -0,0 +1,243 @@
+# agent/core/lanes.py
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from core import metrics
+
+
+HIGH = "high"
+MEDIUM = "medium"
+LOW = "low"
+
+LANES = (HIGH, MEDIUM, LOW)
+
+
+def lane_for_redundancy(redundancy: int) -> str:
+    """Maps the delegate's recommended redundancy to a lane."""
+
+    if redundancy >= 5:
+        return HIGH
+
+    if redundancy >= 3:
+        return MEDIUM
+
+    return LOW
+
+
+def _parse_lane_map(raw: str, default: Dict[str, float]) -> Dict[str, float]:
+    """
+    Parses "high:6,medium:3,low:1" over the defaults.
+    """
+
+    mapping = dict(default)
+
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        lane, value = item.split(":", 1)
+        mapping[lane.strip().lower()] = float(value)
+
+    return mapping
+
+
+class _Lane:
+
+    def __init__(self, name: str, weight: float, max_slots: int):
+        self.name = name
+        self.weight = weight
+        self.max_slots = max_slots
+        self.in_flight = 0
+        self.last_finish = 0.0
+
+        # (virtual finish tag, future)
+        self.waiters: Deque[Tuple[float, asyncio.Future]] = deque()
+
+        self.granted = 0
+        self.wait_seconds_total = 0.0
+
+
+class LaneScheduler:
+    """
+    Weighted fair queueing of validation ladders across risk lanes.
+
+    `capacity` ladders run at once across all lanes, and no lane may
+    hold more than its `share` of them, so a flood in one lane always
+    leaves room for the others. When a slot frees up, the waiter with
+    the smallest virtual finish tag (arrival virtual time + 1/weight)
+    among lanes under their share goes next: under contention each lane
+    is served in proportion to its weight, and a lane with a short
+    queue is never stuck behind a long one.
+    """
+
+    DEFAULT_WEIGHTS = {HIGH: 6.0, MEDIUM: 3.0, LOW: 1.0}
+    DEFAULT_SHARES = {HIGH: 1.0, MEDIUM: 0.75, LOW: 0.5}
+
+    def __init__(
+        self,
+        capacity: int = 16,
+        weights: Optional[Dict[str, float]] = None,
+        shares: Optional[Dict[str, float]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+
+        weights = weights or self.DEFAULT_WEIGHTS
+        shares = shares or self.DEFAULT_SHARES
+
+        self.capacity = capacity
+        self.in_flight = 0
+        self._virtual_time = 0.0
+
+        self._lanes: Dict[str, _Lane] = {}
+
+        for name in weights:
+            weight = weights[name]
+            if weight <= 0:
+                raise ValueError(f"Lane weight must be positive: {name}")
+
+            share = min(max(shares.get(name, 1.0), 0.0), 1.0)
+            self._lanes[name] = _Lane(
+                name,
+                weight,
+                max(1, math.ceil(capacity * share)),
+            )
+
+    @classmethod
+    def from_env(cls) -> "LaneScheduler":
+        return cls(
+            capacity=int(os.getenv("SENTINEL_LANE_CAPACITY", "16")),
+            weights=_parse_lane_map(
+                os.getenv("SENTINEL_LANE_WEIGHTS", ""), cls.DEFAULT_WEIGHTS
+            ),
+            shares=_parse_lane_map(
+                os.getenv("SENTINEL_LANE_SHARES", ""), cls.DEFAULT_SHARES
+            ),
+        )
+
+    def has_lane(self, name: str) -> bool:
+        return name in self._lanes
+
+    # ==========================================================
+    # SLOTS
+    # ==========================================================
+
+    @asynccontextmanager
+    async def slot(self, name: str, timeout: Optional[float] = None):
+        """
+        Holds one ladder slot in lane `name` (unknown lanes fall back
+        to LOW). Yields {"lane", "wait_ms"}. Raises asyncio.TimeoutError
+        if no slot frees up within `timeout` seconds.
+        """
+
+        lane = (
+            self._lanes.get(name)
+            or self._lanes.get(LOW)
+            or next(iter(self._lanes.values()))
+        )
+        started = time.perf_counter()
+
+        if timeout is None:
+            await self._acquire(lane)
+        else:
+            await asyncio.wait_for(self._acquire(lane), max(timeout, 0.0))
+
+        waited = time.perf_counter() - started
+        lane.granted += 1
+        lane.wait_seconds_total += waited
+        metrics.lane_wait(lane.name).observe(waited)
+        metrics.lane_in_flight(lane.name).inc()
+
+        try:
+            yield {"lane": lane.name, "wait_ms": round(waited * 1000, 2)}
+        finally:
+            metrics.lane_in_flight(lane.name).dec()
+            self._release(lane)
+
+    async def _acquire(self, lane: _Lane):
+
+        if (
+            not lane.waiters
+            and lane.in_flight < lane.max_slots
+            and self.in_flight < self.capacity
+        ):
+            self._grant(lane)
+            return
+
+        finish = max(self._virtual_time, lane.last_finish) + 1.0 / lane.weight
+        lane.last_finish = finish
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (finish, waiter)
+        lane.waiters.append(entry)
+        metrics.lane_queue_depth(lane.name).inc()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller went away
+                self._release(lane)
+            elif entry in lane.waiters:
+                lane.waiters.remove(entry)
+                metrics.lane_queue_depth(lane.name).dec()
+            raise
+
+    def _grant(self, lane: _Lane):
+        lane.in_flight += 1
+        self.in_flight += 1
+
+    def _release(self, lane: _Lane):
+        lane.in_flight -= 1
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+
+        while self.in_flight < self.capacity:
+            eligible = [
+                lane for lane in self._lanes.values()
+                if lane.waiters and lane.in_flight < lane.max_slots
+            ]
+            if not eligible:
+                return
+
+            lane = min(eligible, key=lambda l: l.waiters[0][0])
+            finish, waiter = lane.waiters.popleft()
+            metrics.lane_queue_depth(lane.name).dec()
+            if waiter.done():
+                # Cancelled caller that has not run its cleanup yet
+                continue
+
+            self._virtual_time = max(self._virtual_time, finish)
+            self._grant(lane)
+            waiter.set_result(None)
+
+    # ==========================================================
+    # STATS
+    # ==========================================================
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "lanes": {
+                lane.name: {
+                    "weight": lane.weight,
+                    "max_slots": lane.max_slots,
+                    "in_flight": lane.in_flight,
+                    "queued": len(lane.waiters),
+                    "granted": lane.granted,
+                    "wait_ms_avg": (
+                        round(lane.wait_seconds_total / lane.granted * 1000, 2)
+                        if lane.granted else 0.0
+                    ),
+                }
+                for lane in self._lanes.values()
+            },
+        }
@@ -0,0 +1,44 @@
+# agent/core/latency.py
+
+import math
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional
+
+
+class LatencyTracker:
+    """
+    Recent latency samples per key (e.g. (method, session_id)).
+
+    Keeps the last `window` samples per key, so quantiles follow the
+    current behaviour of each upstream session. Sorting a few hundred
+    floats per query is cheaper than one upstream round trip by
+    several orders of magnitude.
+    """
+
+    def __init__(self, window: int = 256, min_samples: int = 5):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Hashable, Deque[float]] = {}
+
+    def observe(self, key: Hashable, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def quantile(self, key: Hashable, q: float) -> Optional[float]:
+        """
+        q-quantile of recent samples, or None until `min_samples`
+        have been seen.
+        """
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def count(self, key: Hashable) -> int:
+        samples = self._samples.get(key)
+        return len(samples) if samples else 0
@@ -0,0 +1,225 @@
+# agent/core/metrics.py
+
+import os
+from functools import lru_cache
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# ==========================================================
+# METRICS
+# ==========================================================
+# Module-level singletons, updated in place on the hot path.
+#
+# With PROMETHEUS_MULTIPROC_DIR set (it must be set, and emptied,
+# before the workers start), prometheus_client backs every value with
+# an mmap file per process and /metrics aggregates all of them, so any
+# uvicorn worker can answer a scrape for the whole server.
+
+# Upstream calls range from sub-second to the 420 s router budget
+UPSTREAM_BUCKETS = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 450.0,
+)
+
+FAST_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0,
+)
+
+ROUTER_REQUEST_SECONDS = Histogram(
+    "sentinel_router_request_seconds",
+    "Cortensor router call latency",
+    ["method", "session_id"],
+    buckets=UPSTREAM_BUCKETS,
+)
+
+ROUTER_ERRORS = Counter(
+    "sentinel_router_errors_total",
+    "Failed Cortensor router calls by kind (timeout, transport, http_<status>, circuit_open)",
+    ["method", "session_id", "kind"],
+)
+
+ROUTER_RETRIES = Counter(
+    "sentinel_router_retries_total",
+    "Cortensor router calls retried after a transient failure",
+    ["method", "session_id"],
+)
+
+ROUTER_HEDGES = Counter(
+    "sentinel_router_hedges_total",
+    "Hedged Cortensor router calls by which copy answered first",
+    ["method", "session_id", "winner"],
+)
+
+ROUTER_CIRCUIT_OPEN = Gauge(
+    "sentinel_router_circuit_open",
+    "1 while the circuit breaker for a session is open",
+    ["session_id"],
+    multiprocess_mode="livemax",
+)
+
+EVALUATIONS_IN_FLIGHT = Gauge(
+    "sentinel_evaluations_in_flight",
+    "Firewall evaluations currently running",
+    multiprocess_mode="livesum",
+)
+
+EVALUATION_SECONDS = Histogram(
+    "sentinel_evaluation_seconds",
+    "End-to-end Firewall.evaluate latency",
+    ["verdict"],
+    buckets=UPSTREAM_BUCKETS,
+)
+
+VERDICTS = Counter(
+    "sentinel_verdicts_total",
+    "Final verdicts",
+    ["verdict", "cache_hit"],
+)
+
+ESCALATION_DEPTH = Counter(
+    "sentinel_escalation_depth_total",
+    "Evaluations by number of validation levels run",
+    ["depth"],
+)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "sentinel_db_pool_wait_seconds",
+    "Time spent waiting for a Postgres pool connection",
+    buckets=FAST_BUCKETS,
+)
+
+SIGNING_SECONDS = Histogram(
+    "sentinel_signing_seconds",
+    "Ed25519 artifact signing time, including serialization",
+    buckets=FAST_BUCKETS,
+)
+
+
+ADMISSION_REJECTIONS = Counter(
+    "sentinel_admission_rejections_total",
+    "Evaluations turned away by admission control",
+    ["reason"],
+)
+
+ADMISSION_QUEUE_SECONDS = Histogram(
+    "sentinel_admission_queue_seconds",
+    "Time admitted evaluations waited for a slot",
+    buckets=FAST_BUCKETS + (2.5, 5.0, 10.0, 30.0),
+)
+
+
+LANE_IN_FLIGHT = Gauge(
+    "sentinel_lane_in_flight",
+    "Validation ladders running, by priority lane",
+    ["lane"],
+    multiprocess_mode="livesum",
+)
+
+LANE_QUEUE_DEPTH = Gauge(
+    "sentinel_lane_queue_depth",
+    "Validation ladders waiting for a slot, by priority lane",
+    ["lane"],
+    multiprocess_mode="livesum",
+)
+
+LANE_WAIT_SECONDS = Histogram(
+    "sentinel_lane_wait_seconds",
+    "Time validation ladders waited for a lane slot",
+    ["lane"],
+    buckets=FAST_BUCKETS + (2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+
+# Label children are resolved once per label set; later observations
+# skip the registry lookup entirely.
+
+@lru_cache(maxsize=None)
+def router_latency(method: str, session_id: int):
+    return ROUTER_REQUEST_SECONDS.labels(method, str(session_id))
+
+
+@lru_cache(maxsize=None)
+def lane_in_flight(lane: str):
+    return LANE_IN_FLIGHT.labels(lane)
+
+
+@lru_cache(maxsize=None)
+def lane_queue_depth(lane: str):
+    return LANE_QUEUE_DEPTH.labels(lane)
+
+
+@lru_cache(maxsize=None)
+def lane_wait(lane: str):
+    return LANE_WAIT_SECONDS.labels(lane)
+
+
+@lru_cache(maxsize=None)
+def router_errors(method: str, session_id: int, kind: str):
+    return ROUTER_ERRORS.labels(method, str(session_id), kind)
+
+
+@lru_cache(maxsize=None)
+def router_retries(method: str, session_id: int):
+    return ROUTER_RETRIES.labels(method, str(session_id))
+
+
+@lru_cache(maxsize=None)
+def router_hedges(method: str, session_id: int, winner: str):
+    return ROUTER_HEDGES.labels(method, str(session_id), winner)
+
+
+@lru_cache(maxsize=None)
+def router_circuit_open(session_id: int):
+    return ROUTER_CIRCUIT_OPEN.labels(str(session_id))
+
+
+def record_evaluation(verdict: str, cache_hit: bool, depth: int, seconds: float):
+
+    VERDICTS.labels(verdict, "true" if cache_hit else "false").inc()
+    EVALUATION_SECONDS.labels(verdict).observe(seconds)
+
+    if not cache_hit:
+        ESCALATION_DEPTH.labels(str(depth)).inc()
+
+
+# ==========================================================
+# EXPOSITION
+# ==========================================================
+
+def multiprocess_enabled() -> bool:
+    return bool(
+        os.getenv("PROMETHEUS_MULTIPROC_DIR")
+        or os.getenv("prometheus_multiproc_dir")
+    )
+
+
+def render() -> Tuple[bytes, str]:
+    """
+    Text exposition for /metrics, aggregated across worker processes
+    in multiprocess mode.
+    """
+
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drops a finished worker's live gauges from the aggregate."""
+
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
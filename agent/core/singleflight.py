@@ -0,0 +1,70 @@
+# agent/core/singleflight.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def normalize_objective(objective: str) -> str:
+    """
+    Collapses whitespace so trivially different submissions coalesce.
+    """
+    return " ".join(objective.split())
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller starts the work as a standalone task; later callers
+    with the same key await that task. Each caller waits through
+    asyncio.shield, so a caller that disconnects or is cancelled only
+    stops waiting — the shared work keeps running for everyone else
+    (and, once finished, still lands in the decision cache and DB).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+        self.started = 0
+        self.coalesced = 0
+        self.abandoned_waiters = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self.abandoned_waiters += 1
+            raise
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Mark the exception retrieved even if every waiter left
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "abandoned_waiters": self.abandoned_waiters,
+        }
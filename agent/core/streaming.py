@@ -0,0 +1,84 @@
+# agent/core/streaming.py
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+
+class StreamInterrupted(Exception):
+    """
+    A completion stream failed after tokens were already forwarded.
+    Not retried: a second stream would repeat them to the listener.
+    """
+
+
+# Returned by parse_stream_line() for the end-of-stream marker
+STREAM_DONE = object()
+
+
+def parse_stream_line(line: str) -> Any:
+    """
+    One line of an SSE or NDJSON completion stream -> event dict,
+    STREAM_DONE, or None for blank lines, comments and event names.
+    """
+
+    line = line.strip()
+
+    if not line or line.startswith(":") or line.startswith("event:"):
+        return None
+
+    if line.startswith("data:"):
+        line = line[5:].strip()
+
+    if line == "[DONE]":
+        return STREAM_DONE
+
+    return json.loads(line)
+
+
+def stream_event_text(event: Dict[str, Any]) -> str:
+    """Token text carried by a stream event ("" if none)."""
+
+    if "choices" in event and event["choices"]:
+        choice = event["choices"][0]
+        delta = choice.get("delta") or {}
+        return choice.get("text") or delta.get("content") or ""
+
+    for key in ("token", "text", "output", "data"):
+        value = event.get(key)
+        if isinstance(value, str):
+            return value
+
+    return ""
+
+
+class StreamedOutput:
+    """
+    Completion text assembled from a token stream.
+
+    Each chunk is hashed as it arrives (SHA-256 over the UTF-8 bytes,
+    the same digest sha256_hex gives for the joined text), so the
+    output hash is ready the moment the stream closes and the text is
+    joined exactly once.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._sha = hashlib.sha256()
+        self.task_id: Optional[str] = None
+        self.chunks = 0
+
+    def feed(self, text: str) -> None:
+        self._parts.append(text)
+        self._sha.update(text.encode())
+        self.chunks += 1
+
+    def result(self) -> Dict[str, Any]:
+        response = {
+            "output": "".join(self._parts),
+            "output_hash": self._sha.hexdigest(),
+            "chunks": self.chunks,
+        }
+        if self.task_id is not None:
+            response["task_id"] = self.task_id
+        return response
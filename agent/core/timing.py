@@ -0,0 +1,68 @@
+# agent/core/timing.py
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StageTimer:
+    """
+    Records start/end offsets for named pipeline stages.
+
+    Offsets are relative to the timer's creation so concurrent
+    stages can be compared on a single timeline. A stage that raised
+    or was cancelled is recorded with "failed": True.
+
+    Two perf_counter() reads and one small dict per stage, so it is
+    cheap enough to leave on for every request.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000.0
+
+    @contextmanager
+    def stage(self, name: str):
+        start = self._now_ms()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            end = self._now_ms()
+            self._stages[name] = {
+                "start_ms": round(start, 2),
+                "end_ms": round(end, 2),
+                "duration_ms": round(end - start, 2),
+            }
+            if failed:
+                self._stages[name]["failed"] = True
+
+    def mark(self, name: str) -> None:
+        """Records an instant (e.g. first streamed token) as a zero-length stage."""
+
+        now = round(self._now_ms(), 2)
+        self._stages[name] = {"start_ms": now, "end_ms": now, "duration_ms": 0.0}
+
+    def overlap_ms(self, first: str, second: str) -> float:
+        """
+        Wall-clock time during which both stages were running.
+        """
+
+        a = self._stages.get(first)
+        b = self._stages.get(second)
+
+        if not a or not b:
+            return 0.0
+
+        overlap = min(a["end_ms"], b["end_ms"]) - max(a["start_ms"], b["start_ms"])
+        return round(max(overlap, 0.0), 2)
+
+    def elapsed_ms(self) -> float:
+        return round(self._now_ms(), 2)
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(timing) for name, timing in self._stages.items()}
@@ -1,6 +1,6 @@
 # agent/core/trust_math.py
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 
 class TrustMath:
@@ -152,4 +152,147 @@ class TrustMath:
             ):
                 usable += 1
 
-        return usable >= minimum_required
\ No newline at end of file
+        return usable >= minimum_required
+
+
+class TrustAccumulator:
+    """
+    Streaming counterpart of the TrustMath pipeline.
+
+    Validator results are folded in one at a time (O(1) each) and the
+    current agreement, average confidence and composite can be read at
+    any point. Once every result is in, the values are identical to
+    TrustMath.weighted_validator_agreement / average_validator_confidence /
+    composite_confidence. Level weights scale each validator's
+    contribution, so several ladder levels can be pooled into one
+    accumulator.
+
+    bounds() brackets the final composite given validators still pending,
+    so callers can stop waiting once the threshold is guaranteed met or
+    guaranteed missed.
+    """
+
+    def __init__(self):
+        self.total_weight = 0.0
+        self.valid_weight = 0.0
+        self.score_sum = 0.0
+        self.score_weight = 0.0
+        self.seen = 0
+        self.usable = 0
+
+    # ==========================================================
+    # UPDATE
+    # ==========================================================
+
+    def update(self, result: Dict, level_weight: float = 1.0) -> None:
+
+        self.seen += 1
+
+        if level_weight <= 0:
+            return
+
+        try:
+            score = float(result.get("confidence_score", 0.0))
+            is_valid = bool(result.get("valid", False))
+        except Exception:
+            return
+
+        # Same rule as TrustMath: non-positive scores carry no evidence
+        if score <= 0:
+            return
+
+        self.usable += 1
+
+        self.total_weight += score * level_weight
+        if is_valid:
+            self.valid_weight += score * level_weight
+
+        self.score_sum += score * level_weight
+        self.score_weight += level_weight
+
+    def extend(self, results: Iterable[Dict], level_weight: float = 1.0) -> None:
+        for result in results:
+            self.update(result, level_weight)
+
+    # ==========================================================
+    # CURRENT VALUES
+    # ==========================================================
+
+    @staticmethod
+    def _ratio(numerator: float, denominator: float) -> float:
+        if denominator <= 0:
+            return 0.0
+        return round(min(max(numerator / denominator, 0.0), 1.0), 3)
+
+    @property
+    def agreement(self) -> float:
+        return self._ratio(self.valid_weight, self.total_weight)
+
+    @property
+    def average_confidence(self) -> float:
+        return self._ratio(self.score_sum, self.score_weight)
+
+    @property
+    def composite(self) -> float:
+        return TrustMath.composite_confidence(
+            self.agreement,
+            self.average_confidence,
+        )
+
+    # ==========================================================
+    # BOUNDS
+    # ==========================================================
+
+    def bounds(
+        self,
+        pending: Union[int, Sequence[Tuple[int, float]]] = 0,
+    ) -> Tuple[float, float]:
+        """
+        (lower, upper) bounds on the final composite.
+
+        pending is either a validator count (weight 1.0) or a list of
+        (count, level_weight) batches still outstanding. Each pending
+        validator may be valid or not, with any confidence in (0, 1],
+        or be malformed and ignored.
+        """
+
+        if isinstance(pending, int):
+            pending = [(pending, 1.0)]
+
+        extra = sum(
+            max(count, 0) * weight
+            for count, weight in pending
+            if weight > 0
+        )
+
+        lower = TrustMath.composite_confidence(
+            self._ratio(self.valid_weight, self.total_weight + extra),
+            self._ratio(self.score_sum, self.score_weight + extra),
+        )
+
+        upper = TrustMath.composite_confidence(
+            self._ratio(self.valid_weight + extra, self.total_weight + extra),
+            self._ratio(self.score_sum + extra, self.score_weight + extra),
+        )
+
+        return lower, max(upper, self.composite)
+
+    def decided(
+        self,
+        threshold: float,
+        pending: Union[int, Sequence[Tuple[int, float]]] = 0,
+    ) -> Optional[bool]:
+        """
+        True if the threshold is guaranteed met, False if guaranteed
+        missed, None while the pending validators could still swing it.
+        """
+
+        lower, upper = self.bounds(pending)
+
+        if lower >= threshold:
+            return True
+
+        if upper < threshold:
+            return False
+
+        return None
@@ -3,11 +3,16 @@ Sentinel FastAPI Application
 A REST API wrapper for the Sentinel trust firewall agent.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any
 import os
+import json
+import zlib
+import asyncio
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Import Sentinel components
@@ -15,8 +20,20 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from router_client import RouterClient
+from config.http import HttpSettings
 from agent.firewall import Firewall
 from agent.models import FinalVerdict
+from storage.cache import DecisionCache
+from storage.writer import DecisionWriter
+from storage.db import Database, decode_cursor
+from core.singleflight import SingleFlight, normalize_objective
+from core.lru import LRUCache
+from core.jobs import JobManager, JobQueueFull, FINISHED
+from core.concurrency import cancel_and_wait
+from core.admission import AdmissionController, AdmissionRejected
+from core.lanes import LaneScheduler
+from core.deadline import Deadline
+from core import metrics
 
 load_dotenv()
 
@@ -67,6 +84,15 @@ class EvaluateRequest(BaseModel):
         min_length=1,
         max_length=10000,
     )
+    priority: Optional[str] = Field(
+        None,
+        description="Scheduling lane (high, medium, low); defaults to the delegate's risk tier",
+    )
+    deadline_ms: Optional[int] = Field(
+        None,
+        description="End-to-end time budget; when it runs out the verdict is MANUAL_REVIEW with reason 'deadline'",
+        ge=1,
+    )
 
     class Config:
         json_schema_extra = {
@@ -76,6 +102,40 @@ class EvaluateRequest(BaseModel):
         }
 
 
+BATCH_MAX_ITEMS = int(os.getenv("SENTINEL_BATCH_MAX_ITEMS", "100"))
+BATCH_CONCURRENCY = int(os.getenv("SENTINEL_BATCH_CONCURRENCY", "8"))
+
+
+class BatchEvaluateRequest(BaseModel):
+    """Request model for batch evaluation endpoint"""
+    objectives: List[Annotated[str, Field(min_length=1, max_length=10000)]] = Field(
+        ...,
+        description="Governance decisions or objectives to validate",
+        min_length=1,
+        max_length=BATCH_MAX_ITEMS,
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description=f"Maximum evaluations in flight (default and cap: {BATCH_CONCURRENCY})",
+        ge=1,
+    )
+    priority: Optional[str] = Field(
+        None,
+        description="Scheduling lane for every objective in the batch",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "objectives": [
+                    "Approve $50,000 treasury allocation for new DeFi liquidity pool deployment",
+                    "Increase validator commission cap from 5% to 7%",
+                ],
+                "concurrency": 4,
+            }
+        }
+
+
 class ValidatorRun(BaseModel):
     """Individual validator run details"""
     redundancy_level: int
@@ -106,6 +166,12 @@ class EvaluateResponse(BaseModel):
     # Validator details
     validator_runs: Optional[List[ValidatorRun]] = Field(None, description="Individual validator results")
     threshold: Optional[float] = Field(None, description="Threshold applied for this decision")
+    cache_hit: bool = Field(False, description="True if served from the decision cache")
+    stage_timings: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description="Per-stage start_ms/end_ms/duration_ms relative to request start",
+    )
+    deadline_exceeded: bool = Field(False, description="True if the request deadline cut validation short")
 
     class Config:
         json_schema_extra = {
@@ -137,17 +203,211 @@ class HealthResponse(BaseModel):
 # Initialize Sentinel Agent
 # ============================================================================
 
-def get_firewall() -> Firewall:
-    """Initialize Firewall with RouterClient"""
+def get_router_client() -> RouterClient:
+    """Return the process-wide RouterClient bound to the shared HTTP pool"""
+    router_client = getattr(app.state, "router_client", None)
+    if router_client is not None:
+        return router_client
+
     try:
-        router_client = RouterClient()
-        return Firewall(router_client)
+        http_client = getattr(app.state, "http_client", None)
+        router_client = RouterClient(
+            http_client=http_client,
+            settings=getattr(app.state, "http_settings", None),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to initialize Sentinel: {str(e)}. Please check CORTENSOR_ROUTER_URL and CORTENSOR_API_KEY environment variables."
         )
 
+    # Without the shared pool (startup has not run) the client owns its
+    # own; it is still cached so that pool is created once and closed
+    # at shutdown
+    app.state.router_client = router_client
+
+    return router_client
+
+
+def get_firewall() -> Firewall:
+    """Initialize Firewall with the shared RouterClient, cache and writer"""
+    return Firewall(
+        get_router_client(),
+        cache=getattr(app.state, "decision_cache", None),
+        writer=getattr(app.state, "decision_writer", None),
+        db=getattr(app.state, "db", None),
+        admission=getattr(app.state, "admission", None),
+        lanes=getattr(app.state, "lanes", None),
+        stream_completion=getattr(app.state, "stream_completion", False),
+    )
+
+
+def resolve_priority(priority: Optional[str]) -> Optional[str]:
+    """Validate a caller-supplied lane; ignored when lanes are disabled"""
+    lanes = getattr(app.state, "lanes", None)
+    if priority is None or lanes is None:
+        return None
+    priority = priority.lower()
+    if not lanes.has_lane(priority):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown priority: {priority}"
+        )
+    return priority
+
+
+async def get_database() -> Database:
+    """Return the app-wide Database, connecting its pool on first use"""
+    db = getattr(app.state, "db", None)
+    if db is None:
+        db = app.state.db = Database()
+    await db.connect()
+    return db
+
+
+def get_read_cache() -> LRUCache:
+    """
+    Serialized decision payloads keyed by decision_id.
+    Signed artifacts are immutable, so entries never go stale.
+    """
+    read_cache = getattr(app.state, "read_cache", None)
+    if read_cache is None:
+        read_cache = app.state.read_cache = LRUCache(
+            max_entries=int(os.getenv("SENTINEL_READ_CACHE_MAX_ENTRIES", "10000")),
+            max_bytes=int(os.getenv("SENTINEL_READ_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+            sizer=lambda entry: len(entry[1]),
+        )
+    return read_cache
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+IMMUTABLE_CACHE_CONTROL = os.getenv(
+    "SENTINEL_DECISION_CACHE_CONTROL",
+    "public, max-age=31536000, immutable",
+)
+
+
+def get_singleflight() -> SingleFlight:
+    """Process-wide single-flight group for evaluations"""
+    singleflight = getattr(app.state, "singleflight", None)
+    if singleflight is None:
+        singleflight = app.state.singleflight = SingleFlight()
+    return singleflight
+
+
+async def run_evaluation(
+    objective: str,
+    priority: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
+):
+    """
+    Evaluate an objective, sharing the in-flight run with any concurrent
+    request for the same normalized objective. Normalization only builds
+    the coalescing key: the objective is evaluated as submitted (the
+    first caller's text and priority apply to a shared run).
+    
+    Requests with a deadline run on their own: a shared run cannot
+    honour several budgets at once.
+    """
+    firewall = get_firewall()
+    
+    if deadline is not None:
+        return await firewall.evaluate(
+            objective=objective,
+            priority=priority,
+            deadline=deadline,
+        )
+
+    return await get_singleflight().do(
+        normalize_objective(objective),
+        lambda: firewall.evaluate(objective=objective, priority=priority),
+    )
+
+
+def to_evaluate_response(response) -> EvaluateResponse:
+    """Map a Firewall AgentResponse onto the public response model"""
+    return EvaluateResponse(
+        output=response.output,
+        final_verdict=response.final_verdict.value if isinstance(response.final_verdict, FinalVerdict) else response.final_verdict,
+        confidence=response.confidence,
+        total_attempts=response.total_attempts,
+        escalation_path=response.escalation_path,
+        total_latency_ms=response.total_latency_ms,
+        decision_reason=response.decision_reason,
+        decision_id=response.decision_id,
+        artifact_hash=response.artifact_hash,
+        signature=response.signature,
+        timestamp=response.timestamp,
+        validator_runs=response.validator_runs,
+        threshold=response.threshold,
+        cache_hit=response.cache_hit,
+        stage_timings=response.stage_timings,
+        deadline_exceeded=response.deadline_exceeded,
+    )
+
+
+JOB_ADMISSION_RETRIES = int(os.getenv("SENTINEL_JOB_ADMISSION_RETRIES", "3"))
+
+
+async def evaluate_to_dict(
+    objective: str,
+    priority: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
+    """
+    Job runner: evaluate and return the EvaluateResponse payload.
+    Jobs are already queued, so admission rejections are retried up to
+    JOB_ADMISSION_RETRIES times (never past the deadline); after that
+    the rejection fails the job.
+    """
+    for attempt in range(JOB_ADMISSION_RETRIES + 1):
+        try:
+            response = await run_evaluation(objective, priority, deadline)
+        except AdmissionRejected as e:
+            out_of_time = (
+                deadline is not None and e.retry_after >= deadline.remaining()
+            )
+            if attempt == JOB_ADMISSION_RETRIES or out_of_time:
+                raise
+            await asyncio.sleep(e.retry_after)
+            continue
+        return to_evaluate_response(response).model_dump()
+
+
+def admission_http_error(e: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=e.status_code,
+        detail=e.reason,
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+def get_job_manager() -> JobManager:
+    job_manager = getattr(app.state, "job_manager", None)
+    if job_manager is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Job mode is disabled"
+        )
+    return job_manager
+
+
+def sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SENTINEL_SSE_KEEPALIVE", "15"))
+
 
 # ============================================================================
 # API Endpoints
@@ -181,6 +441,37 @@ async def health_check():
     }
 
 
+@app.get("/api/stats", tags=["General"])
+async def stats():
+    """Runtime counters for in-process components"""
+    decision_cache = getattr(app.state, "decision_cache", None)
+    decision_writer = getattr(app.state, "decision_writer", None)
+    db = getattr(app.state, "db", None)
+    job_manager = getattr(app.state, "job_manager", None)
+    admission = getattr(app.state, "admission", None)
+    lanes = getattr(app.state, "lanes", None)
+    router_client = getattr(app.state, "router_client", None)
+
+    return {
+        "decision_cache": decision_cache.stats() if decision_cache else None,
+        "singleflight": get_singleflight().stats(),
+        "decision_writer": decision_writer.stats() if decision_writer else None,
+        "database": db.stats() if db else None,
+        "decision_read_cache": get_read_cache().stats(),
+        "jobs": job_manager.stats() if job_manager else None,
+        "admission": admission.stats() if admission else None,
+        "lanes": lanes.stats() if lanes else None,
+        "router": router_client.stats() if router_client else None,
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus text exposition, aggregated across uvicorn workers"""
+    content, content_type = metrics.render()
+    return Response(content=content, headers={"Content-Type": content_type})
+
+
 @app.post("/api/test", tags=["Testing"])
 async def test_endpoint(request: EvaluateRequest):
     """
@@ -215,33 +506,17 @@ async def evaluate_objective(request: EvaluateRequest):
     - Cryptographic artifact
     """
     
-    # Initialize Firewall
-    firewall = get_firewall()
+    priority = resolve_priority(request.priority)
+    deadline = Deadline.from_ms(request.deadline_ms)
     
     try:
-        # Call the main Firewall.evaluate() method
-        response = await firewall.evaluate(objective=request.objective)
+        # Concurrent identical objectives share one Firewall.evaluate() run
+        response = await run_evaluation(request.objective, priority, deadline)
         
-        # The regular Firewall returns AgentResponse with basic fields
-        # We don't have artifact details, validator_runs, etc.
-        
-        return EvaluateResponse(
-            output=response.output,
-            final_verdict=response.final_verdict.value if isinstance(response.final_verdict, FinalVerdict) else response.final_verdict,
-            confidence=response.confidence,
-            total_attempts=response.total_attempts,
-            escalation_path=response.escalation_path,
-            total_latency_ms=response.total_latency_ms,
-            decision_reason=response.decision_reason,
-            # These fields won't be available from regular Firewall
-            decision_id=None,
-            artifact_hash=None,
-            signature=None,
-            timestamp=None,
-            validator_runs=None,
-            threshold=None,
-        )
+        return to_evaluate_response(response)
         
+    except AdmissionRejected as e:
+        raise admission_http_error(e)
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -259,31 +534,397 @@ async def evaluate_objective(request: EvaluateRequest):
         )
 
 
+@app.post("/api/evaluate/stream", tags=["Evaluation"])
+async def evaluate_stream(request: EvaluateRequest):
+    """
+    Evaluate with live progress over Server-Sent Events.
+    
+    Events, in order:
+    - delegate: recommended_redundancy and task_id
+    - token: completion text chunks as they arrive (with
+      SENTINEL_STREAM_COMPLETION enabled)
+    - completion: task_id and output (may arrive before delegate)
+    - plan: threshold and escalation_plan for the risk tier
+    - level: one per scored ladder level, with its composite and threshold
+    - verdict: final verdict, decision_id and artifact_hash
+    - result: the full EvaluateResponse (or `error`)
+    
+    Closing the connection cancels any upstream calls still in flight.
+    Unlike POST /api/evaluate, the run is not shared with concurrent
+    identical requests, so cancelling it never affects another caller.
+    """
+    firewall = get_firewall()
+    objective = request.objective
+    priority = resolve_priority(request.priority)
+    deadline = Deadline.from_ms(request.deadline_ms)
+    
+    async def events():
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def on_event(event: str, data: Dict[str, Any]):
+            queue.put_nowait((event, data))
+        
+        task = asyncio.ensure_future(
+            firewall.evaluate(
+                objective=objective,
+                on_event=on_event,
+                priority=priority,
+                deadline=deadline,
+            )
+        )
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=SSE_KEEPALIVE_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                if item is None:
+                    break
+                
+                yield sse_event(*item)
+            
+            try:
+                response = task.result()
+            except AdmissionRejected as e:
+                yield sse_event(
+                    "error",
+                    {
+                        "detail": e.reason,
+                        "status_code": e.status_code,
+                        "retry_after": e.retry_after,
+                    },
+                )
+                return
+            except Exception as e:
+                yield sse_event("error", {"detail": str(e)})
+                return
+            
+            yield sse_event("result", to_evaluate_response(response).model_dump())
+        
+        finally:
+            # Client went away mid-evaluation: stop paying for upstream calls
+            if not task.done():
+                await cancel_and_wait([task])
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/evaluate/batch", tags=["Evaluation"])
+async def evaluate_batch(request: BatchEvaluateRequest):
+    """
+    Evaluate many objectives in one call.
+    
+    Objectives run through the same pipeline as POST /api/evaluate,
+    sharing the app's HTTP pool, DB pool, decision cache and
+    single-flight group, with at most `concurrency` evaluations in
+    flight. Artifacts are persisted in bulk by the write-behind queue.
+    
+    The response is NDJSON, one line per objective in completion order:
+    - {"index": i, "status": "ok", "result": {...EvaluateResponse...}}
+    - {"index": i, "status": "error", "error": "..."}
+    followed by a final {"summary": {...}} line. A failing objective
+    never fails the rest of the batch.
+    """
+    limit = min(request.concurrency or BATCH_CONCURRENCY, BATCH_CONCURRENCY)
+    priority = resolve_priority(request.priority)
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def evaluate_one(index: int, objective: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                response = await run_evaluation(objective, priority)
+            except AdmissionRejected as e:
+                return {
+                    "index": index,
+                    "status": "error",
+                    "error": e.reason,
+                    "status_code": e.status_code,
+                    "retry_after": e.retry_after,
+                }
+            except HTTPException as e:
+                return {"index": index, "status": "error", "error": e.detail}
+            except Exception as e:
+                return {"index": index, "status": "error", "error": str(e)}
+        
+        return {
+            "index": index,
+            "status": "ok",
+            "result": to_evaluate_response(response).model_dump(),
+        }
+    
+    async def ndjson_results():
+        tasks = [
+            asyncio.ensure_future(evaluate_one(index, objective))
+            for index, objective in enumerate(request.objectives)
+        ]
+        succeeded = 0
+        
+        try:
+            for finished in asyncio.as_completed(tasks):
+                item = await finished
+                succeeded += item["status"] == "ok"
+                yield json.dumps(item, separators=(",", ":")) + "\n"
+        finally:
+            # Client went away: stop queued items from starting
+            for task in tasks:
+                task.cancel()
+        
+        summary = {
+            "total": len(tasks),
+            "succeeded": succeeded,
+            "failed": len(tasks) - succeeded,
+            "concurrency": limit,
+        }
+        yield json.dumps({"summary": summary}, separators=(",", ":")) + "\n"
+    
+    return StreamingResponse(
+        ndjson_results(),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post("/api/jobs", status_code=202, tags=["Jobs"])
+async def submit_job(request: EvaluateRequest):
+    """
+    Queue an evaluation and return its job id immediately.
+    
+    Poll GET /api/jobs/{job_id} or subscribe to
+    GET /api/jobs/{job_id}/events for the result. Returns 503 when the
+    job queue is full. `deadline_ms` counts from submission, so time
+    spent queued is part of the budget.
+    """
+    job_manager = get_job_manager()
+    priority = resolve_priority(request.priority)
+    deadline = Deadline.from_ms(request.deadline_ms)
+    
+    try:
+        job = await job_manager.submit(request.objective, priority, deadline)
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+    
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.job_id}",
+        "events_url": f"/api/jobs/{job.job_id}/events",
+    }
+
+
+@app.get("/api/jobs/{job_id}", tags=["Jobs"])
+async def get_job(job_id: str):
+    """
+    Current state of a job: queued, running, succeeded or failed.
+    `result` holds the EvaluateResponse once the job has succeeded.
+    """
+    job = await get_job_manager().get(job_id)
+    
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job not found: {job_id}"
+        )
+    
+    return job
+
+
+@app.get("/api/jobs/{job_id}/events", tags=["Jobs"])
+async def job_events(job_id: str):
+    """
+    Server-Sent Events for one job.
+    
+    Emits `status` with the current state, then `result` (or `error`)
+    when the job finishes, and closes. Comment lines keep idle
+    connections open through proxies.
+    """
+    job_manager = get_job_manager()
+    state = await job_manager.get(job_id)
+    
+    if state is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job not found: {job_id}"
+        )
+    
+    async def events():
+        current = state
+        yield sse_event("status", current)
+        
+        while current["status"] not in FINISHED:
+            job = job_manager.local(job_id)
+            
+            if job is not None:
+                # Owned here: wake up as soon as the job finishes. On
+                # timeout wait_for cancels the wait, leaving no waiter
+                # behind on the event.
+                try:
+                    await asyncio.wait_for(
+                        job.done.wait(),
+                        timeout=SSE_KEEPALIVE_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+            else:
+                # Owned by another worker process: follow the jobs table
+                await asyncio.sleep(SSE_KEEPALIVE_SECONDS)
+                yield ": keepalive\n\n"
+            
+            current = await job_manager.get(job_id) or current
+        
+        yield sse_event(
+            "result" if current["status"] == "succeeded" else "error",
+            current,
+        )
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/decisions/export", tags=["Decisions"])
+async def export_decisions(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    verdict: Optional[str] = None,
+    cursor: Optional[str] = None,
+    gzip: bool = False,
+):
+    """
+    Stream the full decision history as NDJSON, oldest first.
+    
+    Query parameters:
+    - since / until: created_at range (ISO 8601, until is exclusive)
+    - verdict: Only export decisions with this final_verdict
+    - cursor: Resume after the line carrying this "cursor" value
+    - gzip: Compress the stream (Content-Encoding: gzip)
+    
+    Each line is one decision with its validator runs and a "cursor"
+    token. Rows are read through a server-side cursor and written in
+    chunks, so memory stays flat regardless of export size.
+    """
+    batch_size = int(os.getenv("SENTINEL_EXPORT_BATCH_SIZE", "500"))
+    
+    try:
+        db = await get_database()
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid request: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error: {str(e)}"
+        )
+    
+    async def ndjson_chunks():
+        compressor = zlib.compressobj(wbits=31) if gzip else None
+        lines = []
+        
+        def encode(chunk: bytes) -> bytes:
+            return compressor.compress(chunk) if compressor else chunk
+        
+        async for decision, resume in db.stream_decisions(
+            since=since,
+            until=until,
+            final_verdict=verdict,
+            cursor=cursor,
+            prefetch=batch_size,
+        ):
+            decision["cursor"] = resume
+            lines.append(json.dumps(decision, separators=(",", ":")))
+            
+            if len(lines) >= batch_size:
+                chunk = encode(("\n".join(lines) + "\n").encode())
+                lines.clear()
+                if chunk:
+                    yield chunk
+        
+        tail = ("\n".join(lines) + "\n").encode() if lines else b""
+        if compressor:
+            yield compressor.compress(tail) + compressor.flush()
+        elif tail:
+            yield tail
+    
+    headers = {"Content-Encoding": "gzip"} if gzip else {}
+    
+    return StreamingResponse(
+        ndjson_chunks(),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
 @app.get("/api/decisions/{decision_id}", tags=["Decisions"])
-async def get_decision(decision_id: str):
+async def get_decision(
+    decision_id: str,
+    if_none_match: Optional[str] = Header(None),
+):
     """
     Retrieve a specific decision artifact by ID.
     
     This endpoint queries the database for a stored decision.
     Useful for audit trails and verification.
+    
+    Artifacts are immutable once signed: responses carry a strong ETag
+    derived from artifact_hash and long-lived Cache-Control headers, and
+    If-None-Match returns 304. Payloads are served from an in-process
+    LRU after the first read.
     """
+    read_cache = get_read_cache()
+    
     try:
-        from storage.db import Database
+        cached = read_cache.get(decision_id)
         
-        db = Database()
-        await db.connect()
-        
-        decision = await db.get_decision(decision_id)
+        if cached is None:
+            db = await get_database()
+            decision = await db.get_decision(decision_id)
+            
+            if not decision:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Decision {decision_id} not found"
+                )
+            
+            cached = (
+                f'"{decision["artifact_hash"]}"',
+                json.dumps(decision, separators=(",", ":")).encode(),
+            )
+            read_cache.put(decision_id, cached)
         
-        await db.close()
+        etag, body = cached
+        headers = {
+            "ETag": etag,
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        }
         
-        if not decision:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Decision {decision_id} not found"
-            )
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
         
-        return decision
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=headers,
+        )
         
     except HTTPException:
         raise
@@ -295,14 +936,20 @@ async def get_decision(decision_id: str):
 
 
 @app.get("/api/decisions", tags=["Decisions"])
-async def list_decisions(limit: int = 10):
+async def list_decisions(
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    verdict: Optional[str] = None,
+):
     """
-    List recent decisions.
+    List decisions, most recent first, with cursor-based pagination.
     
     Query parameters:
-    - limit: Maximum number of decisions to return (default: 10, max: 100)
+    - limit: Page size (default: 10, max: 100)
+    - cursor: next_cursor from the previous page
+    - verdict: Only return decisions with this final_verdict
     
-    Returns decisions ordered by creation time, most recent first.
+    Pages are fetched by keyset, so deep pages cost the same as the first.
     """
     if limit > 100:
         raise HTTPException(
@@ -310,21 +957,31 @@ async def list_decisions(limit: int = 10):
             detail="Limit cannot exceed 100"
         )
     
+    if limit < 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Limit must be at least 1"
+        )
+    
     try:
-        from storage.db import Database
-        
-        db = Database()
-        await db.connect()
-        
-        decisions = await db.list_recent_decisions(limit=limit)
-        
-        await db.close()
+        db = await get_database()
+        decisions, next_cursor = await db.list_decisions_page(
+            limit=limit,
+            cursor=cursor,
+            final_verdict=verdict,
+        )
         
         return {
             "count": len(decisions),
-            "decisions": decisions
+            "decisions": decisions,
+            "next_cursor": next_cursor,
         }
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid request: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -342,6 +999,67 @@ async def startup_event():
     print("🛡️  Sentinel API starting...")
     print(f"📡 Cortensor URL: {os.getenv('CORTENSOR_ROUTER_URL', 'NOT CONFIGURED')}")
     print(f"💾 Database: {'CONFIGURED' if os.getenv('DATABASE_URL') else 'NOT CONFIGURED'}")
+
+    settings = HttpSettings.from_env()
+    app.state.http_settings = settings
+    app.state.http_client = RouterClient.create_http_client(settings)
+    print(
+        f"🔌 Router pool: max={settings.max_connections} "
+        f"keepalive={settings.max_keepalive_connections} "
+        f"http2={settings.http2}"
+    )
+
+    # One pool for the whole process: writer, cache and endpoints
+    db = app.state.db = Database()
+    try:
+        await db.connect()
+        applied = await db.migrate()
+        if applied:
+            print(f"🧱 Applied migrations: {applied}")
+        print(f"🏊 DB pool: min={db.min_size} max={db.max_size}")
+    except Exception as e:
+        print(f"⚠️  Database unavailable at startup: {e}")
+
+    if os.getenv("SENTINEL_CACHE_ENABLED", "True").lower() == "true":
+        persistent = os.getenv("SENTINEL_CACHE_PERSISTENT", "False").lower() == "true"
+        app.state.decision_cache = DecisionCache.from_env(
+            db=db if persistent else None
+        )
+        print(f"🗄️  Decision cache: persistent={persistent}")
+
+    if os.getenv("SENTINEL_WRITE_BEHIND", "True").lower() == "true":
+        decision_writer = DecisionWriter.from_env(db=db)
+        await decision_writer.start()
+        app.state.decision_writer = decision_writer
+        print(f"📝 Write-behind queue: capacity={decision_writer.capacity}")
+
+    if os.getenv("SENTINEL_ADMISSION_ENABLED", "True").lower() == "true":
+        admission = app.state.admission = AdmissionController.from_env()
+        print(
+            f"🚦 Admission: max_in_flight={admission.max_in_flight} "
+            f"queue={admission.max_queue} adaptive={admission.adaptive}"
+        )
+
+    app.state.stream_completion = (
+        os.getenv("SENTINEL_STREAM_COMPLETION", "False").lower() == "true"
+    )
+    if app.state.stream_completion:
+        print("🌊 Streaming completions enabled")
+
+    if os.getenv("SENTINEL_LANES_ENABLED", "False").lower() == "true":
+        lanes = app.state.lanes = LaneScheduler.from_env()
+        print(f"🛣️  Priority lanes: capacity={lanes.capacity}")
+
+    if os.getenv("SENTINEL_JOBS_ENABLED", "True").lower() == "true":
+        persistent = os.getenv("SENTINEL_JOBS_PERSISTENT", "False").lower() == "true"
+        job_manager = JobManager.from_env(
+            runner=evaluate_to_dict,
+            db=db if persistent else None,
+        )
+        await job_manager.start()
+        app.state.job_manager = job_manager
+        print(f"🧵 Job workers: {job_manager.workers} persistent={persistent}")
+
     print("✅ Sentinel API ready")
 
 
@@ -350,6 +1068,36 @@ async def shutdown_event():
     """Runs on application shutdown"""
     print("🛡️  Sentinel API shutting down...")
 
+    # Stop running jobs first; their decisions still go through the writer
+    job_manager = getattr(app.state, "job_manager", None)
+    if job_manager is not None:
+        await job_manager.close()
+        app.state.job_manager = None
+
+    # Flush queued decisions before anything else is torn down
+    decision_writer = getattr(app.state, "decision_writer", None)
+    if decision_writer is not None:
+        await decision_writer.close()
+        app.state.decision_writer = None
+
+    # Closes the client's own pool, if it has one
+    router_client = getattr(app.state, "router_client", None)
+    if router_client is not None:
+        await router_client.aclose()
+        app.state.router_client = None
+
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+        app.state.http_client = None
+
+    db = getattr(app.state, "db", None)
+    if db is not None:
+        await db.close()
+        app.state.db = None
+
+    metrics.mark_process_dead(os.getpid())
+
 
 # ============================================================================
 # Run with: uvicorn main:app --reload --host 0.0.0.0 --port 8000
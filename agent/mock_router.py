@@ -0,0 +1,446 @@
+"""
+Mock Cortensor Router
+A local stand-in for the router behind CORTENSOR_ROUTER_URL, for load
+testing and regression runs without network access.
+
+Serves /api/v2/delegate, /api/v2/completions/{session_id} (plain and
+streamed) and /api/v2/validate with the response shapes Sentinel reads,
+with per-session latency distributions, error and timeout injection,
+and a deterministic seed.
+
+Run with:
+    MOCK_ROUTER_SEED=7 uvicorn mock_router:app --port 9000
+    CORTENSOR_ROUTER_URL=http://localhost:9000 CORTENSOR_API_KEY=mock \\
+        uvicorn main:app --port 8000
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import json
+import math
+import random
+import asyncio
+import hashlib
+import itertools
+from collections import Counter
+from datetime import datetime, timezone
+
+
+# ============================================================================
+# Session Profiles
+# ============================================================================
+#
+# MOCK_ROUTER_SESSIONS holds JSON keyed by session id; every key is
+# optional and falls back to the "default" profile, e.g.
+#
+#   {"default": {"latency": {"dist": "lognormal", "median": 1.0, "sigma": 0.5}},
+#    "67": {"miners": 3, "error_rate": 0.02, "timeout_rate": 0.01},
+#    "79": {"miners": 5, "confidence": [0.9, 0.05]}}
+#
+# Latency distributions (seconds):
+#   {"dist": "fixed", "value": 0.5}
+#   {"dist": "uniform", "low": 0.2, "high": 2.0}
+#   {"dist": "lognormal", "median": 1.0, "sigma": 0.5}
+#   {"dist": "exponential", "mean": 1.0}
+# MOCK_ROUTER_LATENCY_SCALE multiplies every draw (0 for no latency).
+
+DEFAULT_SESSIONS = {
+    "default": {
+        "latency": {"dist": "lognormal", "median": 1.0, "sigma": 0.5},
+        "miners": 3,
+    },
+    "78": {
+        "latency": {"dist": "lognormal", "median": 0.8, "sigma": 0.4},
+        "miners": 1,
+        "confidence": [0.75, 0.12],
+    },
+    "67": {
+        "latency": {"dist": "lognormal", "median": 1.5, "sigma": 0.5},
+        "miners": 3,
+        "confidence": [0.82, 0.08],
+    },
+    "79": {
+        "latency": {"dist": "lognormal", "median": 2.5, "sigma": 0.6},
+        "miners": 5,
+        "confidence": [0.9, 0.05],
+    },
+}
+
+# Delegate's recommended redundancy, drawn per objective
+DEFAULT_REDUNDANCY_MIX = {1: 0.5, 3: 0.35, 5: 0.15}
+
+RISK_BY_REDUNDANCY = {1: "low", 3: "medium", 5: "high"}
+
+WORDS = (
+    "allocation risk treasury proposal review approved budget controls "
+    "exposure liquidity governance mitigation threshold analysis transfer "
+    "compliance signer quorum audit policy reserve"
+).split()
+
+
+@dataclass(frozen=True)
+class SessionProfile:
+    latency: Dict[str, Any] = field(
+        default_factory=lambda: {"dist": "fixed", "value": 0.5}
+    )
+    miners: int = 3
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    # (mean, stddev) of each miner's confidence_score
+    confidence: Tuple[float, float] = (0.85, 0.08)
+    # Share of miners that judge the output valid
+    valid_rate: float = 0.95
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], base: "SessionProfile") -> "SessionProfile":
+        return cls(
+            latency=raw.get("latency", base.latency),
+            miners=int(raw.get("miners", base.miners)),
+            error_rate=float(raw.get("error_rate", base.error_rate)),
+            timeout_rate=float(raw.get("timeout_rate", base.timeout_rate)),
+            confidence=tuple(raw.get("confidence", base.confidence)),
+            valid_rate=float(raw.get("valid_rate", base.valid_rate)),
+        )
+
+
+def draw_latency(spec: Dict[str, Any], rng: random.Random) -> float:
+    dist = spec.get("dist", "fixed")
+
+    if dist == "fixed":
+        return float(spec.get("value", 0.0))
+
+    if dist == "uniform":
+        return rng.uniform(float(spec["low"]), float(spec["high"]))
+
+    if dist == "lognormal":
+        return rng.lognormvariate(math.log(float(spec["median"])), float(spec["sigma"]))
+
+    if dist == "exponential":
+        return rng.expovariate(1.0 / float(spec["mean"]))
+
+    raise ValueError(f"Unknown latency distribution: {dist}")
+
+
+class MockRouterConfig:
+    """Session profiles, seed and global knobs, read from MOCK_ROUTER_*."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        sessions: Optional[Dict[str, Dict[str, Any]]] = None,
+        latency_scale: float = 1.0,
+        max_hang: float = 30.0,
+        tokens: int = 64,
+        redundancy_mix: Optional[Dict[int, float]] = None,
+    ):
+        self.seed = seed
+        self.latency_scale = latency_scale
+        self.max_hang = max_hang
+        self.tokens = tokens
+        self.redundancy_mix = redundancy_mix or DEFAULT_REDUNDANCY_MIX
+
+        # Overrides refine the built-in profile for the same key
+        merged = {key: dict(raw) for key, raw in DEFAULT_SESSIONS.items()}
+        for key, raw in (sessions or {}).items():
+            merged.setdefault(key, {}).update(raw)
+
+        self.default = SessionProfile.from_dict(
+            merged.get("default", {}), SessionProfile()
+        )
+        self.sessions = {
+            int(key): SessionProfile.from_dict(raw, self.default)
+            for key, raw in merged.items()
+            if key != "default"
+        }
+
+    @classmethod
+    def from_env(cls) -> "MockRouterConfig":
+        sessions = os.getenv("MOCK_ROUTER_SESSIONS", "")
+        mix = os.getenv("MOCK_ROUTER_REDUNDANCY_MIX", "")
+        return cls(
+            seed=int(os.getenv("MOCK_ROUTER_SEED", "0")),
+            sessions=json.loads(sessions) if sessions else None,
+            latency_scale=float(os.getenv("MOCK_ROUTER_LATENCY_SCALE", "1.0")),
+            max_hang=float(os.getenv("MOCK_ROUTER_MAX_HANG", "30")),
+            tokens=int(os.getenv("MOCK_ROUTER_TOKENS", "64")),
+            redundancy_mix={
+                int(level): float(share)
+                for level, share in (
+                    item.split(":", 1) for item in mix.split(",") if item.strip()
+                )
+            } or None,
+        )
+
+    def profile(self, session_id: int) -> SessionProfile:
+        return self.sessions.get(session_id, self.default)
+
+
+# ============================================================================
+# Initialize Mock Router
+# ============================================================================
+
+app = FastAPI(
+    title="Mock Cortensor Router",
+    description="Offline stand-in for the Cortensor router v2 API",
+    version="1.0.0",
+)
+
+config = MockRouterConfig.from_env()
+
+# Calls per (method, session), so each call's draws depend only on the
+# seed and how many calls that session has already served
+call_counts: Counter = Counter()
+outcomes: Counter = Counter()
+task_ids = itertools.count(1)
+
+
+def call_rng(method: str, session_id: int) -> random.Random:
+    """Deterministic RNG for the next call to (method, session)."""
+    call_counts[(method, session_id)] += 1
+    n = call_counts[(method, session_id)]
+    return random.Random(f"{config.seed}:{method}:{session_id}:{n}")
+
+
+def next_task_id(prefix: str) -> str:
+    return f"{prefix}-{config.seed}-{next(task_ids):08d}"
+
+
+def text_rng(text: str) -> random.Random:
+    """Same text, same draws, regardless of call order."""
+    digest = hashlib.sha256(f"{config.seed}:{text}".encode()).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def budget_seconds(payload: Dict[str, Any]) -> float:
+    """The caller's router-side timeout, as a hang limit."""
+    policy = payload.get("policy") or {}
+    if "timeout_ms" in policy:
+        return float(policy["timeout_ms"]) / 1000.0
+    if "timeout" in payload:
+        return float(payload["timeout"])
+    return config.max_hang
+
+
+async def simulate(method: str, session_id: int, payload: Dict[str, Any]):
+    """
+    Sleeps for the session's latency draw, or injects a failure.
+    Returns (rng, None) to proceed, or (rng, JSONResponse) to reply with.
+    """
+
+    profile = config.profile(session_id)
+    rng = call_rng(method, session_id)
+    roll = rng.random()
+
+    if roll < profile.timeout_rate:
+        # Hang until the caller's budget runs out, then time out
+        outcomes[(method, session_id, "timeout")] += 1
+        await asyncio.sleep(min(budget_seconds(payload), config.max_hang))
+        return rng, JSONResponse(
+            status_code=504,
+            content={"error": "timeout", "message": "Task did not complete in time"},
+        )
+
+    if roll < profile.timeout_rate + profile.error_rate:
+        outcomes[(method, session_id, "error")] += 1
+        status = rng.choice((500, 502, 503, 429))
+        await asyncio.sleep(
+            draw_latency(profile.latency, rng) * config.latency_scale * 0.1
+        )
+        return rng, JSONResponse(
+            status_code=status,
+            content={"error": "injected", "status": status},
+        )
+
+    outcomes[(method, session_id, "ok")] += 1
+    await asyncio.sleep(draw_latency(profile.latency, rng) * config.latency_scale)
+    return rng, None
+
+
+def pick_redundancy(objective: str) -> int:
+    rng = text_rng(objective)
+    roll = rng.random() * sum(config.redundancy_mix.values())
+
+    for level, share in sorted(config.redundancy_mix.items()):
+        roll -= share
+        if roll <= 0:
+            return level
+
+    return max(config.redundancy_mix)
+
+
+def generate_output(prompt: str) -> List[str]:
+    """Completion text as a list of tokens (words with trailing spaces)."""
+    rng = text_rng(prompt)
+    words = [rng.choice(WORDS) for _ in range(config.tokens)]
+    words[0] = words[0].capitalize()
+    return [word + " " for word in words[:-1]] + [words[-1] + "."]
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ============================================================================
+# API Endpoints
+# ============================================================================
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy", "seed": config.seed}
+
+
+@app.get("/mock/stats")
+async def stats():
+    """Calls and injected outcomes per method and session"""
+    return {
+        "seed": config.seed,
+        "calls": {
+            f"{method}:{session}": count
+            for (method, session), count in sorted(call_counts.items())
+        },
+        "outcomes": {
+            f"{method}:{session}:{outcome}": count
+            for (method, session, outcome), count in sorted(outcomes.items())
+        },
+    }
+
+
+@app.post("/api/v2/delegate")
+async def delegate(request: Request):
+    payload = await request.json()
+    session_id = int(payload.get("session_id", 0))
+
+    _, failure = await simulate("delegate", session_id, payload)
+    if failure is not None:
+        return failure
+
+    input_data = (payload.get("input") or {}).get("payload", "")
+    redundancy = pick_redundancy(str(input_data))
+
+    return {
+        "task_id": next_task_id("delegate"),
+        "request_id": payload.get("request_id"),
+        "session_id": session_id,
+        "status": "completed",
+        "cortensor_policy": {
+            "tier": (payload.get("policy") or {}).get("tier", "balanced"),
+            "redundancy": redundancy,
+        },
+        "risk_assessment": {
+            "risk_level": RISK_BY_REDUNDANCY.get(redundancy, "medium"),
+        },
+        "created_at": now_iso(),
+    }
+
+
+@app.post("/api/v2/completions/{session_id}")
+async def completions(session_id: int, request: Request):
+    payload = await request.json()
+    prompt = str(payload.get("prompt", ""))
+    task_id = next_task_id("completion")
+
+    if not payload.get("stream"):
+        _, failure = await simulate("completion", session_id, payload)
+        if failure is not None:
+            return failure
+
+        tokens = generate_output(prompt)
+        return {
+            "task_id": task_id,
+            "session_id": session_id,
+            "object": "text_completion",
+            "choices": [
+                {"index": 0, "text": "".join(tokens), "finish_reason": "stop"}
+            ],
+            "usage": {"completion_tokens": len(tokens)},
+        }
+
+    # Streamed: the latency draw is spread across the tokens
+    profile = config.profile(session_id)
+    rng = call_rng("completion", session_id)
+    roll = rng.random()
+
+    if roll < profile.timeout_rate:
+        outcomes[("completion", session_id, "timeout")] += 1
+        await asyncio.sleep(min(budget_seconds(payload), config.max_hang))
+        return JSONResponse(status_code=504, content={"error": "timeout"})
+
+    if roll < profile.timeout_rate + profile.error_rate:
+        outcomes[("completion", session_id, "error")] += 1
+        return JSONResponse(status_code=503, content={"error": "injected"})
+
+    outcomes[("completion", session_id, "ok")] += 1
+    tokens = generate_output(prompt)
+    per_token = (
+        draw_latency(profile.latency, rng) * config.latency_scale / len(tokens)
+    )
+
+    async def events():
+        for token in tokens:
+            await asyncio.sleep(per_token)
+            chunk = {"task_id": task_id, "choices": [{"index": 0, "text": token}]}
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.post("/api/v2/validate")
+async def validate(request: Request):
+    payload = await request.json()
+    session_id = int(payload.get("session_id", 0))
+    profile = config.profile(session_id)
+
+    rng, failure = await simulate("validate", session_id, payload)
+    if failure is not None:
+        return failure
+
+    output = (payload.get("claim") or {}).get("output", "")
+    data_hash = hashlib.sha256(str(output).encode()).hexdigest()
+    mean, stddev = profile.confidence
+
+    results = []
+    for index in range(profile.miners):
+        confidence = round(min(max(rng.gauss(mean, stddev), 0.0), 1.0), 4)
+        valid = rng.random() < profile.valid_rate
+        results.append({
+            "miner": f"0xmock{session_id:04d}{index:04d}",
+            "valid": valid,
+            "confidence_score": confidence,
+            "binary_classification": {
+                "valid": valid,
+                "confidence_score": confidence,
+            },
+            "overall_assessment": {
+                "overall_score": int(confidence * 100),
+                "risk_level": "low" if confidence >= 0.8 else "medium",
+            },
+            "data_hash": data_hash,
+        })
+
+    return {
+        "task_id": next_task_id("validate"),
+        "request_id": payload.get("request_id"),
+        "session_id": session_id,
+        "status": "completed",
+        "redundancy": profile.miners,
+        "results": results,
+        "created_at": now_iso(),
+    }
+
+
+# ============================================================================
+# Run with: uvicorn mock_router:app --host 0.0.0.0 --port 9000
+# ============================================================================
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "mock_router:app",
+        host="0.0.0.0",
+        port=int(os.getenv("MOCK_ROUTER_PORT", "9000")),
+        log_level="info"
+    )
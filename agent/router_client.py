@@ -1,24 +1,67 @@
 # agent/router_client.py
 
+import asyncio
 import os
+import random
+import time
+import uuid
 import httpx
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
 from dotenv import load_dotenv
 
+from config.http import HttpSettings
+from config.resilience import ResilienceSettings
+from core import metrics
+from core.balancer import SessionBalancer
+from core.breaker import OPEN, CircuitBreaker, CircuitOpen
+from core.latency import LatencyTracker
+from core.streaming import (
+    STREAM_DONE,
+    StreamedOutput,
+    StreamInterrupted,
+    parse_stream_line,
+    stream_event_text,
+)
+
 
 load_dotenv()
 
 
+# Router-side execution budget when the caller sets no deadline
+UPSTREAM_TIMEOUT_MS = 420000
+PRECOMMIT_TIMEOUT_S = 300
+
+
 class RouterClient:
     """
     Thin async client for Cortensor Router.
     Loads URL and API key from environment if not provided.
+
+    Pass a shared httpx.AsyncClient (see create_http_client) to reuse
+    pooled keep-alive connections across requests. Without one, the
+    client lazily opens its own pool and closes it in aclose().
+
+    Every call accepts an optional `timeout` (seconds left in the
+    caller's deadline). It caps the router-side timeout fields and the
+    httpx timeouts, so no call outlives the caller's budget.
+
+    Calls are hedged, retried and circuit-broken per session id as set
+    out in ResilienceSettings. Each request sent carries its own
+    request_id, so the router never mistakes a hedge or a retry for
+    the original.
+
+    pick_session() chooses among a pool of equivalent sessions (see
+    SessionConfig) by peak-EWMA latency and outstanding calls,
+    steering around sessions whose circuit is open.
     """
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        settings: Optional[HttpSettings] = None,
+        resilience: Optional[ResilienceSettings] = None,
     ):
         self.base_url = (base_url or os.getenv("CORTENSOR_ROUTER_URL", "")).rstrip("/")
         self.api_key = api_key or os.getenv("CORTENSOR_API_KEY", "")
@@ -34,80 +77,623 @@ class RouterClient:
             "Content-Type": "application/json",
         }
 
+        self.settings = settings or HttpSettings.from_env()
+        self._client = http_client
+        self._owns_client = http_client is None
+
+        # Successful call latency per (method, session_id)
+        self.latency = LatencyTracker()
+
+        self.resilience = resilience or ResilienceSettings.from_env()
+        self._breakers: Dict[int, CircuitBreaker] = {}
+        self.balancer = SessionBalancer()
+
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
     # ======================================================
-    # DELEGATE
+    # CONNECTION POOL
     # ======================================================
 
-    async def delegate(
+    @staticmethod
+    def create_http_client(
+        settings: Optional[HttpSettings] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Builds a long-lived, connection-pooled client.
+        Callers own it and must aclose() it on shutdown.
+        """
+
+        settings = settings or HttpSettings.from_env()
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                settings.validate_timeout,
+                connect=settings.connect_timeout,
+                pool=settings.pool_timeout,
+            ),
+            http2=settings.http2,
+        )
+
+    def _timeout(self, read: float, budget: Optional[float] = None) -> httpx.Timeout:
+        if budget is None:
+            return httpx.Timeout(
+                read,
+                connect=self.settings.connect_timeout,
+                pool=self.settings.pool_timeout,
+            )
+
+        return httpx.Timeout(
+            min(read, budget),
+            connect=min(self.settings.connect_timeout, budget),
+            pool=min(self.settings.pool_timeout, budget),
+        )
+
+    @staticmethod
+    def _upstream_budget(budget: Optional[float]) -> Tuple[int, int]:
+        """
+        (timeout_ms, precommit_timeout) for the router. With a budget,
+        both shrink to fit it, keeping precommit at the default ratio.
+        """
+
+        if budget is None:
+            return UPSTREAM_TIMEOUT_MS, PRECOMMIT_TIMEOUT_S
+
+        timeout_ms = max(1, min(UPSTREAM_TIMEOUT_MS, int(budget * 1000)))
+        precommit = max(
+            1,
+            min(
+                PRECOMMIT_TIMEOUT_S,
+                int(timeout_ms * PRECOMMIT_TIMEOUT_S / UPSTREAM_TIMEOUT_MS),
+            ),
+        )
+
+        return timeout_ms, precommit
+
+    async def _post(
         self,
+        path: str,
+        payload: Dict,
+        read_timeout: float,
+        method: str,
         session_id: int,
-        objective: str,
-        input_data: Any,
+        budget: Optional[float] = None,
     ) -> Dict:
 
-        payload = {
-            "session_id": session_id,
-            "request_id": "sentinel-delegate",
-            "objective": objective,
-            "input": {
-                "kind": "text",
-                "payload": input_data,
-            },
-            "execution": {
-                "mode": "completion",
-                "model": "auto",
-            },
-            "policy": {
-                "tier": "balanced",
-                "redundancy": 1,
-                "timeout_ms": 420000,
-                "precommit_timeout": 300,
-            },
-        }
+        if self._client is None:
+            self._client = self.create_http_client(self.settings)
+
+        started = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=600) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v2/delegate",
+        try:
+            response = await self._client.post(
+                f"{self.base_url}{path}",
                 headers=self.headers,
                 json=payload,
+                timeout=self._timeout(read_timeout, budget),
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+
+        except Exception as e:
+            # Cancellation is not an Exception, so abandoned calls
+            # are neither observed nor counted as errors
+            metrics.router_errors(method, session_id, self._error_kind(e)).inc()
+            metrics.router_latency(method, session_id).observe(
+                time.perf_counter() - started
+            )
+            raise
+
+        elapsed = time.perf_counter() - started
+        metrics.router_latency(method, session_id).observe(elapsed)
+        self.latency.observe((method, session_id), elapsed)
+        return result
+
+    @staticmethod
+    def _error_kind(error: Exception) -> str:
+
+        if isinstance(error, httpx.TimeoutException):
+            return "timeout"
+
+        if isinstance(error, httpx.HTTPStatusError):
+            return f"http_{error.response.status_code}"
+
+        if isinstance(error, httpx.HTTPError):
+            return "transport"
+
+        return "invalid_response"
+
+    async def _stream_post(
+        self,
+        path: str,
+        payload: Dict,
+        read_timeout: float,
+        method: str,
+        session_id: int,
+        budget: Optional[float] = None,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> Dict:
+        """
+        POSTs and consumes an SSE/NDJSON token stream, handing each
+        chunk to `on_token` as it arrives. The read timeout applies
+        between chunks rather than to the whole response.
+        """
+
+        if self._client is None:
+            self._client = self.create_http_client(self.settings)
+
+        started = time.perf_counter()
+        output = StreamedOutput()
+
+        try:
+            async with self._client.stream(
+                "POST",
+                f"{self.base_url}{path}",
+                headers=self.headers,
+                json=payload,
+                timeout=self._timeout(read_timeout, budget),
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    event = parse_stream_line(line)
+                    if event is None:
+                        continue
+                    if event is STREAM_DONE:
+                        break
+
+                    output.task_id = event.get("task_id") or output.task_id
+                    text = stream_event_text(event)
+                    if not text:
+                        continue
+
+                    output.feed(text)
+                    if on_token is not None:
+                        await on_token(text)
+
+        except Exception as e:
+            metrics.router_errors(method, session_id, self._error_kind(e)).inc()
+            metrics.router_latency(method, session_id).observe(
+                time.perf_counter() - started
+            )
+            if output.chunks:
+                raise StreamInterrupted(
+                    f"Completion stream broke after {output.chunks} chunks: {e}"
+                ) from e
+            raise
+
+        elapsed = time.perf_counter() - started
+        metrics.router_latency(method, session_id).observe(elapsed)
+        self.latency.observe((method, session_id), elapsed)
+        return output.result()
+
+    # ======================================================
+    # RESILIENCE
+    # ======================================================
+
+    async def _call(
+        self,
+        path: str,
+        build_payload: Callable[[str, Optional[float]], Dict],
+        read_timeout: float,
+        method: str,
+        session_id: int,
+        budget: Optional[float] = None,
+        post: Optional[Callable[..., Awaitable[Dict]]] = None,
+    ) -> Dict:
+        """
+        One logical call, tracked as outstanding load on the session.
+        `post` replaces _post for a single send (e.g. streaming).
+        """
+
+        self.balancer.begin(session_id)
+        started = time.perf_counter()
+
+        try:
+            result = await self._resilient_call(
+                path, build_payload, read_timeout, method, session_id, budget, post
+            )
+        except CircuitOpen:
+            # Failed fast; nothing was sent
+            self.balancer.end(method, session_id, None)
+            raise
+        except Exception:
+            self.balancer.end(
+                method, session_id, time.perf_counter() - started, ok=False
+            )
+            raise
+        except BaseException:
+            # Cancelled: says nothing about the session
+            self.balancer.end(method, session_id, None)
+            raise
+
+        self.balancer.end(method, session_id, time.perf_counter() - started)
+        return result
+
+    async def _resilient_call(
+        self,
+        path: str,
+        build_payload: Callable[[str, Optional[float]], Dict],
+        read_timeout: float,
+        method: str,
+        session_id: int,
+        budget: Optional[float] = None,
+        post: Optional[Callable[..., Awaitable[Dict]]] = None,
+    ) -> Dict:
+        """
+        Circuit check, then hedged sends, retried with jittered backoff
+        on transient failures while the budget lasts.
+        `build_payload(request_id, budget)` is invoked per send.
+        """
+
+        breaker = self._breaker(session_id)
+        expires = None if budget is None else time.monotonic() + budget
+        attempt = 0
+
+        while True:
+            try:
+                breaker.allow()
+            except CircuitOpen:
+                metrics.router_errors(method, session_id, "circuit_open").inc()
+                raise
+
+            try:
+                result = await self._hedged(
+                    path, build_payload, read_timeout, method, session_id, expires, post
+                )
+
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+
+            except Exception as e:
+                if not self._transient(e):
+                    # The session answered; its health is not in question
+                    breaker.release()
+                    raise
+
+                breaker.record_failure()
+                self._report_circuit(breaker, session_id)
+
+                delay = self._backoff(attempt)
+                remaining = self._remaining(expires)
+
+                if (
+                    attempt >= self.resilience.max_retries
+                    or not self._retryable(e, method, expires)
+                    or breaker.state == OPEN
+                    or (remaining is not None and remaining <= delay)
+                ):
+                    raise
+
+                attempt += 1
+                self.retries += 1
+                metrics.router_retries(method, session_id).inc()
+                await asyncio.sleep(delay)
+                continue
+
+            breaker.record_success()
+            self._report_circuit(breaker, session_id)
+            return result
+
+    async def _hedged(
+        self,
+        path: str,
+        build_payload: Callable[[str, Optional[float]], Dict],
+        read_timeout: float,
+        method: str,
+        session_id: int,
+        expires: Optional[float],
+        post: Optional[Callable[..., Awaitable[Dict]]] = None,
+    ) -> Dict:
+        """
+        Sends once; if no answer arrives within the hedge delay, sends
+        a duplicate and returns whichever succeeds first. The loser is
+        cancelled. A custom `post` is never hedged.
+        """
+
+        def send():
+            budget = self._remaining(expires)
+            return (post or self._post)(
+                path,
+                build_payload(self._request_id(method), budget),
+                read_timeout,
+                method=method,
+                session_id=session_id,
+                budget=budget,
+            )
+
+        delay = None if post is not None else self._hedge_delay(method, session_id)
+        if delay is None:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+        hedge = None
+        error = None
+
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+
+            remaining = self._remaining(expires)
+            if not done and (remaining is None or remaining > 0):
+                hedge = asyncio.ensure_future(send())
+                pending.add(hedge)
+                self.hedges += 1
+
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if hedge is not None:
+                            winner = "hedge" if task is hedge else "primary"
+                            if task is hedge:
+                                self.hedge_wins += 1
+                            metrics.router_hedges(method, session_id, winner).inc()
+                        return task.result()
+                    error = error or task.exception()
+
+                if not pending:
+                    raise error
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _hedge_delay(self, method: str, session_id: int) -> Optional[float]:
+
+        if (
+            not self.resilience.hedge_enabled
+            or method not in self.resilience.hedge_methods
+        ):
+            return None
+
+        observed = self.latency.quantile(
+            (method, session_id), self.resilience.hedge_quantile
+        )
+        if observed is None:
+            return None
+
+        return max(observed, self.resilience.hedge_min_delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max, base * 2^attempt)]."""
+
+        ceiling = min(
+            self.resilience.backoff_max,
+            self.resilience.backoff_base * (2 ** attempt),
+        )
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _transient(error: Exception) -> bool:
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+
+        return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+    @staticmethod
+    def _retryable(error: Exception, method: str, expires: Optional[float]) -> bool:
+        """
+        Whether a transient failure may be retried.
+
+        delegate creates a router task, so it is retried only when the
+        request surely never started one: it never reached the router
+        (connect/pool errors) or was refused (429, 503).
+
+        Other calls are not retried after a read timeout or a 504 when
+        there is no budget: another full-length wait would stall the
+        decision far longer than the failure it works around.
+        """
+
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+            return True
+
+        status = (
+            error.response.status_code
+            if isinstance(error, httpx.HTTPStatusError) else None
+        )
+
+        if method == "delegate":
+            return status in (429, 503)
+
+        if expires is None and (
+            isinstance(error, httpx.TimeoutException) or status == 504
+        ):
+            return False
+
+        return True
+
+    @staticmethod
+    def _remaining(expires: Optional[float]) -> Optional[float]:
+        if expires is None:
+            return None
+        return max(0.0, expires - time.monotonic())
+
+    @staticmethod
+    def _request_id(method: str) -> str:
+        return f"sentinel-{method}-{uuid.uuid4().hex}"
+
+    def pick_session(self, method: str, pool: Sequence[int]) -> int:
+        """Best session in `pool` for the next `method` call."""
+
+        open_circuits = [
+            session_id for session_id in pool
+            if session_id in self._breakers
+            and self._breakers[session_id].retry_after()
+        ]
+        return self.balancer.pick(method, pool, exclude=open_circuits)
+
+    def _breaker(self, session_id: int) -> CircuitBreaker:
+        breaker = self._breakers.get(session_id)
+        if breaker is None:
+            breaker = self._breakers[session_id] = CircuitBreaker(
+                session_id,
+                failure_threshold=self.resilience.failure_threshold,
+                reset_timeout=self.resilience.reset_timeout,
+            )
+        return breaker
+
+    @staticmethod
+    def _report_circuit(breaker: CircuitBreaker, session_id: int):
+        metrics.router_circuit_open(session_id).set(
+            1 if breaker.state == OPEN else 0
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "breakers": {
+                str(session_id): breaker.stats()
+                for session_id, breaker in self._breakers.items()
+            },
+            "sessions": self.balancer.stats(),
+        }
+
+    async def aclose(self):
+        """
+        Closes the connection pool if this client created it.
+        A shared pool passed in by the caller is left open.
+        """
+
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    # ======================================================
+    # DELEGATE
+    # ======================================================
+
+    async def delegate(
+        self,
+        session_id: int,
+        objective: str,
+        input_data: Any,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+
+        def payload(request_id: str, budget: Optional[float]) -> Dict:
+            timeout_ms, precommit_timeout = self._upstream_budget(budget)
+            return {
+                "session_id": session_id,
+                "request_id": request_id,
+                "objective": objective,
+                "input": {
+                    "kind": "text",
+                    "payload": input_data,
+                },
+                "execution": {
+                    "mode": "completion",
+                    "model": "auto",
+                },
+                "policy": {
+                    "tier": "balanced",
+                    "redundancy": 1,
+                    "timeout_ms": timeout_ms,
+                    "precommit_timeout": precommit_timeout,
+                },
+            }
+
+        return await self._call(
+            "/api/v2/delegate",
+            payload,
+            self.settings.delegate_timeout,
+            method="delegate",
+            session_id=session_id,
+            budget=timeout,
+        )
 
     # ======================================================
     # COMPLETION
     # ======================================================
 
+    def _completion_payload(self, prompt: str, stream: bool):
+
+        def payload(request_id: str, budget: Optional[float]) -> Dict:
+            timeout_ms, precommit_timeout = self._upstream_budget(budget)
+            return {
+                "prompt": prompt,
+                "max_tokens": 1024,
+                "prompt_type": 0,
+                "prompt_template": "",
+                "stream": stream,
+                "timeout": max(1, timeout_ms // 1000),
+                "precommit_timeout": precommit_timeout,
+                "client_reference": request_id,
+                "temperature": 0.1,
+                "top_p": 0.95,
+                "top_k": 40,
+                "presence_penalty": 0,
+                "frequency_penalty": 0,
+            }
+
+        return payload
+
     async def completion(
         self,
         session_id: int,
         prompt: str,
+        timeout: Optional[float] = None,
     ) -> Dict:
 
-        payload = {
-            "prompt": prompt,
-            "max_tokens": 1024,
-            "prompt_type": 0,
-            "prompt_template": "",
-            "stream": False,
-            "timeout": 420,
-            "precommit_timeout": 300,
-            "client_reference": "sentinel-completion",
-            "temperature": 0.1,
-            "top_p": 0.95,
-            "top_k": 40,
-            "presence_penalty": 0,
-            "frequency_penalty": 0,
-        }
+        return await self._call(
+            f"/api/v2/completions/{session_id}",
+            self._completion_payload(prompt, stream=False),
+            self.settings.completion_timeout,
+            method="completion",
+            session_id=session_id,
+            budget=timeout,
+        )
 
-        async with httpx.AsyncClient(timeout=600) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v2/completions/{session_id}",
-                headers=self.headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+    async def completion_stream(
+        self,
+        session_id: int,
+        prompt: str,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """
+        Streaming completion. Each text chunk goes to `on_token` as it
+        arrives; the result carries the joined output and its SHA-256
+        (output_hash), computed incrementally.
+
+        Never hedged, and retried only if the stream fails before its
+        first chunk (StreamInterrupted otherwise).
+        """
+
+        async def post(*args, **kwargs) -> Dict:
+            return await self._stream_post(*args, on_token=on_token, **kwargs)
+
+        return await self._call(
+            f"/api/v2/completions/{session_id}",
+            self._completion_payload(prompt, stream=True),
+            self.settings.completion_timeout,
+            method="completion",
+            session_id=session_id,
+            budget=timeout,
+            post=post,
+        )
 
     # ======================================================
     # VALIDATE
@@ -118,30 +704,33 @@ class RouterClient:
         session_id: int,
         objective: str,
         output: str,
+        timeout: Optional[float] = None,
     ) -> Dict:
 
-        payload = {
-            "session_id": session_id,
-            "request_id": "sentinel-validate",
-            "claim": {
-                "type": "analysis",
-                "description": objective,
-                "output": output,
-            },
-            "policy": {
-                "tier": "balanced",
-                "redundancy": 1,  # actual redundancy determined by session
-                "rules": ["must-align-with-user-instruction"],
-                "timeout_ms": 420000,
-                "precommit_timeout": 300,
-            },
-        }
+        def payload(request_id: str, budget: Optional[float]) -> Dict:
+            timeout_ms, precommit_timeout = self._upstream_budget(budget)
+            return {
+                "session_id": session_id,
+                "request_id": request_id,
+                "claim": {
+                    "type": "analysis",
+                    "description": objective,
+                    "output": output,
+                },
+                "policy": {
+                    "tier": "balanced",
+                    "redundancy": 1,  # actual redundancy determined by session
+                    "rules": ["must-align-with-user-instruction"],
+                    "timeout_ms": timeout_ms,
+                    "precommit_timeout": precommit_timeout,
+                },
+            }
 
-        async with httpx.AsyncClient(timeout=600) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v2/validate",
-                headers=self.headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
\ No newline at end of file
+        return await self._call(
+            "/api/v2/validate",
+            payload,
+            self.settings.validate_timeout,
+            method="validate",
+            session_id=session_id,
+            budget=timeout,
+        )
@@ -0,0 +1,195 @@
+# agent/storage/cache.py
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from artifact.schema import sha256_hex
+from core.lru import LRUCache
+
+
+DEFAULT_TTLS = {
+    "ACCEPT": 3600.0,
+    "FAIL": 600.0,
+    "MANUAL_REVIEW": 300.0,
+}
+
+
+def _parse_ttls(raw: str) -> Dict[str, float]:
+    """
+    Parses "ACCEPT:3600,FAIL:600" into a verdict → seconds map.
+    """
+
+    ttls = dict(DEFAULT_TTLS)
+
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        verdict, seconds = item.split(":", 1)
+        ttls[verdict.strip().upper()] = float(seconds)
+
+    return ttls
+
+
+class DecisionCache:
+    """
+    Content-addressed cache of finished decisions.
+
+    Keyed by the artifact's objective_hash, so a resubmitted objective
+    returns the original signed artifact reference instead of running
+    the pipeline again. Entries expire per verdict; a TTL of 0 disables
+    caching for that verdict.
+
+    Memory tier: LRU bounded by entries and bytes.
+    Persistent tier (optional): the decisions table, so hits survive
+    restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        db=None,
+    ):
+        self.memory = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        self.ttls = ttls if ttls is not None else dict(DEFAULT_TTLS)
+        self.db = db
+
+        self.persistent_hits = 0
+        self.persistent_misses = 0
+        self.persistent_errors = 0
+        self.integrity_failures = 0
+
+    @classmethod
+    def from_env(cls, db=None) -> "DecisionCache":
+        return cls(
+            max_entries=int(os.getenv("SENTINEL_CACHE_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv("SENTINEL_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+            ttls=_parse_ttls(os.getenv("SENTINEL_CACHE_TTLS", "")),
+            db=db,
+        )
+
+    def ttl_for(self, verdict: str) -> float:
+        return self.ttls.get(verdict, 0.0)
+
+    # ==========================================================
+    # LOOKUP
+    # ==========================================================
+
+    async def get(self, objective_hash: str) -> Optional[Dict[str, Any]]:
+
+        entry = self.memory.get(objective_hash)
+
+        if entry is not None:
+            return entry
+
+        if self.db is None or self.db.pool is None:
+            return None
+
+        # The persistent tier is an optimization; a failing DB is a miss
+        try:
+            row = await self.db.find_decision_by_objective_hash(objective_hash)
+        except Exception as e:
+            self.persistent_errors += 1
+            print(f"⚠️ Persistent cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            self.persistent_misses += 1
+            return None
+
+        entry = self._entry_from_row(row)
+
+        if entry is None:
+            self.persistent_misses += 1
+            return None
+
+        self.persistent_hits += 1
+
+        remaining = self.ttl_for(entry["final_verdict"]) - entry.pop("_age_seconds")
+        self.memory.put(objective_hash, entry, ttl=remaining)
+
+        return entry
+
+    # ==========================================================
+    # STORE
+    # ==========================================================
+
+    def put(self, objective_hash: str, entry: Dict[str, Any]) -> bool:
+
+        ttl = self.ttl_for(entry["final_verdict"])
+
+        if ttl <= 0:
+            return False
+
+        return self.memory.put(objective_hash, entry, ttl=ttl)
+
+    def invalidate(self, objective_hash: str) -> None:
+        self.memory.pop(objective_hash)
+
+    # ==========================================================
+    # HELPERS
+    # ==========================================================
+
+    def _entry_from_row(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+
+        verdict = row["final_verdict"]
+        ttl = self.ttl_for(verdict)
+
+        created_at = row["created_at"]
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+
+        age = (datetime.now(timezone.utc) - created_at).total_seconds()
+
+        if ttl <= 0 or age >= ttl:
+            return None
+
+        output = row["output_text"]
+
+        # Never serve an output that does not match its signed hash
+        if output is None or sha256_hex(output) != row["output_hash"]:
+            self.integrity_failures += 1
+            return None
+
+        escalation_path = row["escalation_path"]
+        if isinstance(escalation_path, str):
+            escalation_path = json.loads(escalation_path)
+
+        validator_runs = row["validator_runs"]
+        if isinstance(validator_runs, str):
+            validator_runs = json.loads(validator_runs)
+
+        return {
+            "output": output,
+            "final_verdict": verdict,
+            "confidence": row["composite_confidence"],
+            "total_attempts": len(escalation_path),
+            "escalation_path": escalation_path,
+            "decision_reason": row["decision_reason"] or "",
+            "decision_id": row["decision_id"],
+            "artifact_hash": row["artifact_hash"],
+            "signature": row["signature"],
+            # Signed artifact timestamp; rows from before it was stored
+            # fall back to the insert time
+            "timestamp": row["artifact_created_at"] or created_at.isoformat(),
+            "threshold": row["threshold_applied"],
+            "validator_runs": validator_runs,
+            "_age_seconds": age,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.memory.stats()
+        stats.update(
+            {
+                "persistent_tier": self.db is not None,
+                "persistent_hits": self.persistent_hits,
+                "persistent_misses": self.persistent_misses,
+                "persistent_errors": self.persistent_errors,
+                "integrity_failures": self.integrity_failures,
+                "ttls": self.ttls,
+            }
+        )
+        return stats
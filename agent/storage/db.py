@@ -1,7 +1,14 @@
 import asyncpg
 import os
 import json
-from typing import List, Dict
+import time
+from contextlib import asynccontextmanager
+import base64
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+
+from storage.migrations import apply_migrations
+from core.metrics import DB_POOL_WAIT_SECONDS
 
 
 DB_URL = os.getenv(
@@ -10,17 +17,420 @@ DB_URL = os.getenv(
 )
 
 
+# ==========================================================
+# HOT QUERIES
+# ==========================================================
+# Always issued with the exact same text so asyncpg's per-connection
+# statement cache prepares each one once and reuses it on every later
+# acquire of that connection.
+
+INSERT_DECISION_SQL = """
+    INSERT INTO decisions (
+        decision_id,
+        schema_version,
+        session_id,
+        delegate_task_id,
+        completion_task_id,
+        composite_confidence,
+        threshold_applied,
+        final_verdict,
+        escalation_path,
+        artifact_hash,
+        signature,
+        objective_hash,
+        output_hash,
+        output_text,
+        decision_reason,
+        stage_timings,
+        artifact_created_at
+    )
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16,$17)
+"""
+
+VALIDATOR_RUN_COLUMNS = (
+    "decision_id",
+    "redundancy_level",
+    "miner_address",
+    "valid",
+    "confidence_score",
+    "overall_score",
+    "risk_level",
+    "data_hash",
+)
+
+INSERT_VALIDATOR_RUN_SQL = """
+    INSERT INTO validator_runs (
+        decision_id,
+        redundancy_level,
+        miner_address,
+        valid,
+        confidence_score,
+        overall_score,
+        risk_level,
+        data_hash
+    )
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
+"""
+
+DECISION_SUMMARY_COLUMNS = """
+    decision_id,
+    schema_version,
+    session_id,
+    composite_confidence,
+    threshold_applied,
+    final_verdict,
+    escalation_path,
+    artifact_hash,
+    signature,
+    created_at
+"""
+
+VALIDATOR_RUNS_JSON_SQL = """
+    COALESCE(
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'redundancy_level', v.redundancy_level,
+                    'miner_address', v.miner_address,
+                    'valid', v.valid,
+                    'confidence_score', v.confidence_score,
+                    'overall_score', v.overall_score,
+                    'risk_level', v.risk_level,
+                    'data_hash', v.data_hash
+                )
+                ORDER BY v.redundancy_level, v.id
+            )
+            FROM validator_runs v
+            WHERE v.decision_id = d.decision_id
+        ),
+        '[]'::json
+    ) AS validator_runs
+"""
+
+DECISION_DETAIL_COLUMNS = """
+        d.decision_id,
+        d.schema_version,
+        d.session_id,
+        d.delegate_task_id,
+        d.completion_task_id,
+        d.composite_confidence,
+        d.threshold_applied,
+        d.final_verdict,
+        d.escalation_path,
+        d.artifact_hash,
+        d.signature,
+        d.objective_hash,
+        d.output_hash,
+        d.output_text,
+        d.decision_reason,
+        d.stage_timings,
+        d.created_at
+"""
+
+FIND_BY_OBJECTIVE_HASH_SQL = f"""
+    SELECT
+        d.decision_id,
+        d.final_verdict,
+        d.composite_confidence,
+        d.threshold_applied,
+        d.escalation_path,
+        d.artifact_hash,
+        d.signature,
+        d.output_hash,
+        d.output_text,
+        d.decision_reason,
+        d.artifact_created_at,
+        d.created_at,
+        {VALIDATOR_RUNS_JSON_SQL}
+    FROM decisions d
+    WHERE d.objective_hash = $1
+    ORDER BY d.created_at DESC
+    LIMIT 1
+"""
+
+GET_DECISION_SQL = f"""
+    SELECT
+        {DECISION_DETAIL_COLUMNS},
+        {VALIDATOR_RUNS_JSON_SQL}
+    FROM decisions d
+    WHERE d.decision_id = $1
+"""
+
+
+SAVE_JOB_SQL = """
+    INSERT INTO jobs (
+        job_id,
+        status,
+        objective,
+        result,
+        error,
+        created_at,
+        updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (job_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        result = EXCLUDED.result,
+        error = EXCLUDED.error,
+        updated_at = EXCLUDED.updated_at
+    WHERE jobs.updated_at <= EXCLUDED.updated_at
+"""
+
+GET_JOB_SQL = """
+    SELECT job_id, status, result, error, created_at, updated_at
+    FROM jobs
+    WHERE job_id = $1
+"""
+
+
+def encode_cursor(created_at: datetime, decision_id: str) -> str:
+    """
+    Opaque keyset cursor pointing just past (created_at, decision_id).
+    """
+    raw = json.dumps({"t": created_at.isoformat(), "id": decision_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), str(data["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def _decision_row_to_dict(row) -> Dict:
+    decision = dict(row)
+
+    for key in ("escalation_path", "validator_runs", "stage_timings"):
+        if isinstance(decision.get(key), str):
+            decision[key] = json.loads(decision[key])
+
+    if isinstance(decision.get("created_at"), datetime):
+        decision["created_at"] = decision["created_at"].isoformat()
+
+    return decision
+
+
 class Database:
+    """
+    Async Postgres access over one asyncpg pool.
 
-    def __init__(self):
+    Create one instance per process, connect() it at startup and share
+    it. Hot queries are prepared once per pool connection by asyncpg's
+    statement cache and reused for the connection's lifetime.
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ):
+        self.dsn = dsn or DB_URL
+        self.min_size = min_size or int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+        self.max_size = max_size or int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+        self.statement_cache_size = int(
+            os.getenv("DB_STATEMENT_CACHE_SIZE", "100")
+        )
         self.pool = None
 
+        self.acquires = 0
+        self.acquire_wait_ms_total = 0.0
+        self.acquire_wait_ms_max = 0.0
+        self.acquire_errors = 0
+
     async def connect(self):
-        self.pool = await asyncpg.create_pool(DB_URL)
+        if self.pool is not None:
+            return
+
+        self.pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            statement_cache_size=self.statement_cache_size,
+        )
 
     async def close(self):
         if self.pool:
             await self.pool.close()
+            self.pool = None
+
+    # ==========================================================
+    # CONNECTIONS
+    # ==========================================================
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        pool.acquire() that records how long callers waited for a
+        connection.
+        """
+        started = time.perf_counter()
+
+        try:
+            conn = await self.pool.acquire()
+        except Exception:
+            self.acquire_errors += 1
+            raise
+
+        waited = time.perf_counter() - started
+        DB_POOL_WAIT_SECONDS.observe(waited)
+
+        waited_ms = waited * 1000
+        self.acquires += 1
+        self.acquire_wait_ms_total += waited_ms
+        self.acquire_wait_ms_max = max(self.acquire_wait_ms_max, waited_ms)
+
+        try:
+            yield conn
+        finally:
+            await self.pool.release(conn)
+
+    def stats(self) -> Dict:
+        connected = self.pool is not None and not self.pool.is_closing()
+
+        return {
+            "connected": connected,
+            "size": self.pool.get_size() if connected else 0,
+            "idle": self.pool.get_idle_size() if connected else 0,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "acquires": self.acquires,
+            "acquire_errors": self.acquire_errors,
+            "acquire_wait_ms_avg": (
+                round(self.acquire_wait_ms_total / self.acquires, 3)
+                if self.acquires else 0.0
+            ),
+            "acquire_wait_ms_max": round(self.acquire_wait_ms_max, 3),
+        }
+
+    # ==========================================================
+    # SCHEMA
+    # ==========================================================
+
+    async def migrate(self) -> List[int]:
+        """
+        Applies pending versioned migrations (storage/migrations.py).
+        """
+        async with self.acquire() as conn:
+            return await apply_migrations(conn)
+
+    # ==========================================================
+    # WRITES
+    # ==========================================================
+
+    @staticmethod
+    def _decision_args(
+        decision_id: str,
+        schema_version: str,
+        session_id: int,
+        delegate_task_id: str,
+        completion_task_id: str,
+        composite_confidence: float,
+        threshold_applied: float,
+        final_verdict: str,
+        escalation_path: List[int],
+        artifact_hash: str,
+        signature: str,
+        objective_hash: Optional[str] = None,
+        output_hash: Optional[str] = None,
+        output_text: Optional[str] = None,
+        decision_reason: Optional[str] = None,
+        stage_timings: Optional[Dict] = None,
+        artifact_created_at: Optional[str] = None,
+    ) -> tuple:
+        return (
+            decision_id,
+            schema_version,
+            session_id,
+            delegate_task_id,
+            completion_task_id,
+            composite_confidence,
+            threshold_applied,
+            final_verdict,
+            json.dumps(escalation_path),
+            artifact_hash,
+            signature,
+            objective_hash,
+            output_hash,
+            output_text,
+            decision_reason,
+            json.dumps(stage_timings) if stage_timings is not None else None,
+            artifact_created_at,
+        )
+
+    @staticmethod
+    def _validator_run_rows(decision_id: str, runs: List[Dict]) -> List[tuple]:
+        return [
+            (
+                decision_id,
+                run["redundancy_level"],
+                run["miner_address"],
+                run["valid"],
+                run["confidence_score"],
+                run["overall_score"],
+                run["risk_level"],
+                run["data_hash"],
+            )
+            for run in runs
+        ]
+
+    async def _write_records(self, conn, records: List[Dict]):
+        """
+        Decision rows via executemany, validator runs via one binary
+        COPY. Caller provides the transaction.
+        """
+        await conn.executemany(
+            INSERT_DECISION_SQL,
+            [self._decision_args(**record["decision"]) for record in records],
+        )
+
+        run_rows = []
+        for record in records:
+            run_rows.extend(
+                self._validator_run_rows(
+                    record["decision"]["decision_id"],
+                    record["validator_runs"],
+                )
+            )
+
+        if run_rows:
+            await conn.copy_records_to_table(
+                "validator_runs",
+                records=run_rows,
+                columns=VALIDATOR_RUN_COLUMNS,
+            )
+
+    async def insert_decision_with_runs(
+        self,
+        decision: Dict,
+        validator_runs: List[Dict],
+    ):
+        """
+        Writes one decision and all of its validator runs atomically.
+        decision holds insert_decision keyword arguments.
+        """
+        await self.insert_decisions_batch(
+            [{"decision": decision, "validator_runs": validator_runs}]
+        )
+
+    async def insert_decisions_batch(self, records: List[Dict]) -> int:
+        """
+        Persists many decisions in a single transaction.
+
+        records = [{"decision": {...}, "validator_runs": [...]}, ...]
+        Either every decision and run is written, or none is.
+        """
+        if not records:
+            return 0
+
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                await self._write_records(conn, records)
+
+        return len(records)
 
     async def insert_decision(
         self,
@@ -35,11 +445,17 @@ class Database:
         escalation_path: List[int],
         artifact_hash: str,
         signature: str,
+        objective_hash: Optional[str] = None,
+        output_hash: Optional[str] = None,
+        output_text: Optional[str] = None,
+        decision_reason: Optional[str] = None,
+        stage_timings: Optional[Dict] = None,
+        artifact_created_at: Optional[str] = None,
     ):
-        async with self.pool.acquire() as conn:
+        async with self.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO decisions (
+                INSERT_DECISION_SQL,
+                *self._decision_args(
                     decision_id,
                     schema_version,
                     session_id,
@@ -50,21 +466,14 @@ class Database:
                     final_verdict,
                     escalation_path,
                     artifact_hash,
-                    signature
-                )
-                VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11)
-                """,
-                decision_id,
-                schema_version,
-                session_id,
-                delegate_task_id,
-                completion_task_id,
-                composite_confidence,
-                threshold_applied,
-                final_verdict,
-                json.dumps(escalation_path),
-                artifact_hash,
-                signature,
+                    signature,
+                    objective_hash,
+                    output_hash,
+                    output_text,
+                    decision_reason,
+                    stage_timings,
+                    artifact_created_at,
+                ),
             )
 
     async def insert_validator_runs(
@@ -72,28 +481,189 @@ class Database:
         decision_id: str,
         runs: List[Dict],
     ):
-        async with self.pool.acquire() as conn:
-            for run in runs:
-                await conn.execute(
-                    """
-                    INSERT INTO validator_runs (
-                        decision_id,
-                        redundancy_level,
-                        miner_address,
-                        valid,
-                        confidence_score,
-                        overall_score,
-                        risk_level,
-                        data_hash
+        if not runs:
+            return
+
+        async with self.acquire() as conn:
+            await conn.executemany(
+                INSERT_VALIDATOR_RUN_SQL,
+                self._validator_run_rows(decision_id, runs),
+            )
+
+    async def save_job(
+        self,
+        job_id: str,
+        status: str,
+        objective: str,
+        result: Optional[Dict],
+        error: Optional[str],
+        created_at: datetime,
+        updated_at: datetime,
+    ):
+        async with self.acquire() as conn:
+            await conn.execute(
+                SAVE_JOB_SQL,
+                job_id,
+                status,
+                objective,
+                json.dumps(result) if result is not None else None,
+                error,
+                created_at,
+                updated_at,
+            )
+
+    # ==========================================================
+    # READS
+    # ==========================================================
+
+    async def find_decision_by_objective_hash(
+        self,
+        objective_hash: str,
+    ) -> Optional[Dict]:
+        """
+        Most recent decision for an objective with its validator
+        runs, or None.
+        """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(
+                FIND_BY_OBJECTIVE_HASH_SQL,
+                objective_hash,
+            )
+
+        return dict(row) if row else None
+
+    async def get_decision(self, decision_id: str) -> Optional[Dict]:
+        """
+        One decision plus its validator runs, in a single round trip.
+        """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(GET_DECISION_SQL, decision_id)
+
+        return _decision_row_to_dict(row) if row else None
+
+    async def get_job(self, job_id: str) -> Optional[Dict]:
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(GET_JOB_SQL, job_id)
+
+        if row is None:
+            return None
+
+        job = dict(row)
+        if isinstance(job.get("result"), str):
+            job["result"] = json.loads(job["result"])
+
+        return job
+
+    async def list_decisions_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        final_verdict: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Newest-first keyset pagination over (created_at, decision_id).
+
+        Returns (decisions, next_cursor). Each page is an index range
+        scan, so cost does not grow with depth into history.
+        """
+        conditions = []
+        args: list = []
+
+        if cursor:
+            created_at, decision_id = decode_cursor(cursor)
+            args.extend([created_at, decision_id])
+            conditions.append(
+                f"(created_at, decision_id) < (${len(args) - 1}, ${len(args)})"
+            )
+
+        if final_verdict:
+            args.append(final_verdict)
+            conditions.append(f"final_verdict = ${len(args)}")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        args.append(limit + 1)
+
+        async with self.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {DECISION_SUMMARY_COLUMNS}
+                FROM decisions
+                {where}
+                ORDER BY created_at DESC, decision_id DESC
+                LIMIT ${len(args)}
+                """,
+                *args,
+            )
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last["created_at"], last["decision_id"])
+            rows = rows[:limit]
+
+        return [_decision_row_to_dict(row) for row in rows], next_cursor
+
+    async def list_recent_decisions(self, limit: int = 10) -> List[Dict]:
+        decisions, _ = await self.list_decisions_page(limit=limit)
+        return decisions
+
+    async def stream_decisions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        final_verdict: Optional[str] = None,
+        cursor: Optional[str] = None,
+        prefetch: int = 500,
+    ) -> AsyncIterator[Tuple[Dict, str]]:
+        """
+        Oldest-first export of decisions with their validator runs,
+        read through a server-side cursor so only `prefetch` rows are
+        held in memory at a time.
+
+        Yields (decision, resume_cursor); passing resume_cursor back
+        continues right after that decision.
+        """
+        conditions = []
+        args: list = []
+
+        if cursor:
+            created_at, decision_id = decode_cursor(cursor)
+            args.extend([created_at, decision_id])
+            conditions.append(
+                f"(d.created_at, d.decision_id) > (${len(args) - 1}, ${len(args)})"
+            )
+
+        if since:
+            args.append(since)
+            conditions.append(f"d.created_at >= ${len(args)}")
+
+        if until:
+            args.append(until)
+            conditions.append(f"d.created_at < ${len(args)}")
+
+        if final_verdict:
+            args.append(final_verdict)
+            conditions.append(f"d.final_verdict = ${len(args)}")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT
+                {DECISION_DETAIL_COLUMNS},
+                {VALIDATOR_RUNS_JSON_SQL}
+            FROM decisions d
+            {where}
+            ORDER BY d.created_at, d.decision_id
+        """
+
+        async with self.acquire() as conn:
+            # Server-side cursors only live inside a transaction
+            async with conn.transaction(
+                isolation="repeatable_read",
+                readonly=True,
+            ):
+                async for row in conn.cursor(query, *args, prefetch=prefetch):
+                    yield (
+                        _decision_row_to_dict(row),
+                        encode_cursor(row["created_at"], row["decision_id"]),
                     )
-                    VALUES ($1,$2,$3,$4,$5,$6,$7,$8)
-                    """,
-                    decision_id,
-                    run["redundancy_level"],
-                    run["miner_address"],
-                    run["valid"],
-                    run["confidence_score"],
-                    run["overall_score"],
-                    run["risk_level"],
-                    run["data_hash"],
-                )
\ No newline at end of file
@@ -0,0 +1,173 @@
+# agent/storage/migrations.py
+
+from typing import List, Tuple
+
+
+# ==========================================================
+# VERSIONED MIGRATIONS
+# ==========================================================
+# Append only. Pending entries run once, in order, inside a single
+# transaction under an advisory lock, and are recorded in
+# schema_migrations. Statements are idempotent so a database created
+# before versioning was introduced upgrades cleanly.
+
+MIGRATIONS: List[Tuple[int, str, str]] = [
+    (
+        1,
+        "base tables",
+        """
+        CREATE TABLE IF NOT EXISTS decisions (
+            decision_id TEXT PRIMARY KEY,
+            schema_version TEXT NOT NULL,
+            session_id INTEGER NOT NULL,
+            delegate_task_id TEXT,
+            completion_task_id TEXT,
+            composite_confidence DOUBLE PRECISION NOT NULL,
+            threshold_applied DOUBLE PRECISION NOT NULL,
+            final_verdict TEXT NOT NULL,
+            escalation_path JSONB NOT NULL,
+            artifact_hash TEXT NOT NULL,
+            signature TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS validator_runs (
+            id BIGSERIAL PRIMARY KEY,
+            decision_id TEXT NOT NULL REFERENCES decisions (decision_id),
+            redundancy_level INTEGER NOT NULL,
+            miner_address TEXT,
+            valid BOOLEAN,
+            confidence_score DOUBLE PRECISION,
+            overall_score INTEGER,
+            risk_level TEXT,
+            data_hash TEXT
+        );
+        """,
+    ),
+    (
+        2,
+        "decision cache columns",
+        """
+        ALTER TABLE decisions
+            ADD COLUMN IF NOT EXISTS objective_hash TEXT,
+            ADD COLUMN IF NOT EXISTS output_hash TEXT,
+            ADD COLUMN IF NOT EXISTS output_text TEXT,
+            ADD COLUMN IF NOT EXISTS decision_reason TEXT,
+            ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+        CREATE INDEX IF NOT EXISTS idx_decisions_objective_hash
+            ON decisions (objective_hash, created_at DESC);
+        """,
+    ),
+    (
+        3,
+        "read path indexes",
+        """
+        -- Pre-versioning tables may lack a unique key on decision_id
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1
+                FROM pg_index i
+                JOIN pg_attribute a
+                  ON a.attrelid = i.indrelid AND a.attnum = ANY (i.indkey)
+                WHERE i.indrelid = 'decisions'::regclass
+                  AND i.indisunique
+                  AND i.indnatts = 1
+                  AND a.attname = 'decision_id'
+            ) THEN
+                CREATE UNIQUE INDEX idx_decisions_decision_id
+                    ON decisions (decision_id);
+            END IF;
+        END
+        $$;
+
+        CREATE INDEX IF NOT EXISTS idx_decisions_created_at
+            ON decisions (created_at DESC, decision_id DESC);
+
+        CREATE INDEX IF NOT EXISTS idx_decisions_verdict_created_at
+            ON decisions (final_verdict, created_at DESC, decision_id DESC);
+
+        CREATE INDEX IF NOT EXISTS idx_validator_runs_decision_id
+            ON validator_runs (decision_id);
+        """,
+    ),
+    (
+        4,
+        "evaluation jobs",
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            objective TEXT NOT NULL,
+            result JSONB,
+            error TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_jobs_updated_at
+            ON jobs (updated_at);
+        """,
+    ),
+    (
+        5,
+        "decision stage timings",
+        """
+        ALTER TABLE decisions
+            ADD COLUMN IF NOT EXISTS stage_timings JSONB;
+        """,
+    ),
+    (
+        6,
+        "decision artifact timestamp",
+        """
+        ALTER TABLE decisions
+            ADD COLUMN IF NOT EXISTS artifact_created_at TEXT;
+        """,
+    ),
+]
+
+
+# Arbitrary constant; serializes migrations across gunicorn workers
+MIGRATION_LOCK_ID = 7_402_118_001
+
+
+async def apply_migrations(conn) -> List[int]:
+    """
+    Applies pending migrations and returns the versions applied.
+    """
+
+    applied: List[int] = []
+
+    async with conn.transaction():
+        await conn.execute("SELECT pg_advisory_xact_lock($1)", MIGRATION_LOCK_ID)
+
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """
+        )
+
+        done = {
+            row["version"]
+            for row in await conn.fetch("SELECT version FROM schema_migrations")
+        }
+
+        for version, name, sql in MIGRATIONS:
+            if version in done:
+                continue
+
+            await conn.execute(sql)
+            await conn.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                version,
+                name,
+            )
+
+            applied.append(version)
+
+    return applied
@@ -0,0 +1,412 @@
+# agent/storage/writer.py
+
+import asyncio
+import fcntl
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+from storage.db import Database
+
+
+# The DB (or the connection to it) is gone; anything else is a
+# rejection of the record itself.
+CONNECTION_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.TooManyConnectionsError,
+)
+
+
+class DecisionWriter:
+    """
+    Write-behind persistence for decision artifacts.
+
+    Firewall hands each finished decision to submit() and returns
+    immediately; a background worker writes each batch of decisions
+    and their validator runs in one transaction.
+
+    - Bounded queue: submit() waits up to `enqueue_timeout` for space
+      (backpressure). If the queue is still full, or the DB is down,
+      records are appended to a local JSONL spill file instead of
+      being dropped.
+    - Spilled records are replayed once the DB accepts writes again.
+      Workers sharing a spill file coordinate through flock: appends
+      and the hand-off to replay take `<spill>.lock`, and only one
+      process at a time holds `<spill>.replay.lock` to replay.
+      Records the DB rejects go to `<spill>.dead`; lines that do not
+      parse go to `<spill>.corrupt`.
+    - close() stops intake, drains the queue and flushes everything.
+
+    Record shape:
+        {"decision": {...insert_decision kwargs...},
+         "validator_runs": [...]}
+    """
+
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        capacity: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+        enqueue_timeout: float = 5.0,
+        spill_path: str = "logs/decision_spill.jsonl",
+        spill_retry_interval: float = 30.0,
+    ):
+        self.db = db or Database()
+        self._owns_db = db is None
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.spill_path = spill_path
+        self.spill_retry_interval = spill_retry_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._connected = False
+        self._closing = False
+        self._last_replay = 0.0
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.dead_lettered = 0
+        self.write_errors = 0
+        self.backpressure_waits = 0
+
+    @classmethod
+    def from_env(cls, db: Optional[Database] = None) -> "DecisionWriter":
+        return cls(
+            db=db,
+            capacity=int(os.getenv("SENTINEL_WRITER_CAPACITY", "1000")),
+            batch_size=int(os.getenv("SENTINEL_WRITER_BATCH_SIZE", "50")),
+            flush_interval=float(os.getenv("SENTINEL_WRITER_FLUSH_INTERVAL", "0.5")),
+            enqueue_timeout=float(os.getenv("SENTINEL_WRITER_ENQUEUE_TIMEOUT", "5")),
+            spill_path=os.getenv("SENTINEL_WRITER_SPILL_PATH", "logs/decision_spill.jsonl"),
+        )
+
+    # ==========================================================
+    # LIFECYCLE
+    # ==========================================================
+
+    async def start(self):
+
+        self._queue = asyncio.Queue(maxsize=self.capacity)
+        self._closing = False
+
+        await self._ensure_connected()
+
+        try:
+            await self._replay_spill()
+        except Exception as e:
+            print(f"⚠️  Decision writer: spill replay failed ({e})")
+
+        self._worker = asyncio.create_task(self._run())
+
+    async def close(self, timeout: float = 30.0):
+        """
+        Stops intake and drains queued records. Anything not written
+        within `timeout` is spilled to disk. A DB pool passed in by the
+        caller is left open.
+        """
+
+        self._closing = True
+
+        if self._worker is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        leftovers = self._drain_nowait()
+        if leftovers:
+            await self._spill(leftovers)
+
+        if self._connected and self._owns_db:
+            await self.db.close()
+        self._connected = False
+
+    # ==========================================================
+    # INTAKE
+    # ==========================================================
+
+    async def submit(self, record: Dict[str, Any]) -> None:
+
+        self.submitted += 1
+
+        if self._queue is None or self._closing:
+            await self._spill([record])
+            return
+
+        if self._queue.full():
+            self.backpressure_waits += 1
+
+        try:
+            await asyncio.wait_for(
+                self._queue.put(record),
+                self.enqueue_timeout,
+            )
+        except asyncio.TimeoutError:
+            await self._spill([record])
+
+    # ==========================================================
+    # WORKER
+    # ==========================================================
+
+    async def _run(self):
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write(batch)
+            except Exception as e:
+                # Never let one bad batch take the worker down
+                self.write_errors += 1
+                print(f"⚠️  Decision writer: batch of {len(batch)} failed ({e})")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> bool:
+
+        if not await self._ensure_connected():
+            await self._spill(batch)
+            return False
+
+        try:
+            await self.db.insert_decisions_batch(batch)
+        except asyncpg.UniqueViolationError:
+            # Some records were already persisted (e.g. replayed spill);
+            # fall back to one transaction per record.
+            return await self._write_individually(batch)
+        except Exception as e:
+            self.write_errors += 1
+            print(f"⚠️  Decision writer: DB write failed ({e}); spilling batch")
+            await self._spill(batch)
+            return False
+
+        self.written += len(batch)
+        self.batches += 1
+
+        if time.monotonic() - self._last_replay >= self.spill_retry_interval:
+            await self._replay_spill()
+
+        return True
+
+    async def _write_individually(self, batch: List[Dict[str, Any]]) -> bool:
+
+        failed = []
+
+        for record in batch:
+            try:
+                await self._insert(record)
+            except asyncpg.UniqueViolationError:
+                continue
+            except Exception:
+                failed.append(record)
+
+        if failed:
+            self.write_errors += 1
+            await self._spill(failed)
+
+        self.written += len(batch) - len(failed)
+        self.batches += 1
+        return not failed
+
+    async def _insert(self, record: Dict[str, Any]) -> None:
+
+        await self.db.insert_decision_with_runs(
+            record["decision"],
+            record["validator_runs"],
+        )
+
+    async def _ensure_connected(self) -> bool:
+
+        if self._connected:
+            return True
+
+        try:
+            await self.db.connect()
+        except Exception as e:
+            print(f"⚠️  Decision writer: DB unavailable ({e})")
+            return False
+
+        self._connected = True
+        return True
+
+    # ==========================================================
+    # SPILL FILE
+    # ==========================================================
+
+    @contextmanager
+    def _flock(self, suffix: str, blocking: bool = True):
+        """
+        Exclusive flock on `<spill_path><suffix>`. Yields False instead
+        of waiting when `blocking` is off and another process holds it.
+        """
+
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.spill_path + suffix, "a") as lock_file:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file, flags)
+            except BlockingIOError:
+                yield False
+                return
+
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _append(self, path: str, lines: List[str]) -> None:
+
+        with self._flock(".lock"):
+            with open(path, "a", encoding="utf-8") as f:
+                for line in lines:
+                    f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    async def _spill(self, records: List[Dict[str, Any]]) -> None:
+
+        lines = [json.dumps(record, sort_keys=True) for record in records]
+        await asyncio.to_thread(self._append, self.spill_path, lines)
+        self.spilled += len(records)
+
+    def _claim_spill(self, replay_path: str) -> List[str]:
+        """
+        Moves the spill file aside for replay and reads it. A replay
+        file left by an interrupted replay is picked up first.
+        """
+
+        with self._flock(".lock"):
+            if not os.path.exists(replay_path):
+                if not os.path.exists(self.spill_path):
+                    return []
+                os.replace(self.spill_path, replay_path)
+
+            with open(replay_path, encoding="utf-8") as f:
+                return [line for line in f if line.strip()]
+
+    async def _replay_spill(self) -> None:
+
+        self._last_replay = time.monotonic()
+
+        pending = (
+            os.path.exists(self.spill_path)
+            or os.path.exists(self.spill_path + ".replaying")
+        )
+
+        if not pending or not self._connected:
+            return
+
+        replay_path = self.spill_path + ".replaying"
+
+        with self._flock(".replay.lock", blocking=False) as acquired:
+            if not acquired:
+                # Another worker is replaying
+                return
+
+            lines = await asyncio.to_thread(self._claim_spill, replay_path)
+
+            records = []
+            corrupt = []
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Half-written line from a crash mid-spill
+                    corrupt.append(line.rstrip("\n"))
+
+            if corrupt:
+                print(f"⚠️  Decision writer: quarantined {len(corrupt)} unreadable spill lines")
+                await asyncio.to_thread(
+                    self._append, self.spill_path + ".corrupt", corrupt
+                )
+
+            dead = []
+
+            for index, record in enumerate(records):
+                try:
+                    await self._insert(record)
+                except asyncpg.UniqueViolationError:
+                    # Already persisted before the spill
+                    pass
+                except CONNECTION_ERRORS:
+                    # DB went away again; keep the rest for the next attempt
+                    await self._spill(records[index:])
+                    self.spilled -= len(records) - index
+                    break
+                except Exception as e:
+                    # The DB rejects this record; retrying will not help
+                    self.write_errors += 1
+                    print(f"⚠️  Decision writer: dead-lettering spilled record ({e})")
+                    dead.append(record)
+                    continue
+                self.replayed += 1
+
+            if dead:
+                await asyncio.to_thread(
+                    self._append,
+                    self.spill_path + ".dead",
+                    [json.dumps(record, sort_keys=True) for record in dead],
+                )
+                self.dead_lettered += len(dead)
+
+            await asyncio.to_thread(os.remove, replay_path)
+
+    def _drain_nowait(self) -> List[Dict[str, Any]]:
+
+        records = []
+
+        while self._queue is not None and not self._queue.empty():
+            records.append(self._queue.get_nowait())
+            self._queue.task_done()
+
+        return records
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "capacity": self.capacity,
+            "connected": self._connected,
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "dead_lettered": self.dead_lettered,
+            "write_errors": self.write_errors,
+            "backpressure_waits": self.backpressure_waits,
+        }
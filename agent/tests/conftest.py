@@ -0,0 +1,10 @@
+# agent/tests/conftest.py
+
+import os
+import sys
+
+# Modules import each other as `from core.x import ...`, relative to agent/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Deterministic signing key for ArtifactBuilder
+os.environ.setdefault("SENTINEL_PRIVATE_KEY", "11" * 32)
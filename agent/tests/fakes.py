@@ -0,0 +1,112 @@
+# agent/tests/fakes.py
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FakeRouter:
+    """
+    In-process stand-in for RouterClient.
+
+    `delays` maps a method ("delegate", "completion", "validate"), or a
+    (method, session) pair, to seconds slept per call; `scores` maps a
+    validation session to (confidence, number of validators, valid);
+    `failures` maps a validation session to the error it raises.
+    """
+
+    def __init__(
+        self,
+        redundancy: int = 1,
+        delays: Optional[Dict[str, float]] = None,
+        scores: Optional[Dict[int, Tuple[float, int, bool]]] = None,
+        failures: Optional[Dict[int, str]] = None,
+    ):
+        self.redundancy = redundancy
+        self.delays = delays or {}
+        self.scores = scores or {}
+        self.failures = failures or {}
+        self.calls: List[Tuple[str, Any]] = []
+        self.cancelled: List[Tuple[str, Any]] = []
+        self.budgets: List[Tuple[str, Optional[float]]] = []
+
+    async def _sleep(self, method: str, key: Any, timeout: Optional[float]):
+        self.calls.append((method, key))
+        self.budgets.append((method, timeout))
+        try:
+            await asyncio.sleep(
+                self.delays.get((method, key), self.delays.get(method, 0.0))
+            )
+        except asyncio.CancelledError:
+            self.cancelled.append((method, key))
+            raise
+
+    async def delegate(self, session_id, objective, input_data, timeout=None):
+        await self._sleep("delegate", session_id, timeout)
+        return {
+            "task_id": "delegate-1",
+            "cortensor_policy": {"redundancy": self.redundancy},
+        }
+
+    async def completion(self, session_id, prompt, timeout=None):
+        await self._sleep("completion", session_id, timeout)
+        return {"task_id": "completion-1", "output": f"answer: {prompt}"}
+
+    async def validate(self, session_id, objective, output, timeout=None):
+        await self._sleep("validate", session_id, timeout)
+
+        if session_id in self.failures:
+            raise RuntimeError(self.failures[session_id])
+
+        confidence, count, valid = self.scores.get(session_id, (0.9, 3, True))
+        return {
+            "task_id": f"validate-{session_id}",
+            "results": [
+                {
+                    "miner": f"miner-{i}",
+                    "valid": valid,
+                    "confidence_score": confidence,
+                    "binary_classification": {
+                        "valid": valid,
+                        "confidence_score": confidence,
+                    },
+                    "overall_assessment": {
+                        "overall_score": 80,
+                        "risk_level": "low",
+                    },
+                    "data_hash": "hash",
+                }
+                for i in range(count)
+            ],
+        }
+
+    def validate_calls(self) -> List[int]:
+        return [key for method, key in self.calls if method == "validate"]
+
+
+class FakeDB:
+    """Database stand-in; `pool` is None until connect() succeeds."""
+
+    def __init__(self, row: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None):
+        self.pool = None
+        self.row = row
+        self.error = error
+        self.lookups = 0
+
+    async def connect(self):
+        self.pool = object()
+
+    async def find_decision_by_objective_hash(self, objective_hash: str):
+        self.lookups += 1
+        if self.error is not None:
+            raise self.error
+        return self.row
+
+
+class FakeWriter:
+    """DecisionWriter stand-in that keeps submitted records in memory."""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    async def submit(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
@@ -0,0 +1,98 @@
+# agent/tests/test_cache.py
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from config.escalation import EscalationPolicy
+from storage.cache import DecisionCache
+from agent.firewall import Firewall
+
+from fakes import FakeDB, FakeRouter, FakeWriter
+
+
+def _row_from_record(record):
+    """The row find_decision_by_objective_hash returns for a record."""
+
+    decision = record["decision"]
+    return {
+        "decision_id": decision["decision_id"],
+        "final_verdict": decision["final_verdict"],
+        "composite_confidence": decision["composite_confidence"],
+        "threshold_applied": decision["threshold_applied"],
+        "escalation_path": json.dumps(decision["escalation_path"]),
+        "artifact_hash": decision["artifact_hash"],
+        "signature": decision["signature"],
+        "output_hash": decision["output_hash"],
+        "output_text": decision["output_text"],
+        "decision_reason": decision["decision_reason"],
+        "artifact_created_at": decision["artifact_created_at"],
+        "created_at": datetime.now(timezone.utc),
+        "validator_runs": json.dumps(record["validator_runs"]),
+    }
+
+
+def test_persistent_hit_returns_the_memory_payload():
+    async def scenario():
+        writer = FakeWriter()
+        memory = DecisionCache()
+        firewall = Firewall(
+            FakeRouter(), policy=EscalationPolicy(), cache=memory, writer=writer
+        )
+
+        response = await firewall.evaluate("objective")
+        objective_hash = writer.records[0]["decision"]["objective_hash"]
+        cached = await memory.get(objective_hash)
+
+        db = FakeDB(row=_row_from_record(writer.records[0]))
+        await db.connect()
+        persistent = DecisionCache(db=db)
+
+        assert await persistent.get(objective_hash) == cached
+        assert persistent.stats()["persistent_hits"] == 1
+
+        # Served from memory after the first persistent hit
+        assert await persistent.get(objective_hash) == cached
+        assert db.lookups == 1
+
+        restarted = Firewall(
+            FakeRouter(), policy=EscalationPolicy(), cache=persistent
+        )
+        replay = await restarted.evaluate("objective")
+
+        assert replay.cache_hit
+        assert replay.timestamp == response.timestamp
+        assert replay.validator_runs == response.validator_runs
+        assert replay.signature == response.signature
+
+    asyncio.run(scenario())
+
+
+def test_disconnected_db_is_not_queried():
+    async def scenario():
+        db = FakeDB()
+        cache = DecisionCache(db=db)
+
+        assert await cache.get("missing") is None
+        assert db.lookups == 0
+
+    asyncio.run(scenario())
+
+
+def test_failing_db_lookup_is_a_miss():
+    async def scenario():
+        db = FakeDB(error=ConnectionRefusedError("db down"))
+        await db.connect()
+        cache = DecisionCache(db=db)
+
+        router = FakeRouter()
+        firewall = Firewall(
+            router, policy=EscalationPolicy(), cache=cache, writer=FakeWriter()
+        )
+        response = await firewall.evaluate("objective")
+
+        assert not response.cache_hit
+        assert cache.stats()["persistent_errors"] == 1
+        assert router.validate_calls()
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+# agent/tests/test_deadline.py
+
+import asyncio
+
+from config.escalation import EscalationPolicy
+from core.deadline import Deadline
+from core.jobs import JobManager
+from agent.firewall import Firewall
+
+from fakes import FakeRouter, FakeWriter
+
+
+def test_deadline_budget_reaches_every_upstream_call():
+    async def scenario():
+        router = FakeRouter(delays={"delegate": 0.02, "completion": 0.02})
+        firewall = Firewall(router, policy=EscalationPolicy(), writer=FakeWriter())
+
+        response = await firewall.evaluate("objective", deadline=Deadline(5.0))
+
+        assert not response.deadline_exceeded
+        budgets = dict(router.budgets)
+        assert set(budgets) == {"delegate", "completion", "validate"}
+        assert all(0 < budget <= 5.0 for budget in budgets.values())
+        assert budgets["validate"] < budgets["delegate"]
+
+    asyncio.run(scenario())
+
+
+def test_deadline_cuts_validation_short():
+    async def scenario():
+        router = FakeRouter(delays={"validate": 1.0})
+        firewall = Firewall(router, policy=EscalationPolicy(), writer=FakeWriter())
+
+        response = await firewall.evaluate("objective", deadline=Deadline(0.2))
+
+        assert response.deadline_exceeded
+        assert response.final_verdict.value == "MANUAL_REVIEW"
+        assert response.decision_reason == "deadline"
+        assert response.total_latency_ms < 1000
+
+    asyncio.run(scenario())
+
+
+def test_job_runner_receives_the_submitted_deadline():
+    async def scenario():
+        seen = []
+
+        async def runner(objective, priority, deadline):
+            seen.append((objective, priority, deadline))
+            return {}
+
+        jobs = JobManager(runner, workers=1)
+        await jobs.start()
+        deadline = Deadline(5.0)
+
+        job = await jobs.submit("objective", "high", deadline)
+        await job.done.wait()
+        await jobs.close()
+
+        assert seen == [("objective", "high", deadline)]
+
+    asyncio.run(scenario())
+
+
+def test_api_jobs_honours_deadline_ms():
+    import main
+
+    async def scenario():
+        state = main.app.state
+        state.router_client = FakeRouter(delays={"validate": 1.0})
+        state.decision_writer = FakeWriter()
+        state.job_manager = JobManager(main.evaluate_to_dict, workers=1)
+        await state.job_manager.start()
+
+        try:
+            accepted = await main.submit_job(
+                main.EvaluateRequest(objective="objective", deadline_ms=200)
+            )
+            job = state.job_manager.local(accepted["job_id"])
+            await asyncio.wait_for(job.done.wait(), 2.0)
+        finally:
+            await state.job_manager.close()
+            for name in ("router_client", "decision_writer", "job_manager"):
+                delattr(state, name)
+
+        assert job.error is None
+        assert job.result["deadline_exceeded"]
+        assert job.result["decision_reason"] == "deadline"
+
+    asyncio.run(scenario())
@@ -0,0 +1,92 @@
+# agent/tests/test_escalation.py
+
+import asyncio
+
+from config.escalation import EscalationPolicy
+from core.trust_math import TrustAccumulator, TrustMath
+from agent.firewall import Firewall
+
+from fakes import FakeRouter, FakeWriter
+
+
+def _evaluate(router, policy):
+    firewall = Firewall(router, policy=policy, writer=FakeWriter())
+    return asyncio.run(firewall.evaluate("objective"))
+
+
+def test_accumulator_matches_trust_math():
+    results = [
+        {"valid": True, "confidence_score": 0.9},
+        {"valid": False, "confidence_score": 0.6},
+        {"valid": True, "confidence_score": 0.0},
+        {"valid": True, "confidence_score": "bad"},
+    ]
+
+    accumulator = TrustAccumulator()
+    accumulator.extend(results)
+
+    agreement = TrustMath.weighted_validator_agreement(results)
+    average = TrustMath.average_validator_confidence(results)
+
+    assert accumulator.agreement == agreement
+    assert accumulator.average_confidence == average
+    assert accumulator.composite == TrustMath.composite_confidence(
+        agreement, average
+    )
+
+
+def test_final_verdict_can_overturn_interim_bound():
+    # Redundancy 5: threshold 0.85, ladder [3, 5]. Level 3 is unanimous
+    # against; level 5 returns far more validators than its redundancy.
+    router = FakeRouter(
+        redundancy=5,
+        scores={67: (0.9, 3, False), 79: (1.0, 40, True)},
+    )
+
+    interim = TrustAccumulator()
+    interim.extend([{"valid": False, "confidence_score": 0.9}] * 3)
+    assert interim.decided(0.85, [(5, 1.0)]) is False
+
+    response = _evaluate(router, EscalationPolicy(pool_evidence=True))
+
+    assert response.escalation_path == [3, 5]
+    assert response.final_verdict.value == "ACCEPT"
+    assert response.evidence_bundle["early_stop"] is None
+
+
+def test_early_stop_is_opt_in():
+    router = FakeRouter(
+        redundancy=5,
+        scores={67: (0.9, 3, False), 79: (1.0, 40, True)},
+    )
+
+    response = _evaluate(
+        router, EscalationPolicy(pool_evidence=True, early_stop=True)
+    )
+
+    assert response.escalation_path == [3]
+    assert response.final_verdict.value == "MANUAL_REVIEW"
+    assert response.evidence_bundle["early_stop"]["skipped_levels"] == [5]
+    assert router.validate_calls() == [67]
+
+
+def test_early_stop_sizes_pending_levels_by_returned_batches():
+    # Redundancy 3: threshold 0.65, ladder [3, 5]. Level 3 returned 9
+    # validators, so level 5 may too; with only 5 pending the ladder
+    # would have stopped here.
+    router = FakeRouter(
+        redundancy=3,
+        scores={67: (0.9, 9, False), 79: (1.0, 9, True)},
+    )
+
+    interim = TrustAccumulator()
+    interim.extend([{"valid": False, "confidence_score": 0.9}] * 9)
+    assert interim.decided(0.65, [(5, 1.0)]) is False
+    assert interim.decided(0.65, [(9, 1.0)]) is None
+
+    response = _evaluate(
+        router, EscalationPolicy(pool_evidence=True, early_stop=True)
+    )
+
+    assert response.escalation_path == [3, 5]
+    assert response.final_verdict.value == "ACCEPT"
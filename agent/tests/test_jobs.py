@@ -0,0 +1,74 @@
+# agent/tests/test_jobs.py
+
+import asyncio
+
+import pytest
+
+import main
+from core.admission import AdmissionRejected
+from core.deadline import Deadline
+
+
+def test_job_runner_gives_up_on_admission_after_bounded_retries(monkeypatch):
+    calls = []
+
+    async def rejected(objective, priority=None, deadline=None):
+        calls.append(objective)
+        raise AdmissionRejected(503, "Timed out waiting for evaluation capacity", 0)
+
+    monkeypatch.setattr(main, "run_evaluation", rejected)
+
+    with pytest.raises(AdmissionRejected):
+        asyncio.run(main.evaluate_to_dict("objective"))
+
+    assert len(calls) == main.JOB_ADMISSION_RETRIES + 1
+
+
+def test_job_runner_does_not_retry_past_its_deadline(monkeypatch):
+    calls = []
+
+    async def rejected(objective, priority=None, deadline=None):
+        calls.append(objective)
+        raise AdmissionRejected(429, "Too many evaluations queued", 5)
+
+    monkeypatch.setattr(main, "run_evaluation", rejected)
+
+    with pytest.raises(AdmissionRejected):
+        asyncio.run(main.evaluate_to_dict("objective", deadline=Deadline(1.0)))
+
+    assert len(calls) == 1
+
+
+def test_job_events_keepalives_do_not_pile_up_waiters(monkeypatch):
+    monkeypatch.setattr(main, "SSE_KEEPALIVE_SECONDS", 0.01)
+    release = asyncio.Event()
+
+    async def runner(objective, priority=None, deadline=None):
+        await release.wait()
+        return {"objective": objective}
+
+    async def scenario():
+        state = main.app.state
+        state.job_manager = main.JobManager(runner, workers=1)
+        await state.job_manager.start()
+
+        try:
+            job = await state.job_manager.submit("objective")
+            response = await main.job_events(job.job_id)
+            events = response.body_iterator
+
+            assert (await events.__anext__()).startswith("event: status")
+            for _ in range(5):
+                assert await events.__anext__() == ": keepalive\n\n"
+
+            # Only the wait in progress, if any, is registered
+            assert len(job.done._waiters) <= 1
+
+            release.set()
+            assert (await events.__anext__()).startswith("event: result")
+            await events.aclose()
+        finally:
+            await state.job_manager.close()
+            del state.job_manager
+
+    asyncio.run(scenario())
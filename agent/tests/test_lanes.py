@@ -0,0 +1,68 @@
+# agent/tests/test_lanes.py
+
+import asyncio
+
+from config.escalation import EscalationPolicy
+from core.admission import AdmissionController, AdmissionRejected
+from core.lanes import LaneScheduler
+from agent.firewall import Firewall
+
+from fakes import FakeRouter, FakeWriter
+
+
+def test_low_priority_flood_does_not_starve_high_priority():
+    async def scenario():
+        router = FakeRouter(
+            delays={"delegate": 0.01, "completion": 0.01, "validate": 0.5},
+        )
+        firewall = Firewall(
+            router,
+            policy=EscalationPolicy(),
+            writer=FakeWriter(),
+            admission=AdmissionController(max_in_flight=4, queue_timeout=0.3),
+            lanes=LaneScheduler(capacity=4),
+        )
+
+        flood = [
+            asyncio.create_task(firewall.evaluate(f"bulk {i}", priority="low"))
+            for i in range(8)
+        ]
+        await asyncio.sleep(0.1)
+
+        # Low may hold only half the lane capacity, and lows waiting on
+        # it must not hold admission slots the high request needs.
+        urgent = await firewall.evaluate("urgent", priority="high")
+
+        assert urgent.evidence_bundle["scheduling"]["lane"] == "high"
+        assert not all(task.done() for task in flood)
+
+        results = await asyncio.gather(*flood, return_exceptions=True)
+        assert not any(isinstance(r, AdmissionRejected) for r in results)
+
+    asyncio.run(scenario())
+
+
+def test_lane_share_caps_concurrent_slots():
+    async def scenario():
+        lanes = LaneScheduler(capacity=4)
+        entered = []
+        release = asyncio.Event()
+
+        async def hold(name):
+            async with lanes.slot(name):
+                entered.append(name)
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold("low")) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        assert entered == ["low", "low"]
+
+        high = asyncio.create_task(hold("high"))
+        await asyncio.sleep(0.01)
+        assert entered[-1] == "high"
+
+        release.set()
+        await asyncio.gather(*tasks, high)
+        assert lanes.in_flight == 0
+
+    asyncio.run(scenario())
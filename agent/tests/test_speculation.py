@@ -0,0 +1,77 @@
+# agent/tests/test_speculation.py
+
+import asyncio
+import gc
+
+from config.escalation import EscalationPolicy, SPECULATIVE
+from agent.firewall import Firewall
+
+from fakes import FakeRouter, FakeWriter
+
+
+def _evaluate(router, policy):
+    firewall = Firewall(router, policy=policy, writer=FakeWriter())
+    return asyncio.run(firewall.evaluate("objective"))
+
+
+def test_speculative_matches_sequential_verdict():
+    # Redundancy 1: threshold 0.5, ladder [1, 3, 5]; level 1 falls short
+    scores = {78: (0.9, 3, False), 67: (0.9, 3, True)}
+
+    sequential = _evaluate(FakeRouter(scores=scores), EscalationPolicy())
+    speculative = _evaluate(
+        FakeRouter(scores=scores, delays={"validate": 0.05}),
+        EscalationPolicy(mode=SPECULATIVE, speculative_lookahead=2),
+    )
+
+    assert speculative.final_verdict == sequential.final_verdict
+    assert speculative.escalation_path == sequential.escalation_path == [1, 3]
+
+
+def test_speculative_calls_are_cancelled_once_a_level_passes():
+    router = FakeRouter(
+        delays={"validate": 0.05, ("validate", 67): 1.0, ("validate", 79): 1.0}
+    )
+
+    response = _evaluate(
+        router, EscalationPolicy(mode=SPECULATIVE, speculative_lookahead=2)
+    )
+
+    assert response.escalation_path == [1]
+    assert sorted(router.validate_calls()) == [67, 78, 79]
+    assert sorted(router.cancelled) == [("validate", 67), ("validate", 79)]
+
+    speculation = response.evidence_bundle["speculation"]
+    assert speculation["launched"] == 3
+    assert speculation["used"] == 1
+    assert speculation["cancelled"] == 2
+
+
+def test_failed_speculative_call_is_not_left_unretrieved():
+    # Level 3 fails while level 1 is still being scored
+    router = FakeRouter(
+        delays={"validate": 0.05, ("validate", 67): 0.01},
+        failures={67: "validator down"},
+    )
+    unhandled = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+
+        firewall = Firewall(
+            router,
+            policy=EscalationPolicy(mode=SPECULATIVE),
+            writer=FakeWriter(),
+        )
+        response = await firewall.evaluate("objective")
+
+        gc.collect()
+        await asyncio.sleep(0)
+        return response
+
+    response = asyncio.run(scenario())
+
+    assert response.escalation_path == [1]
+    assert response.evidence_bundle["speculation"]["wasted_calls"] == 1
+    assert unhandled == []